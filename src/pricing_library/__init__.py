@@ -6,17 +6,33 @@ using methods like Black-Scholes, Monte Carlo, Binomial Trees, and Least Squares
 """
 
 from .core.pricing_service import PricingService
+from .core.async_service import AsyncPricingService
+from .core.scenario_engine import ScenarioEngine, ScenarioGrid
+from .core.pricing_graph import PricingGraph
+from .core.streaming import TickSimulator, QuotePipeline
+from .core.batch_pricing import price_file
+from .core.calibration import ModelCalibrator
 from .core.exceptions import UnsupportedOptionTypeError
-from .models.implied_volatility import ImpliedVolatility
+from .utils.contract_batch import ContractBatch
+from .core.execution import ProcessPoolBackend
+from .core.cache import ResultCache
+from .core.result_store import SQLiteResultStore
+from .models.implied_volatility import ImpliedVolatility, AmericanImpliedVolatility
 
 from .models import (
     BlackScholesModel,
     VanillaMonteCarlo,
     BinomialModel,
+    AnalyticAmericanModel,
     LeastSquaresMC,
+    ExercisePolicy,
     BlackScholesGapModel,
     BlackScholesBarrierModel,
-    ImpliedVolatility
+    FourierModel,
+    MertonJumpDiffusionModel,
+    ChebyshevSurrogate,
+    ImpliedVolatility,
+    AmericanImpliedVolatility
 )
 
 from .calculators import (
@@ -29,9 +45,13 @@ from .calculators import (
 
 from .utils import (
     GeometricBrownianMotion,
+    HestonProcess,
+    YieldCurve,
+    DividendCurve,
     get_regressor,
     asian_payoff,
-    intrinsic_value
+    intrinsic_value,
+    compile_payoff
 )
 
 __version__ = "1.0.0"
@@ -41,16 +61,34 @@ __email__ = "vincentcourtehoux@gmail.com"
 __all__ = [
     # Core components
     'PricingService',
+    'AsyncPricingService',
+    'ScenarioEngine',
+    'ScenarioGrid',
+    'PricingGraph',
+    'TickSimulator',
+    'QuotePipeline',
+    'price_file',
+    'ModelCalibrator',
     'UnsupportedOptionTypeError',
+    'ContractBatch',
+    'ProcessPoolBackend',
+    'ResultCache',
+    'SQLiteResultStore',
     
     # Models
     'BlackScholesModel',
     'VanillaMonteCarlo', 
     'BinomialModel',
+    'AnalyticAmericanModel',
     'LeastSquaresMC',
+    'ExercisePolicy',
     'BlackScholesGapModel',
     'BlackScholesBarrierModel',
+    'FourierModel',
+    'MertonJumpDiffusionModel',
+    'ChebyshevSurrogate',
     'ImpliedVolatility',
+    'AmericanImpliedVolatility',
     
     # Calculators
     'EuropeanCalculator',
@@ -61,7 +99,11 @@ __all__ = [
     
     # Utilities
     'GeometricBrownianMotion',
+    'HestonProcess',
+    'YieldCurve',
+    'DividendCurve',
     'get_regressor',
     'asian_payoff',
-    'intrinsic_value'
+    'intrinsic_value',
+    'compile_payoff'
 ]
\ No newline at end of file
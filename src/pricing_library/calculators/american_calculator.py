@@ -1,12 +1,14 @@
 from .base_calculator import BaseCalculator
 from ..models.least_squares_mc import LeastSquaresMC
 from ..models.binomial import BinomialModel
+from ..models.american_analytic import AnalyticAmericanModel
 
 class AmericanCalculator(BaseCalculator):
     def __init__(self, models=None):
         self.models = models or {
             'least_squares_mc': LeastSquaresMC(),
-            'binomial_tree': BinomialModel()
+            'binomial_tree': BinomialModel(),
+            'analytic': AnalyticAmericanModel()
         }
 
     def calculate(self, params, method='least_squares_mc'):
@@ -16,8 +18,13 @@ class AmericanCalculator(BaseCalculator):
         model = self.models[method]
         base_params = self._extract_base_params(params)
         extra_params = self._extract_extra_params(params, method)
-        
-        return model.calculate(**base_params, **extra_params)
+        extra_params.update(self._curve_params(base_params, params))
+        extra_params.update(self._engine_params(params))
+
+        if self._is_vectorized(base_params):
+            return self._vectorized_calculate(model, base_params, extra_params)
+        else:
+            return model.calculate(**base_params, **extra_params)
     
     def calculate_greeks(self, params, method='least_squares_mc'):
         if method not in self.models:
@@ -26,8 +33,13 @@ class AmericanCalculator(BaseCalculator):
         model = self.models[method]
         base_params = self._extract_base_params(params)
         extra_params = self._extract_extra_params(params, method)
-        
-        return model.calculate_greeks(**base_params, **extra_params)
+        extra_params.update(self._curve_params(base_params, params))
+        extra_params.update(self._engine_params(params))
+
+        if self._is_vectorized(base_params):
+            return self._vectorized_greeks(model, base_params, extra_params)
+        else:
+            return model.calculate_greeks(**base_params, **extra_params)
     
     def _extract_base_params(self, params):
         return {
@@ -41,9 +53,14 @@ class AmericanCalculator(BaseCalculator):
         }
     
     def _extract_extra_params(self, params, method):
+        option_style = params.get('option_style', 'american')
         extra_params = {
-            'option_style': 'american'
+            'option_style': option_style
         }
+        if option_style == 'bermudan':
+            if params.get('exercise_dates', None) is None:
+                raise ValueError("exercise_dates are required for bermudan options")
+            extra_params['exercise_dates'] = params['exercise_dates']
         
         if method == 'least_squares_mc':
             extra_params.update({
@@ -51,11 +68,21 @@ class AmericanCalculator(BaseCalculator):
                 'n_steps': params.get('monte_carlo_steps', 100),
                 'regression_type': params.get('regression_type', 'polynomial'),
                 'regression_degree': params.get('regression_degree', 2),
-                'seed': params.get('seed', None)
+                'seed': params.get('seed', None),
+                'exercise_policy': params.get('exercise_policy', None),
+                'policy_cache': params.get('policy_cache', None),
+                'return_policy': params.get('return_policy', False),
+                **self._process_params(params)
             })
         elif method == 'binomial_tree':
             extra_params.update({
                 'n_steps': params.get('binomial_steps', 100)
             })
+        elif method == 'analytic':
+            if option_style == 'bermudan':
+                raise ValueError("The analytic method does not support bermudan exercise schedules")
+            extra_params.update({
+                'approximation': params.get('approximation', 'bjerksund_stensland')
+            })
         
         return extra_params
\ No newline at end of file
@@ -16,8 +16,13 @@ class BarrierCalculator(BaseCalculator):
         model = self.models[method]
         base_params = self._extract_base_params(params)
         extra_params = self._extract_extra_params(params, method)
-        
-        return model.calculate(**base_params, **extra_params)
+        extra_params.update(self._curve_params(base_params, params))
+        extra_params.update(self._engine_params(params))
+
+        if self._is_vectorized(base_params):
+            return self._vectorized_calculate(model, base_params, extra_params)
+        else:
+            return model.calculate(**base_params, **extra_params)
     
     def calculate_greeks(self, params, method='black_scholes'):
         if method not in self.models:
@@ -26,8 +31,13 @@ class BarrierCalculator(BaseCalculator):
         model = self.models[method]
         base_params = self._extract_base_params(params)
         extra_params = self._extract_extra_params(params, method)
-        
-        return model.calculate_greeks(**base_params, **extra_params)
+        extra_params.update(self._curve_params(base_params, params))
+        extra_params.update(self._engine_params(params))
+
+        if self._is_vectorized(base_params):
+            return self._vectorized_greeks(model, base_params, extra_params)
+        else:
+            return model.calculate_greeks(**base_params, **extra_params)
     
     def _extract_base_params(self, params):
         return {
@@ -50,7 +60,8 @@ class BarrierCalculator(BaseCalculator):
             extra_params.update({
                 'n_paths': params.get('monte_carlo_paths', 10000),
                 'n_steps': params.get('monte_carlo_steps', 100),
-                'seed': params.get('seed', None)
+                'seed': params.get('seed', None),
+                **self._process_params(params)
             })
         
         return extra_params
\ No newline at end of file
@@ -1,6 +1,13 @@
+import numpy as np
 from abc import ABC, abstractmethod
+from ..utils.broadcasting import broadcast_params
+from ..utils.stochastic_processes import get_process, process_parameters
+from ..utils.curves import YieldCurve
+from ..utils.contract_batch import CURVE_SETTINGS
 
 class BaseCalculator(ABC):
+    executor = None
+    path_cache = None
     
     @abstractmethod
     def calculate(self, params, method):
@@ -8,4 +15,41 @@ class BaseCalculator(ABC):
 
     @abstractmethod
     def calculate_greeks(self, params, method=None):
-        pass
\ No newline at end of file
+        pass
+
+    def _is_vectorized(self, base_params):
+        return any(isinstance(v, np.ndarray) for v in base_params.values())
+
+    def _vectorized_calculate(self, model, base_params, extra_params):
+        arrays = broadcast_params(base_params)
+        result = model.calculate_batch(arrays, **extra_params)
+        return {**result, 'price': np.asarray(result['price']), 'method': model.__class__.__name__}
+
+    def _vectorized_greeks(self, model, base_params, extra_params):
+        arrays = broadcast_params(base_params)
+        greeks = model.calculate_greeks_batch(arrays, **extra_params)
+        return {k: np.asarray(v) for k, v in greeks.items()}
+
+    def _engine_params(self, params):
+        engine_params = {}
+        for key in ('executor', 'path_cache'):
+            value = params.get(key, None)
+            if value is None:
+                value = getattr(self, key)
+            if value is not None:
+                engine_params[key] = value
+        return engine_params
+
+    def _process_params(self, params):
+        process = params.get('process', 'gbm')
+        return {'process': process, **process_parameters(get_process(process), params)}
+
+    def _curve_params(self, base_params, params, t_today=0.0):
+        curves = {}
+        for key, name in CURVE_SETTINGS.items():
+            if isinstance(base_params[key], YieldCurve):
+                curves[name] = base_params[key]
+                base_params[key] = curves[name].zero_rate(np.asarray(base_params['T']) - t_today)
+            elif isinstance(params.get(name, None), YieldCurve):
+                curves[name] = params[name]
+        return curves
@@ -1,184 +1,196 @@
 import numpy as np
+from scipy import sparse
 from ..models.black_scholes import BlackScholesModel
 from ..models.monte_carlo import VanillaMonteCarlo
 from ..models.binomial import BinomialModel
+from ..models.fourier import FourierModel
+from ..models.merton import MertonJumpDiffusionModel
+from ..utils.contract_batch import FLOAT_COLUMNS, TEXT_COLUMNS, CURVE_SETTINGS
+from ..utils.curves import YieldCurve
 from .base_calculator import BaseCalculator
+from .european_calculator import EuropeanCalculator
+from .american_calculator import AmericanCalculator
+from .asian_calculator import AsianCalculator
+from .barrier_calculator import BarrierCalculator
+from .gap_calculator import GapCalculator
+
+MARKET_FIELDS = ('S', 'T', 'r', 'sigma', 'q')
+LEG_FIELDS = ('quantity', 'option_style', 'method')
+
+STRATEGY_TEMPLATES = {
+    'straddle': lambda p: [
+        {'quantity': 1, 'K': p['K'], 'option_type': 'call'},
+        {'quantity': 1, 'K': p['K'], 'option_type': 'put'}
+    ],
+    'strangle': lambda p: [
+        {'quantity': 1, 'K': p['K_call'], 'option_type': 'call'},
+        {'quantity': 1, 'K': p['K_put'], 'option_type': 'put'}
+    ],
+    'bull_spread': lambda p: [
+        {'quantity': 1, 'K': p['K1'], 'option_type': 'call'},
+        {'quantity': -1, 'K': p['K2'], 'option_type': 'call'}
+    ],
+    'bear_spread': lambda p: [
+        {'quantity': 1, 'K': p['K2'], 'option_type': 'put'},
+        {'quantity': -1, 'K': p['K1'], 'option_type': 'put'}
+    ]
+}
 
 class OptionCombinationCalculator(BaseCalculator):
-    def __init__(self, models=None):
+    def __init__(self, models=None, calculators=None):
         self.models = models or {
             'black_scholes': BlackScholesModel(),
             'monte_carlo': VanillaMonteCarlo(),
-            'binomial_tree': BinomialModel()
+            'binomial_tree': BinomialModel(),
+            'fourier': FourierModel(),
+            'merton': MertonJumpDiffusionModel()
+        }
+        self.calculators = calculators or {
+            'european': EuropeanCalculator(self.models),
+            'american': AmericanCalculator(),
+            'bermudan': AmericanCalculator(),
+            'asian': AsianCalculator(),
+            'barrier': BarrierCalculator(),
+            'gap': GapCalculator()
         }
 
-        self._combination_methods = ['straddle', 'strangle', 'bull_spread', 'bear_spread']
+        self._combination_methods = list(STRATEGY_TEMPLATES)
 
     def calculate(self, params, method='black_scholes'):
-        if method not in self.models:
-            raise ValueError(f'Unsupported method: {method}')
-
-        combination_type = params.get('combination')
-        if combination_type not in self._combination_methods:
-            raise ValueError(
-                f"Unsupported combination type: {combination_type}. Supported: {self._combination_methods}"
-            )
-
-        model = self.models[method]
-        base_params = self._extract_base_params(params, combination_type)
-        extra_params = self._extract_extra_params(params, method)
-
-        if combination_type in ['straddle', 'strangle']:
-            call_params = base_params.copy()
-            call_params['option_type'] = np.full_like(base_params['S'], 'call', dtype=object)
-            if combination_type == 'strangle':
-                call_params['K'] = base_params['K_call']
-
-            put_params = base_params.copy()
-            put_params['option_type'] = np.full_like(base_params['S'], 'put', dtype=object)
-            if combination_type == 'strangle':
-                put_params['K'] = base_params['K_put']
-
-            call_price = model.calculate(**call_params, **extra_params)['price']
-            put_price = model.calculate(**put_params, **extra_params)['price']
-            total_price = call_price + put_price
-
-            legs = [
-                {'type': 'call', 'price': call_price, 'K': call_params.get('K', base_params.get('K'))},
-                {'type': 'put', 'price': put_price, 'K': put_params.get('K', base_params.get('K'))}
-            ]
-
-        elif combination_type in ['bull_spread', 'bear_spread']:
-            n = len(base_params['S'])
-            long_params = base_params.copy()
-            short_params = base_params.copy()
-
-            if combination_type == 'bull_spread':
-                long_params['option_type'] = np.full(n, 'call', dtype=object)
-                short_params['option_type'] = np.full(n, 'call', dtype=object)
-                long_params['K'] = base_params['K1']
-                short_params['K'] = base_params['K2']
-            else:  
-                long_params['option_type'] = np.full(n, 'put', dtype=object)
-                short_params['option_type'] = np.full(n, 'put', dtype=object)
-                long_params['K'] = base_params['K2']
-                short_params['K'] = base_params['K1']
-
-            long_price = model.calculate(**long_params, **extra_params)['price']
-            short_price = model.calculate(**short_params, **extra_params)['price']
-            total_price = long_price - short_price
-
-            legs = [
-                {'type': long_params['option_type'][0], 'price': long_price, 'K': long_params['K']},
-                {'type': short_params['option_type'][0], 'price': short_price, 'K': short_params['K']}
-            ]
+        legs, weights, leg_index, leg_specs, shape = self._build_legs(params, method)
+        leg_results = self._price_legs(legs, params, greeks=False)
+        total_price = self._aggregate(weights, leg_results['price']).reshape(shape)
 
+        leg_prices = leg_results['price'][leg_index].reshape(len(leg_specs), *shape)
         return {
             'price': total_price,
-            'legs': legs,
+            'legs': [
+                {'type': spec['option_type'], 'quantity': spec['quantity'], 'price': leg_prices[j], 'K': spec.get('K')}
+                for j, spec in enumerate(leg_specs)
+            ],
             'method': method,
-            'option_style': combination_type
+            'option_style': params.get('combination', 'custom')
         }
 
     def calculate_greeks(self, params, method='black_scholes'):
-        if method not in self.models:
-            raise ValueError(f'Unsupported method: {method}')
+        legs, weights, _, _, shape = self._build_legs(params, method)
+        leg_results = self._price_legs(legs, params, greeks=True)
+        combined_greeks = {k: self._aggregate(weights, v).reshape(shape) for k, v in leg_results.items()}
+
+        return {
+            'option_style': params.get('combination', 'custom'),
+            'method': method,
+            'price': combined_greeks['price'],
+            'greeks': combined_greeks
+        }
+
+    def _strategy_legs(self, params):
+        if params.get('legs', None) is not None:
+            return list(params['legs'])
 
         combination_type = params.get('combination')
-        if combination_type not in self._combination_methods:
+        if combination_type not in STRATEGY_TEMPLATES:
             raise ValueError(
                 f"Unsupported combination type: {combination_type}. Supported: {self._combination_methods}"
             )
-
-        model = self.models[method]
-        base_params = self._extract_base_params(params, combination_type)
-        extra_params = self._extract_extra_params(params, method)
-
-        def compute_combined(long_params, short_params=None, subtract=False):
-            long_greeks = model.calculate_greeks(**long_params, **extra_params)
-            if short_params is not None:
-                short_greeks = model.calculate_greeks(**short_params, **extra_params)
-                combined_greeks = {k: long_greeks[k] - short_greeks[k] if subtract else long_greeks[k] + short_greeks[k]
-                                for k in long_greeks}
-                combined_price = long_greeks['price'] - short_greeks['price'] if subtract else long_greeks['price'] + short_greeks['price']
-            else:
-                combined_greeks = long_greeks
-                combined_price = long_greeks['price']
-            return combined_price, combined_greeks
-
-        if combination_type in ['straddle', 'strangle']:
-            call_params = base_params.copy()
-            call_params['option_type'] = np.full_like(base_params['S'], 'call', dtype=object)
-            if combination_type == 'strangle':
-                call_params['K'] = base_params['K_call']
-
-            put_params = base_params.copy()
-            put_params['option_type'] = np.full_like(base_params['S'], 'put', dtype=object)
-            if combination_type == 'strangle':
-                put_params['K'] = base_params['K_put']
-
-            total_price, combined_greeks = compute_combined(call_params, put_params)
-
-        elif combination_type in ['bull_spread', 'bear_spread']:
-            n = len(base_params['S'])
-            long_params = base_params.copy()
-            short_params = base_params.copy()
-
-            if combination_type == 'bull_spread':
-                long_params['option_type'] = np.full(n, 'call', dtype=object)
-                short_params['option_type'] = np.full(n, 'call', dtype=object)
-                long_params['K'] = base_params['K1']
-                short_params['K'] = base_params['K2']
+        return STRATEGY_TEMPLATES[combination_type](params)
+
+    def _build_legs(self, params, method):
+        leg_specs = self._strategy_legs(params)
+        market = self._market_inputs(params)
+        shape = np.broadcast_shapes(
+            *[v.shape for v in market.values()],
+            *[np.shape(v) for spec in leg_specs for k, v in spec.items() if k not in LEG_FIELDS]
+        ) or (1,)
+        n = int(np.prod(shape))
+
+        flat = lambda v, dtype=None: np.broadcast_to(np.asarray(v, dtype=dtype), shape).ravel()
+        rows = []
+        for spec in leg_specs:
+            row = {k: flat(v) for k, v in market.items()}
+            row.update({k: flat(v) for k, v in spec.items() if k not in LEG_FIELDS})
+            row['option_style'] = spec.get('option_style', 'european')
+            row['method'] = spec.get('method', method if row['option_style'] == 'european' else None)
+            row['quantity'] = flat(spec.get('quantity', 1), np.float64)
+            rows.append(row)
+
+        groups = {}
+        leg_index = np.empty(len(rows) * n, dtype=np.int64)
+        offset = 0
+        for j, row in enumerate(rows):
+            key = (row['option_style'], row['method'], tuple(sorted(k for k in row if k in FLOAT_COLUMNS + TEXT_COLUMNS)))
+            groups.setdefault(key, []).append(j)
+
+        legs = []
+        for (option_style, leg_method, columns), members in groups.items():
+            stacked = {k: np.concatenate([rows[j][k] for j in members]) for k in columns}
+            codes = [
+                np.unique(stacked[k], return_inverse=True)[1].ravel().astype(np.float64) if k in TEXT_COLUMNS else stacked[k].astype(np.float64)
+                for k in columns
+            ]
+            _, first, inverse = np.unique(np.column_stack(codes), axis=0, return_index=True, return_inverse=True)
+            inverse = inverse.ravel()
+            legs.append({
+                'option_style': option_style,
+                'method': leg_method,
+                'columns': {k: v[first] for k, v in stacked.items()}
+            })
+            for position, j in enumerate(members):
+                leg_index[j * n:(j + 1) * n] = offset + inverse[position * n:(position + 1) * n]
+            offset += len(first)
+
+        strategy_index = np.tile(np.arange(n), len(rows))
+        quantities = np.concatenate([row['quantity'] for row in rows])
+        weights = sparse.csr_matrix((quantities, (strategy_index, leg_index)), shape=(n, offset))
+        return legs, weights, leg_index, leg_specs, shape
+
+    def _market_inputs(self, params):
+        missing = [k for k in MARKET_FIELDS if k != 'q' and params.get(k, None) is None]
+        if missing:
+            raise ValueError(f'Missing market inputs for combination: {missing}')
+
+        market = {k: params.get(k, 0.0) for k in MARKET_FIELDS}
+        for key in CURVE_SETTINGS:
+            if isinstance(market[key], YieldCurve):
+                market[key] = market[key].zero_rate(np.asarray(market['T'], dtype=np.float64))
+        market = {k: np.asarray(v, dtype=np.float64) for k, v in market.items()}
+        for k, v in market.items():
+            if np.any(np.isnan(v)):
+                raise ValueError(f'{k} contains NaN values')
+        if np.any(market['S'] <= 0):
+            raise ValueError('S must be strictly positive')
+        if np.any(market['sigma'] <= 0):
+            raise ValueError('sigma must be strictly positive')
+        if np.any(market['T'] < 0):
+            raise ValueError('T must be non-negative')
+        return market
+
+    def _price_legs(self, legs, params, greeks=False):
+        settings = {k: params[k] for k in params.keys()
+                    if k not in FLOAT_COLUMNS + TEXT_COLUMNS + ('option_style', 'combination', 'legs')}
+        settings.update({name: params[key] for key, name in CURVE_SETTINGS.items()
+                         if isinstance(params.get(key, None), YieldCurve)})
+        results = {}
+        for i, leg in enumerate(legs):
+            calculator = self.calculators.get(leg['option_style'])
+            if calculator is None:
+                raise ValueError(f"Unsupported leg option style: {leg['option_style']}")
+            leg_params = {**settings, **self._engine_params(params), **leg['columns'], 'option_style': leg['option_style']}
+            if greeks:
+                result = calculator.calculate_greeks(leg_params, leg['method']) if leg['method'] else calculator.calculate_greeks(leg_params)
+                values = result.get('greeks', result)
             else:
-                long_params['option_type'] = np.full(n, 'put', dtype=object)
-                short_params['option_type'] = np.full(n, 'put', dtype=object)
-                long_params['K'] = base_params['K2']
-                short_params['K'] = base_params['K1']
+                result = calculator.calculate(leg_params, leg['method']) if leg['method'] else calculator.calculate(leg_params)
+                values = {'price': result['price']}
 
-            total_price, combined_greeks = compute_combined(long_params, short_params, subtract=True)
-
-        return {
-            'option_style': combination_type,
-            'method': method,
-            'price': total_price,
-            'greeks': combined_greeks
-        }
+            n_legs = len(leg['columns']['S'])
+            for k, v in values.items():
+                v = np.asarray(v)
+                if v.dtype.kind in 'biuf':
+                    results.setdefault(k, []).append(np.broadcast_to(v.astype(np.float64).ravel(), (n_legs,)))
 
+        keys = [k for k, v in results.items() if len(v) == len(legs)]
+        return {k: np.concatenate(results[k]) for k in keys}
 
-    def _extract_base_params(self, params, combination_type=None):
-        base = {
-            'S': np.atleast_1d(params['S']),
-            'T': np.atleast_1d(params['T']),
-            'r': np.atleast_1d(params['r']),
-            'sigma': np.atleast_1d(params['sigma']),
-            'q': np.atleast_1d(params.get('q', 0))
-        }
-
-        if combination_type == 'straddle':
-            base['K'] = np.atleast_1d(params['K'])
-        elif combination_type == 'strangle':
-            base['K_call'] = np.atleast_1d(params['K_call'])
-            base['K_put'] = np.atleast_1d(params['K_put'])
-        elif combination_type in ['bull_spread', 'bear_spread']:
-            base['K1'] = np.atleast_1d(params['K1'])
-            base['K2'] = np.atleast_1d(params['K2'])
-        else:
-            base['K'] = np.atleast_1d(params.get('K'))
-
-        return base
-
-    def _extract_extra_params(self, params, method):
-        extra_params = {}
-        if method == 'monte_carlo':
-            extra_params.update({
-                'n_paths': params.get('monte_carlo_paths', 10000),
-                'n_steps': params.get('monte_carlo_steps', 100),
-                'option_style': 'european',
-                'seed': params.get('seed', None)
-            })
-        elif method == 'binomial_tree':
-            extra_params.update({
-                'n_steps': params.get('binomial_steps', 100),
-                'option_style': 'european'
-            })
-        return extra_params
+    def _aggregate(self, weights, leg_values):
+        return weights @ leg_values
@@ -1,7 +1,9 @@
-import numpy as np
 from ..models.black_scholes import BlackScholesModel
 from ..models.monte_carlo import VanillaMonteCarlo
 from ..models.binomial import BinomialModel
+from ..models.fourier import FourierModel
+from ..models.merton import MertonJumpDiffusionModel
+from ..utils.stochastic_processes import MertonJumpDiffusion, process_parameters
 from .base_calculator import BaseCalculator
 
 class EuropeanCalculator(BaseCalculator):
@@ -9,7 +11,9 @@ class EuropeanCalculator(BaseCalculator):
         self.models = models or {
             'black_scholes': BlackScholesModel(),
             'monte_carlo': VanillaMonteCarlo(),
-            'binomial_tree': BinomialModel()
+            'binomial_tree': BinomialModel(),
+            'fourier': FourierModel(),
+            'merton': MertonJumpDiffusionModel()
         }
 
     def calculate(self, params, method='black_scholes'):
@@ -19,8 +23,10 @@ class EuropeanCalculator(BaseCalculator):
         model = self.models[method]
         base_params = self._extract_base_params(params)
         extra_params = self._extract_extra_params(params, method)
+        extra_params.update(self._curve_params(base_params, params))
+        extra_params.update(self._engine_params(params))
 
-        if any(isinstance(v, np.ndarray) for v in base_params.values()):
+        if self._is_vectorized(base_params):
             return self._vectorized_calculate(model, base_params, extra_params)
         else:
             return model.calculate(**base_params, **extra_params)
@@ -32,32 +38,14 @@ class EuropeanCalculator(BaseCalculator):
         model = self.models[method]
         base_params = self._extract_base_params(params)
         extra_params = self._extract_extra_params(params, method)
+        extra_params.update(self._curve_params(base_params, params))
+        extra_params.update(self._engine_params(params))
 
-        if any(isinstance(v, np.ndarray) for v in base_params.values()):
+        if self._is_vectorized(base_params):
             return self._vectorized_greeks(model, base_params, extra_params)
         else:
             return model.calculate_greeks(**base_params, **extra_params)
 
-    def _vectorized_calculate(self, model, base_params, extra_params):
-        arrays = {k: np.atleast_1d(v) for k, v in base_params.items()}
-        n = max(len(v) for v in arrays.values())
-        for k, v in arrays.items():
-            if len(v) == 1:
-                arrays[k] = np.full(n, v[0])
-        
-        prices = model.calculate(**arrays, **extra_params)['price']
-        return {'price': np.array(prices), 'method': model.__class__.__name__}
-
-    def _vectorized_greeks(self, model, base_params, extra_params):
-        arrays = {k: np.atleast_1d(v) for k, v in base_params.items()}
-        n = max(len(v) for v in arrays.values())
-        for k, v in arrays.items():
-            if len(v) == 1:
-                arrays[k] = np.full(n, v[0])
-
-        greeks = model.calculate_greeks(**arrays, **extra_params)
-        return {k: np.array(v) for k, v in greeks.items()}
-
     def _extract_base_params(self, params):
         return {
             'S': params['S'], 
@@ -76,11 +64,24 @@ class EuropeanCalculator(BaseCalculator):
                 'n_paths': params.get('monte_carlo_paths', 10000),
                 'n_steps': params.get('monte_carlo_steps', 100),
                 'option_style': 'european',
-                'seed': params.get('seed', None)
+                'seed': params.get('seed', None),
+                **self._process_params(params)
             })
         elif method == 'binomial_tree':
             extra_params.update({
                 'n_steps': params.get('binomial_steps', 100),
                 'option_style': 'european'
             })
+        elif method == 'fourier':
+            extra_params.update({
+                'fourier_method': params.get('fourier_method', 'cos'),
+                'option_style': 'european',
+                **self._process_params(params)
+            })
+        elif method == 'merton':
+            extra_params.update({
+                'tolerance': params.get('merton_tolerance', 1e-10),
+                'option_style': 'european',
+                **process_parameters(MertonJumpDiffusion, params)
+            })
         return extra_params
@@ -1,4 +1,3 @@
-import numpy as np
 from ..models.black_scholes_gap import BlackScholesGapModel
 from ..models.monte_carlo import VanillaMonteCarlo
 from .base_calculator import BaseCalculator
@@ -17,8 +16,10 @@ class GapCalculator(BaseCalculator):
         model = self.models[method]
         base_params = self._extract_base_params(params)
         extra_params = self._extract_extra_params(params, method)
+        extra_params.update(self._curve_params(base_params, params))
+        extra_params.update(self._engine_params(params))
 
-        if any(isinstance(v, np.ndarray) for v in base_params.values()):
+        if self._is_vectorized(base_params):
             return self._vectorized_calculate(model, base_params, extra_params)
         else:
             return model.calculate(**base_params, **extra_params)
@@ -30,32 +31,14 @@ class GapCalculator(BaseCalculator):
         model = self.models[method]
         base_params = self._extract_base_params(params)
         extra_params = self._extract_extra_params(params, method)
+        extra_params.update(self._curve_params(base_params, params))
+        extra_params.update(self._engine_params(params))
 
-        if any(isinstance(v, np.ndarray) for v in base_params.values()):
+        if self._is_vectorized(base_params):
             return self._vectorized_greeks(model, base_params, extra_params)
         else:
             return model.calculate_greeks(**base_params, **extra_params)
 
-    def _vectorized_calculate(self, model, base_params, extra_params):
-        arrays = {k: np.atleast_1d(v) for k, v in base_params.items()}
-        n = max(len(v) for v in arrays.values())
-        for k, v in arrays.items():
-            if len(v) == 1:
-                arrays[k] = np.full(n, v[0])
-
-        prices = model.calculate(**arrays, **extra_params)['price']
-        return {'price': np.array(prices), 'method': model.__class__.__name__}
-
-    def _vectorized_greeks(self, model, base_params, extra_params):
-        arrays = {k: np.atleast_1d(v) for k, v in base_params.items()}
-        n = max(len(v) for v in arrays.values())
-        for k, v in arrays.items():
-            if len(v) == 1:
-                arrays[k] = np.full(n, v[0])
-
-        greeks = model.calculate_greeks(**arrays, **extra_params)
-        return {k: np.array(v) for k, v in greeks.items()}
-
     def _extract_base_params(self, params):
         return {
             'S': params['S'], 
@@ -78,7 +61,8 @@ class GapCalculator(BaseCalculator):
             extra_params.update({
                 'n_paths': params.get('monte_carlo_paths', 10000),
                 'n_steps': params.get('monte_carlo_steps', 100),
-                'seed': params.get('seed', None)
+                'seed': params.get('seed', None),
+                **self._process_params(params)
             })
 
         return extra_params
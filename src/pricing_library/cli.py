@@ -0,0 +1,41 @@
+import argparse
+import sys
+from .core.batch_pricing import price_file
+
+def _setting(text):
+    key, sep, value = text.partition('=')
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"Expected key=value, got {text!r}")
+    for cast in (int, float):
+        try:
+            return key, cast(value)
+        except ValueError:
+            pass
+    return key, value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pricing-batch', description='Price a CSV or .npy book in chunks.')
+    parser.add_argument('source', help='CSV file, structured .npy file or directory of <column>.npy files')
+    parser.add_argument('output', help='CSV file the results are appended to')
+    parser.add_argument('--method', help='default pricing method for rows without a method column')
+    parser.add_argument('--chunk-size', type=int, default=100000)
+    parser.add_argument('--greeks', action='store_true', help='also write delta, gamma, vega, theta and rho')
+    parser.add_argument('--set', dest='settings', type=_setting, action='append', default=[], metavar='KEY=VALUE',
+                        help='model setting passed to every group, e.g. --set n_steps=200')
+    parser.add_argument('--checkpoint', help='checkpoint file (default: <output>.checkpoint)')
+    parser.add_argument('--resume', action='store_true', help='continue from the last checkpoint')
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    def progress(status):
+        print(f"{status['rows']} rows, {status['rows_per_second']:.0f} rows/s", file=sys.stderr)
+
+    report = price_file(args.source, args.output, method=args.method, chunk_size=args.chunk_size,
+                        greeks=args.greeks, settings=dict(args.settings), checkpoint=args.checkpoint,
+                        resume=args.resume, progress=None if args.quiet else progress)
+    print(f"Priced {report['processed']} rows ({report['rows']} total, {report['errors']} errors) "
+          f"in {report['elapsed']:.2f}s: {report['rows_per_second']:.0f} rows/s")
+    return 1 if report['errors'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,35 @@
 from .entities import OptionType, ExerciseStyle
 from .exceptions import UnsupportedOptionTypeError, PricingError
+from ..utils.contract_batch import ContractBatch
+from .execution import ProcessPoolBackend
+from .cache import ResultCache
+from .result_store import SQLiteResultStore
 from .pricing_service import PricingService
+from .async_service import AsyncPricingService
+from .scenario_engine import ScenarioEngine, ScenarioGrid
+from .pricing_graph import PricingGraph
+from .streaming import TickSimulator, QuotePipeline
+from .batch_pricing import price_file, price_columns, read_chunks
+from .calibration import ModelCalibrator
 
 __all__ = [
     'OptionType', 
     'ExerciseStyle', 
     'UnsupportedOptionTypeError', 
     'PricingError',
-    'PricingService'
+    'ContractBatch',
+    'ProcessPoolBackend',
+    'ResultCache',
+    'SQLiteResultStore',
+    'PricingService',
+    'AsyncPricingService',
+    'ScenarioEngine',
+    'ScenarioGrid',
+    'PricingGraph',
+    'TickSimulator',
+    'QuotePipeline',
+    'price_file',
+    'price_columns',
+    'read_chunks',
+    'ModelCalibrator'
 ]
\ No newline at end of file
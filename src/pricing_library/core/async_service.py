@@ -0,0 +1,128 @@
+import asyncio
+import numpy as np
+from ..utils.contract_batch import ContractBatch
+from .pricing_service import PricingService
+
+def _split_result(result, n):
+    rows = [{} for _ in range(n)]
+    for key, value in result.items():
+        if isinstance(value, np.ndarray) and value.shape[:1] == (n,):
+            for i in range(n):
+                rows[i][key] = value[i] if value.dtype == object else value[i].item()
+        else:
+            for row in rows:
+                row[key] = value
+    return rows
+
+class AsyncPricingService:
+    def __init__(self, service=None, executor=None, batch_window=0.001, max_batch_size=512,
+                 max_pending=10000, timeout=None):
+        self.service = service or PricingService()
+        self.executor = executor
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.stats = {'requests': 0, 'batches': 0, 'timeouts': 0, 'rejected': 0}
+
+        self._pending = {}
+        self._timers = {}
+        self._tasks = set()
+        self._slots = None
+
+    async def price_option(self, params, method=None, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.stats['rejected'] += 1
+            raise
+
+        try:
+            future = loop.create_future()
+            self._submit(params, method, future)
+            self.stats['requests'] += 1
+            try:
+                remaining = None if deadline is None else max(deadline - loop.time(), 0.0)
+                return await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                self.stats['timeouts'] += 1
+                raise
+        finally:
+            self._slots.release()
+
+    async def price_options(self, requests, method=None, timeout=None):
+        return await asyncio.gather(*[self.price_option(params, method, timeout) for params in requests])
+
+    async def flush(self):
+        for key in list(self._pending):
+            self._dispatch(key)
+        await asyncio.gather(*list(self._tasks))
+
+    def _submit(self, params, method, future):
+        key = self.service.trade_key(params, method)
+        bucket = self._pending.setdefault(key, [])
+        bucket.append((params, future))
+
+        if len(bucket) >= self.max_batch_size:
+            self._dispatch(key)
+        elif key not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[key] = loop.call_later(self.batch_window, self._dispatch, key)
+
+    def _dispatch(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        bucket = self._pending.pop(key, [])
+        if bucket:
+            task = asyncio.ensure_future(self._run_batch(key, bucket))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, key, bucket):
+        bucket = [(params, future) for params, future in bucket if not future.done()]
+        if not bucket:
+            return
+
+        option_style, method, _ = key
+        records = [{k: v for k, v in params.items() if k != 'method'} for params, _ in bucket]
+        loop = asyncio.get_running_loop()
+        self.stats['batches'] += 1
+
+        try:
+            results = await loop.run_in_executor(self.executor, self._price_records, records, option_style, method)
+        except Exception as exc:
+            for _, future in bucket:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(bucket, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _price_records(self, records, option_style, method):
+        try:
+            batch = ContractBatch.from_records(records, option_style)
+            result = self.service.price_option(batch, method)
+            return _split_result(result, len(records))
+        except Exception:
+            if len(records) == 1:
+                raise
+        results = []
+        for record in records:
+            try:
+                results.extend(self._price_records([record], option_style, method))
+            except Exception as exc:
+                results.append(exc)
+        return results
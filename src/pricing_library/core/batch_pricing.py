@@ -0,0 +1,175 @@
+import csv
+import itertools
+import json
+import os
+import time
+import numpy as np
+from ..utils.contract_batch import ContractBatch, FLOAT_COLUMNS, TEXT_COLUMNS
+from .pricing_service import PricingService
+
+GREEKS = ('delta', 'gamma', 'vega', 'theta', 'rho')
+DEFAULTS = {'q': 0.0, 't_today': 0.0}
+ROUTING_COLUMNS = ('option_style', 'method')
+
+def read_chunks(source, chunk_size=100000, skip=0):
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if isinstance(source, dict):
+        yield from _array_chunks(source, chunk_size, skip)
+    elif os.path.isdir(source):
+        names = sorted(f for f in os.listdir(source) if f.endswith('.npy'))
+        if not names:
+            raise ValueError(f"No .npy column files found in {source}")
+        columns = {name[:-4]: np.load(os.path.join(source, name), mmap_mode='r') for name in names}
+        yield from _array_chunks(columns, chunk_size, skip)
+    elif str(source).endswith('.npy'):
+        records = np.load(source, mmap_mode='r')
+        if records.dtype.names is None:
+            raise ValueError("A single .npy source must hold a structured array with one field per column")
+        yield from _array_chunks({name: records[name] for name in records.dtype.names}, chunk_size, skip)
+    else:
+        yield from _csv_chunks(source, chunk_size, skip)
+
+def price_file(source, output, service=None, method=None, chunk_size=100000, greeks=False, settings=None,
+               checkpoint=None, resume=False, progress=None):
+    service = service or PricingService()
+    checkpoint = checkpoint or f'{output}.checkpoint'
+    source_name = 'columns' if isinstance(source, dict) else os.path.abspath(source)
+    state = {'source': source_name, 'output': os.path.abspath(output), 'rows': 0, 'bytes': 0, 'complete': False}
+
+    if resume and os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            saved = json.load(f)
+        if (saved['source'], saved['output']) != (state['source'], state['output']):
+            raise ValueError(f"Checkpoint {checkpoint} belongs to a different source or output")
+        state = saved
+        with open(output, 'r+b') as f:
+            f.truncate(state['bytes'])
+    resumed_from = state['rows']
+
+    start = time.perf_counter()
+    n_chunks = n_errors = 0
+    if not state['complete']:
+        with open(output, 'a' if resumed_from else 'w', newline='') as f:
+            writer = None
+            for chunk in read_chunks(source, chunk_size, resumed_from):
+                n = len(next(iter(chunk.values())))
+                result = price_columns(chunk, service, method, greeks, settings)
+                passthrough = [k for k in chunk if k not in FLOAT_COLUMNS + TEXT_COLUMNS + ROUTING_COLUMNS]
+                fields = passthrough + ['row'] + list(result)
+                if writer is None:
+                    writer = csv.writer(f)
+                    if not resumed_from:
+                        writer.writerow(fields)
+
+                values = [chunk[k] for k in passthrough] + [np.arange(state['rows'], state['rows'] + n)]
+                values += [result[k] for k in result]
+                writer.writerows(zip(*(v.tolist() for v in values)))
+                f.flush()
+
+                n_chunks += 1
+                n_errors += int(np.count_nonzero(result['error']))
+                state['rows'] += n
+                state['bytes'] = os.path.getsize(output)
+                _save_checkpoint(checkpoint, state)
+                if progress is not None:
+                    elapsed = time.perf_counter() - start
+                    progress({'rows': state['rows'], 'chunks': n_chunks,
+                              'rows_per_second': (state['rows'] - resumed_from) / max(elapsed, 1e-12)})
+
+        state['complete'] = True
+        _save_checkpoint(checkpoint, state)
+
+    elapsed = time.perf_counter() - start
+    processed = state['rows'] - resumed_from if n_chunks else 0
+    return {
+        'rows': state['rows'],
+        'processed': processed,
+        'resumed_from': resumed_from,
+        'chunks': n_chunks,
+        'errors': n_errors,
+        'elapsed': elapsed,
+        'rows_per_second': processed / max(elapsed, 1e-12)
+    }
+
+def price_columns(columns, service=None, method=None, greeks=False, settings=None):
+    service = service or PricingService()
+    n = len(next(iter(columns.values())))
+    styles = _text(columns.get('option_style'), n, 'european')
+    methods = _text(columns.get('method'), n, '')
+
+    fields = ('price',) + (GREEKS if greeks else ())
+    result = {field: np.full(n, np.nan) for field in fields}
+    result['error'] = np.full(n, '', dtype=object)
+
+    keys, inverse = np.unique(np.char.add(np.char.add(styles, '|'), methods), return_inverse=True)
+    for code, key in enumerate(keys.tolist()):
+        option_style, group_method = key.split('|', 1)
+        rows = np.flatnonzero(inverse.ravel() == code)
+        group = {}
+        for name, values in columns.items():
+            if name in FLOAT_COLUMNS:
+                values = np.asarray(values[rows], dtype=np.float64)
+                if np.all(np.isnan(values)):
+                    continue
+                if name in DEFAULTS:
+                    values = np.where(np.isnan(values), DEFAULTS[name], values)
+                group[name] = values
+            elif name in TEXT_COLUMNS:
+                values = np.asarray(values[rows]).astype(str)
+                if np.any(values != ''):
+                    group[name] = values
+        _price_group(service, group, option_style, group_method or method, greeks, settings, rows, result)
+    return result
+
+def _price_group(service, columns, option_style, method, greeks, settings, rows, result):
+    try:
+        batch = ContractBatch(columns, option_style, settings)
+        values = service.calculate_greeks(batch, method) if greeks else service.price_option(batch, method)
+        values = {'price': values['price'], **values.get('greeks', values)}
+        for field in result:
+            if field != 'error' and field in values:
+                result[field][rows] = np.asarray(values[field], dtype=np.float64).ravel()
+    except Exception as exc:
+        if len(rows) == 1 or not isinstance(exc, ValueError):
+            result['error'][rows] = str(exc) or type(exc).__name__
+            return
+        half = len(rows) // 2
+        for part in (slice(None, half), slice(half, None)):
+            _price_group(service, {k: v[part] for k, v in columns.items()}, option_style, method, greeks, settings,
+                         rows[part], result)
+
+def _text(values, n, default):
+    if values is None:
+        return np.full(n, default)
+    values = np.asarray(values).astype(str)
+    return np.where(values == '', default, values)
+
+def _array_chunks(columns, chunk_size, skip):
+    n = len(next(iter(columns.values())))
+    for start in range(skip, n, chunk_size):
+        yield {k: np.asarray(v[start:start + chunk_size]) for k, v in columns.items()}
+
+def _csv_chunks(path, chunk_size, skip):
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = itertools.islice(reader, skip, None)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                return
+            chunk = np.array(chunk, dtype=str)
+            columns = {}
+            for i, name in enumerate(header):
+                values = chunk[:, i]
+                if name in FLOAT_COLUMNS:
+                    values = np.where(values == '', 'nan', values).astype(np.float64)
+                columns[name] = values
+            yield columns
+
+def _save_checkpoint(path, state):
+    temporary = f'{path}.tmp'
+    with open(temporary, 'w') as f:
+        json.dump(state, f)
+    os.replace(temporary, path)
@@ -0,0 +1,258 @@
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from ..utils.contract_batch import ContractBatch, FLOAT_COLUMNS, CONTRACT_COLUMNS
+from ..utils.curves import YieldCurve
+
+STOCHASTIC_METHODS = ('monte_carlo', 'least_squares_mc')
+
+DEFAULT_TOLERANCES = {
+    'S': 1e-6,
+    'K': 1e-6,
+    'T': 1e-8,
+    'r': 1e-8,
+    'q': 1e-8,
+    'sigma': 1e-8
+}
+
+IGNORED_SETTINGS = ('executor', 'method', 'policy_cache')
+
+def _freeze(value):
+    if isinstance(value, YieldCurve):
+        return ('curve', value.key)
+    if isinstance(value, np.ndarray):
+        return ('array', value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _sizeof(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes + 112
+    if isinstance(value, dict):
+        return 232 + sum(_sizeof(v) + 50 for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(_sizeof(v) + 8 for v in value)
+    if isinstance(value, str):
+        return 49 + len(value)
+    if callable(getattr(value, 'to_dict', None)):
+        return 56 + _sizeof(value.to_dict())
+    return 32
+
+def _copy_value(value):
+    if isinstance(value, np.ndarray) and value.dtype == object:
+        copied = np.empty(value.shape, dtype=object)
+        for index in np.ndindex(value.shape):
+            copied[index] = _copy_value(value[index])
+        return copied
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if callable(getattr(value, 'to_dict', None)) and callable(getattr(type(value), 'from_dict', None)):
+        return type(value).from_dict(value.to_dict())
+    return value
+
+def _copy(result):
+    return {k: _copy_value(v) for k, v in result.items()}
+
+class ResultCache:
+    def __init__(self, max_entries=10000, max_bytes=None, ttl=None, tolerances=None, default_tolerance=1e-10,
+                 backend=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+        self.default_tolerance = default_tolerance
+        self.backend = backend
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'bypassed': 0, 'backend_hits': 0}
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries), 'bytes': self._bytes}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def is_cacheable(self, params, method):
+        return method not in STOCHASTIC_METHODS or params.get('seed', None) is not None
+
+    def make_key(self, kind, params, method):
+        option_style = params.get('option_style', 'european')
+        contract = dict(params)
+        if option_style != 'combination':
+            contract.setdefault('q', 0.0)
+        if option_style == 'gap' and 'K1' in contract:
+            contract.setdefault('K', contract['K1'])
+        contract = tuple(
+            (k, self._quantize(k, contract[k]) if k in FLOAT_COLUMNS else _freeze(contract[k]))
+            for k in CONTRACT_COLUMNS if k in contract
+        )
+        return kind, option_style, method, contract, self._settings_key(params)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            value, expires_at, size = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                self._remove(key)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return value
+
+    def put(self, key, value):
+        size = _sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    def get_or_compute(self, kind, params, method, compute):
+        if not self.is_cacheable(params, method):
+            self._count('bypassed')
+            return compute(params, method)
+
+        if isinstance(params, ContractBatch):
+            if len(params) == 0:
+                return compute(params, method)
+            return self._get_or_compute_batch(kind, params, method, compute)
+
+        if any(isinstance(params.get(k), (np.ndarray, list, tuple)) for k in CONTRACT_COLUMNS):
+            self._count('bypassed')
+            return compute(params, method)
+
+        key = self.make_key(kind, params, method)
+        result = self._lookup([key])[0]
+        if result is None:
+            result = compute(params, method)
+            self._store([(key, _copy(result))])
+            return result
+        return _copy(result)
+
+    def preload(self, keys):
+        if self.backend is None:
+            return 0
+        with self._lock:
+            keys = [key for key in keys if key not in self._entries]
+        found = self.backend.get_many(keys)
+        for key, value in found.items():
+            self.put(key, value)
+        return len(found)
+
+    def _lookup(self, keys):
+        values = [self.get(key) for key in keys]
+        if self.backend is not None:
+            missing = [key for key, value in zip(keys, values) if value is None]
+            found = self.backend.get_many(missing) if missing else {}
+            if found:
+                with self._lock:
+                    self._stats['backend_hits'] += len(found)
+                    self._stats['misses'] -= len(found)
+                for i, key in enumerate(keys):
+                    if values[i] is None and key in found:
+                        values[i] = found[key]
+                        self.put(key, found[key])
+        return values
+
+    def _store(self, items):
+        for key, value in items:
+            self.put(key, value)
+        if self.backend is not None:
+            self.backend.put_many(items)
+
+    def _get_or_compute_batch(self, kind, batch, method, compute):
+        keys = self.batch_keys(kind, batch, method)
+        rows = self._lookup(keys)
+        missing = np.array([i for i, row in enumerate(rows) if row is None], dtype=int)
+
+        if len(missing):
+            result = compute(batch.take(missing), method)
+            n = len(missing)
+            computed = []
+            for j, i in enumerate(missing):
+                row = {
+                    k: (v[j] if v.dtype == object else v[j].item())
+                    if isinstance(v, np.ndarray) and v.shape[:1] == (n,) else v
+                    for k, v in result.items()
+                }
+                rows[i] = row
+                computed.append((keys[i], row))
+            self._store(computed)
+
+        merged = {}
+        for key, value in rows[0].items():
+            values = [row[key] for row in rows]
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged[key] = np.array(values)
+            elif isinstance(value, (str, bool, type(None))) and all(v == value for v in values):
+                merged[key] = value
+            else:
+                merged[key] = np.empty(len(values), dtype=object)
+                for i, v in enumerate(values):
+                    merged[key][i] = _copy_value(v)
+        return merged
+
+    def batch_keys(self, kind, batch, method):
+        settings = self._settings_key(batch.settings)
+        names = [k for k in CONTRACT_COLUMNS if k in batch.columns]
+        columns = [
+            self._quantize(k, batch.columns[k]) if k in FLOAT_COLUMNS else batch.columns[k].tolist()
+            for k in names
+        ]
+        return [
+            (kind, batch.option_style, method, tuple(zip(names, values)), settings)
+            for values in zip(*columns)
+        ]
+
+    def _settings_key(self, params):
+        return tuple(sorted(
+            (k, _freeze(params[k])) for k in params.keys()
+            if k not in CONTRACT_COLUMNS and k not in IGNORED_SETTINGS and k != 'option_style'
+        ))
+
+    def _quantize(self, name, value):
+        if isinstance(value, YieldCurve):
+            return ('curve', value.key)
+        tolerance = self.tolerances.get(name, self.default_tolerance)
+        quantized = np.rint(np.asarray(value, dtype=np.float64) / tolerance).astype(np.int64)
+        return quantized.tolist()
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _count(self, stat):
+        with self._lock:
+            self._stats[stat] += 1
@@ -0,0 +1,144 @@
+import time
+import numpy as np
+from scipy.optimize import least_squares
+from scipy.stats import norm
+from ..models.fourier import FourierModel
+from ..models.implied_volatility import ImpliedVolatility
+from ..utils.broadcasting import broadcast_arrays
+
+CALIBRATION_PARAMETERS = {
+    'gbm': {
+        'sigma': (0.2, (1e-4, 5.0))
+    },
+    'heston': {
+        'v0': (0.04, (1e-4, 4.0)),
+        'kappa': (1.5, (1e-3, 20.0)),
+        'theta': (0.04, (1e-4, 4.0)),
+        'xi': (0.5, (1e-3, 5.0)),
+        'rho': (-0.5, (-0.999, 0.999))
+    },
+    'merton': {
+        'sigma': (0.2, (1e-4, 5.0)),
+        'jump_intensity': (0.5, (0.0, 10.0)),
+        'jump_mean': (-0.05, (-1.0, 1.0)),
+        'jump_std': (0.1, (1e-4, 2.0))
+    }
+}
+
+class ModelCalibrator:
+    def __init__(self, process='heston', model=None, error='price', fourier_method='cos', bounds=None, **solver_options):
+        if process not in CALIBRATION_PARAMETERS:
+            raise ValueError(f"Unsupported process: {process}. Supported: {list(CALIBRATION_PARAMETERS)}")
+        if error not in ('price', 'iv'):
+            raise ValueError("error must be 'price' or 'iv'")
+
+        self.process = process
+        self.model = model or FourierModel()
+        self.error = error
+        self.fourier_method = fourier_method
+        self.names = tuple(CALIBRATION_PARAMETERS[process])
+        self.bounds = {name: bounds_ for name, (_, bounds_) in CALIBRATION_PARAMETERS[process].items()}
+        self.bounds.update(bounds or {})
+        self.solver_options = {'method': 'trf', 'x_scale': 'jac', 'xtol': 1e-10, 'ftol': 1e-10, **solver_options}
+        self.analytic_jacobian = fourier_method == 'cos' and hasattr(self.model, 'calculate_gradient')
+
+        self.params = None
+        self.last_result = None
+
+    def calibrate(self, chain, initial=None):
+        start = time.perf_counter()
+        S, K, T, r, q, option_type, market = broadcast_arrays(
+            chain['S'], chain['K'], chain['T'], chain['r'], chain.get('q', 0.0),
+            chain.get('option_type', 'call'), chain['price']
+        )
+        weights = self._weights(chain, S, K, T, r, q, option_type, market)
+
+        x0 = self._initial_vector(initial)
+        lower = np.array([self.bounds[name][0] for name in self.names])
+        upper = np.array([self.bounds[name][1] for name in self.names])
+        x0 = np.clip(x0, lower, upper)
+
+        n_chain_evaluations = [0]
+        def residuals(x):
+            n_chain_evaluations[0] += 1
+            model_prices = self._price_chain(dict(zip(self.names, x)), S, K, T, r, q, option_type)
+            return ((model_prices - market) * weights).ravel()
+
+        def jacobian(x):
+            gradient = self._chain_gradient(dict(zip(self.names, x)), S, K, T, r, q, option_type)
+            return (gradient * weights[..., None]).reshape(-1, len(self.names))
+
+        options = dict(self.solver_options)
+        if self.analytic_jacobian:
+            options.setdefault('jac', jacobian)
+        solution = least_squares(residuals, x0, bounds=(lower, upper), **options)
+        self.params = dict(zip(self.names, (float(x) for x in solution.x)))
+
+        self.last_result = {
+            'process': self.process,
+            'params': dict(self.params),
+            'model_params': self.model_params(),
+            'rmse': float(np.sqrt(np.mean(solution.fun**2))),
+            'residuals': solution.fun.reshape(S.shape),
+            'success': bool(solution.success),
+            'message': solution.message,
+            'n_iterations': int(solution.njev or 0),
+            'n_evaluations': n_chain_evaluations[0],
+            'n_quotes': int(S.size),
+            'warm_start': initial is None and self.last_result is not None,
+            'elapsed': time.perf_counter() - start
+        }
+        return self.last_result
+
+    def model_params(self):
+        if self.params is None:
+            raise ValueError("Calibrator has not been run")
+        model_params = {'process': self.process, **self.params}
+        if self.process == 'heston':
+            model_params['sigma'] = float(np.sqrt(self.params['v0']))
+        return model_params
+
+    def _initial_vector(self, initial):
+        if initial is None:
+            initial = self.params or {}
+        defaults = CALIBRATION_PARAMETERS[self.process]
+        return np.array([float(initial.get(name, defaults[name][0])) for name in self.names])
+
+    def _price_chain(self, params, S, K, T, r, q, option_type):
+        params = dict(params)
+        sigma = params.pop('sigma', None)
+        if sigma is None:
+            sigma = np.sqrt(params['v0'])
+        return self.model.calculate(
+            S, K, T, r, sigma, option_type, q, process=self.process, fourier_method=self.fourier_method, **params
+        )['price']
+
+    def _chain_gradient(self, params, S, K, T, r, q, option_type):
+        params = dict(params)
+        sigma = params.pop('sigma', None)
+        if sigma is None:
+            sigma = np.sqrt(params['v0'])
+        return self.model.calculate_gradient(
+            S, K, T, r, sigma, option_type, q, parameters=self.names, process=self.process, **params
+        )['gradient']
+
+    def _weights(self, chain, S, K, T, r, q, option_type, market):
+        weights = chain.get('weight', None)
+        if weights is not None:
+            return np.broadcast_to(np.asarray(weights, dtype=np.float64), S.shape)
+
+        implied_vol = chain.get('implied_vol', None)
+        if implied_vol is None:
+            implied_vol = ImpliedVolatility.calculate_batch({
+                'S': S, 'K': K, 'T': T, 'r': r, 'q': q, 'option_type': option_type, 'price': market
+            })
+            implied_vol = np.where(np.isfinite(implied_vol), implied_vol, 0.2)
+        implied_vol = np.broadcast_to(np.asarray(implied_vol, dtype=np.float64), S.shape)
+
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S / K) + (r - q + 0.5 * implied_vol**2) * T) / (implied_vol * sqrt_T)
+        vega = np.maximum(S * np.exp(-q * T) * norm.pdf(d1) * sqrt_T, 1e-4 * S)
+
+        if self.error == 'iv':
+            return 1.0 / vega
+        return vega / vega.max()
@@ -7,6 +7,7 @@ class OptionType(Enum):
 class ExerciseStyle(Enum):
     EUROPEAN = "european"
     AMERICAN = "american"
+    BERMUDAN = "bermudan"
     ASIAN = "asian" 
     BARRIER = "barrier"
     GAP = "gap"
\ No newline at end of file
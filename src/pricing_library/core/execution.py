@@ -0,0 +1,136 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from ..utils.stochastic_processes import get_process, process_parameters
+
+LOCAL_KWARGS = ('executor', 'path_cache', 'policy_cache')
+
+def _shippable(kwargs):
+    return {k: v for k, v in kwargs.items() if k not in LOCAL_KWARGS}
+
+def _share(array):
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+def _allocate(shape, dtype=np.float64):
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    return shm, (shm.name, tuple(shape), dtype.str)
+
+def _attach(descriptor):
+    name, shape, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+def _release(blocks):
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
+
+def _payoff_block(model, z_descriptor, out_descriptor, start, stop, S, K, T, r, sigma, q, option_type, kwargs):
+    z_shm, z = _attach(z_descriptor)
+    out_shm, out = _attach(out_descriptor)
+    try:
+        process = get_process(kwargs.get('process', 'gbm'))
+        paths = process.paths_from_normals(S, T, r, sigma, q, z[start:stop], **process_parameters(process, kwargs))
+        out[start:stop] = model._payoffs(paths, K, option_type, **kwargs)
+    finally:
+        del z, out
+        z_shm.close()
+        out_shm.close()
+
+def _row_block(model, method_name, descriptors, start, stop, kwargs):
+    blocks, columns = {}, {}
+    for key, descriptor in descriptors.items():
+        blocks[key], columns[key] = _attach(descriptor)
+    try:
+        func = getattr(model, method_name)
+        return [
+            func(**{key: column[i].item() for key, column in columns.items()}, **kwargs)
+            for i in range(start, stop)
+        ]
+    finally:
+        columns.clear()
+        for shm in blocks.values():
+            shm.close()
+
+class ProcessPoolBackend:
+    def __init__(self, max_workers=None, min_block_paths=50000, min_block_rows=1, executor=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_block_paths = min_block_paths
+        self.min_block_rows = min_block_rows
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self):
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getstate__(self):
+        raise TypeError('ProcessPoolBackend cannot be sent to worker processes')
+
+    def should_split(self, n_paths):
+        return self.max_workers > 1 and n_paths >= 2 * self.min_block_paths
+
+    def _blocks(self, n, min_block):
+        block = max(min_block, -(-n // self.max_workers))
+        return [(start, min(start + block, n)) for start in range(0, n, block)]
+
+    def simulate_payoffs(self, model, S, K, T, r, sigma, q, option_type, width=None, **kwargs):
+        n_paths = kwargs.get('n_paths', 10000)
+        n_steps = kwargs.get('n_steps', 100)
+        kwargs = _shippable(kwargs)
+        process = get_process(kwargs.get('process', 'gbm'))
+        z_shm, z_descriptor = _share(process.normals(n_paths, n_steps, kwargs.get('seed', None)))
+        shape = (n_paths,) if width is None else (n_paths, width)
+        out_shm, out_descriptor = _allocate(shape)
+        try:
+            futures = [
+                self.executor.submit(_payoff_block, model, z_descriptor, out_descriptor, start, stop,
+                                     S, K, T, r, sigma, q, option_type, kwargs)
+                for start, stop in self._blocks(n_paths, self.min_block_paths)
+            ]
+            for future in futures:
+                future.result()
+            return np.ndarray(shape, dtype=np.float64, buffer=out_shm.buf).copy()
+        finally:
+            _release([z_shm, out_shm])
+
+    def map_groups(self, func, tasks):
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as threads:
+            return list(threads.map(func, tasks))
+
+    def map_rows(self, model, method_name, inputs, kwargs):
+        kwargs = _shippable(kwargs)
+        n = len(next(iter(inputs.values())))
+        shared = {}
+        try:
+            for key, column in inputs.items():
+                if column.dtype.kind == 'O':
+                    column = column.astype(str)
+                shared[key] = _share(column)
+            descriptors = {key: descriptor for key, (_, descriptor) in shared.items()}
+            futures = [
+                self.executor.submit(_row_block, model, method_name, descriptors, start, stop, kwargs)
+                for start, stop in self._blocks(n, self.min_block_rows)
+            ]
+            return [row for future in futures for row in future.result()]
+        finally:
+            _release([shm for shm, _ in shared.values()])
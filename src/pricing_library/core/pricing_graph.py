@@ -0,0 +1,176 @@
+import time
+import numpy as np
+from .pricing_service import PricingService
+from ..utils.curves import YieldCurve
+
+MARKET_FIELDS = {
+    'spot': ('S', 'underlying'),
+    'vol': ('sigma', 'underlying'),
+    'rate': ('r', 'currency'),
+    'dividend': ('q', 'underlying')
+}
+
+DEFAULT_THRESHOLDS = {'spot': 1e-6, 'vol': 1e-8, 'rate': 1e-10, 'dividend': 1e-10}
+
+GREEKS = ('delta', 'gamma', 'vega', 'theta', 'rho')
+
+class _Group:
+    __slots__ = ('option_style', 'method', 'positions', 'batch', 'codes', 'offsets')
+
+    def __init__(self, option_style, method, positions, batch, codes, offsets):
+        self.option_style = option_style
+        self.method = method
+        self.positions = positions
+        self.batch = batch
+        self.codes = codes
+        self.offsets = offsets
+
+class PricingGraph:
+    def __init__(self, service=None, method=None, thresholds=None, taylor=False, greeks=True):
+        if taylor and not greeks:
+            raise ValueError("Taylor estimates require greeks=True")
+        self.service = service or PricingService()
+        self.method = method
+        self.thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        self.taylor = taylor
+        self.greeks = greeks
+        self.stats = {'updates': 0, 'touched': 0, 'repriced': 0, 'estimated': 0, 'reprice_calls': 0}
+
+        self._trades = []
+        self._names = {field: {} for field in MARKET_FIELDS}
+        self._market = {field: np.empty(0) for field in MARKET_FIELDS}
+        self._curves = {field: np.empty(0, dtype=bool) for field in MARKET_FIELDS}
+        self._groups = []
+        self.prices = np.empty(0)
+        self.quotes = np.empty(0)
+        self.risk = {greek: np.empty(0) for greek in GREEKS}
+
+    def __len__(self):
+        return len(self._trades)
+
+    def add_positions(self, trades):
+        for trade in trades:
+            if 'underlying' not in trade:
+                raise ValueError("Each position needs an 'underlying' to map market inputs")
+            trade = {'currency': 'default', 'q': 0.0, **trade}
+            for field, (column, key) in MARKET_FIELDS.items():
+                names = self._names[field]
+                # A curve-backed node holds a parallel shift on top of each position's zero rate.
+                curve = isinstance(trade[column], YieldCurve)
+                if trade[key] not in names:
+                    names[trade[key]] = len(names)
+                    self._market[field] = np.append(self._market[field], 0.0 if curve else float(trade[column]))
+                    self._curves[field] = np.append(self._curves[field], curve)
+                elif self._curves[field][names[trade[key]]] != curve:
+                    raise ValueError(f"{field} node {trade[key]!r} mixes curves and flat values")
+            self._trades.append(trade)
+
+        self._build()
+        return self.reprice_all()
+
+    def market(self, field):
+        return dict(zip(self._names[field], self._market[field].tolist()))
+
+    def update(self, spot=None, vol=None, rate=None, dividend=None):
+        start = time.perf_counter()
+        updated = {field: np.zeros(len(self._names[field]), dtype=bool) for field in MARKET_FIELDS}
+        for field, values in (('spot', spot), ('vol', vol), ('rate', rate), ('dividend', dividend)):
+            for name, value in (values or {}).items():
+                index = self._names[field].get(name)
+                if index is not None and self._market[field][index] != value:
+                    self._market[field][index] = value
+                    updated[field][index] = True
+
+        touched = repriced = estimated = 0
+        positions_touched = []
+        for group in self._groups:
+            hit = np.zeros(len(group.positions), dtype=bool)
+            for field in MARKET_FIELDS:
+                hit |= updated[field][group.codes[field]]
+            rows = np.flatnonzero(hit)
+            if len(rows) == 0:
+                continue
+            touched += len(rows)
+            positions_touched.append(group.positions[rows])
+
+            stale = np.zeros(len(rows), dtype=bool)
+            for field, (column, _) in MARKET_FIELDS.items():
+                priced = group.batch.columns[column][rows]
+                change = np.abs(self._market_values(group, field, rows) - priced)
+                stale |= (change / priced if field == 'spot' else change) > self.thresholds[field]
+
+            if np.any(stale):
+                self._reprice(group, rows[stale])
+                repriced += int(stale.sum())
+
+            drift = rows[~stale]
+            if self.taylor and len(drift):
+                positions = group.positions[drift]
+                dS = self._market['spot'][group.codes['spot'][drift]] - group.batch.columns['S'][drift]
+                self.quotes[positions] = (self.prices[positions] + self.risk['delta'][positions] * dS
+                                          + 0.5 * self.risk['gamma'][positions] * dS**2)
+                estimated += len(drift)
+
+        self.stats['updates'] += 1
+        self.stats['touched'] += touched
+        self.stats['repriced'] += repriced
+        self.stats['estimated'] += estimated
+        return {
+            'price': self.quotes,
+            'positions': np.concatenate(positions_touched) if positions_touched else np.empty(0, dtype=np.int64),
+            'touched': touched,
+            'repriced': repriced,
+            'estimated': estimated,
+            'touched_fraction': touched / max(len(self._trades), 1),
+            'repriced_fraction': repriced / max(len(self._trades), 1),
+            'elapsed': time.perf_counter() - start
+        }
+
+    def reprice_all(self):
+        start = time.perf_counter()
+        for group in self._groups:
+            self._reprice(group, np.arange(len(group.positions)))
+        self.stats['repriced'] += len(self._trades)
+        return {'price': self.quotes, 'repriced': len(self._trades), 'elapsed': time.perf_counter() - start}
+
+    def _build(self):
+        n = len(self._trades)
+        self.prices = np.full(n, np.nan)
+        self.quotes = np.full(n, np.nan)
+        self.risk = {greek: np.full(n, np.nan) for greek in GREEKS}
+
+        contracts = [{k: v for k, v in trade.items() if k not in ('underlying', 'currency')} for trade in self._trades]
+        self._groups = []
+        for batch, method, indices in self.service.group_trades(contracts, self.method):
+            for column, _ in MARKET_FIELDS.values():
+                batch.columns[column] = batch.columns[column].copy()
+            codes = {
+                field: np.array([self._names[field][self._trades[i][key]] for i in indices])
+                for field, (_, key) in MARKET_FIELDS.items()
+            }
+            offsets = {
+                field: np.where(self._curves[field][codes[field]], batch.columns[column], 0.0)
+                for field, (column, _) in MARKET_FIELDS.items()
+            }
+            self._groups.append(_Group(batch.option_style, method, indices, batch, codes, offsets))
+
+    def _reprice(self, group, rows):
+        for field, (column, _) in MARKET_FIELDS.items():
+            group.batch.columns[column][rows] = self._market_values(group, field, rows)
+
+        batch = group.batch.take(rows)
+        positions = group.positions[rows]
+        if self.greeks:
+            result = self.service.calculate_greeks(batch, group.method)
+            greeks = result.get('greeks', result)
+            for greek in GREEKS:
+                self.risk[greek][positions] = np.asarray(greeks[greek], dtype=float).ravel()
+        else:
+            result = self.service.price_option(batch, group.method)
+
+        self.prices[positions] = np.asarray(result['price'], dtype=float).ravel()
+        self.quotes[positions] = self.prices[positions]
+        self.stats['reprice_calls'] += 1
+
+    def _market_values(self, group, field, rows):
+        return group.offsets[field][rows] + self._market[field][group.codes[field][rows]]
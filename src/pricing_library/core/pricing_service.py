@@ -1,3 +1,6 @@
+import time
+import inspect
+import numpy as np
 from pricing_library.calculators import (
     EuropeanCalculator,
     AsianCalculator,
@@ -6,20 +9,120 @@ from pricing_library.calculators import (
     BarrierCalculator,
     OptionCombinationCalculator
 )
+from ..utils.contract_batch import ContractBatch, CONTRACT_COLUMNS, CURVE_SETTINGS
+from ..utils.curves import YieldCurve
+from .cache import _freeze
 from .exceptions import UnsupportedOptionTypeError
 
 class PricingService:
-    def __init__(self, calculators=None):
+    def __init__(self, calculators=None, executor=None, cache=None, path_cache=None):
         self.calculators = calculators or {
             'european': EuropeanCalculator(),
             'asian': AsianCalculator(),
             'american': AmericanCalculator(),
+            'bermudan': AmericanCalculator(),
             'gap': GapCalculator(),
             'barrier': BarrierCalculator(),
             'combination': OptionCombinationCalculator()
         }
+        self.executor = executor
+        self.cache = cache
+        self.path_cache = path_cache
+        for calculator in self.calculators.values():
+            if executor is not None:
+                calculator.executor = executor
+            if path_cache is not None:
+                calculator.path_cache = path_cache
 
     def price_option(self, params, method=None):
+        if self.cache is not None:
+            return self.cache.get_or_compute('price', params, self.resolve_method(params, method), self._price_option)
+        return self._price_option(params, method)
+    
+    def calculate_greeks(self, params, method=None):
+        if self.cache is not None:
+            return self.cache.get_or_compute('greeks', params, self.resolve_method(params, method), self._calculate_greeks)
+        return self._calculate_greeks(params, method)
+
+    def price_portfolio(self, trades, method=None):
+        groups = self.group_trades(trades, method)
+        prices = np.full(len(trades), np.nan)
+
+        if self.executor is not None and len(groups) > 1:
+            report = self.executor.map_groups(self._price_group, groups)
+        else:
+            report = [self._price_group(group) for group in groups]
+
+        for (_, _, indices), group in zip(groups, report):
+            prices[indices] = group.pop('price')
+
+        return {
+            'price': prices,
+            'groups': report
+        }
+
+    def warm_up(self, trades, method=None):
+        if self.cache is None:
+            return 0
+
+        loaded = 0
+        for batch, group_method, _ in self.group_trades(trades, method):
+            resolved = self.resolve_method(batch, group_method)
+            if self.cache.is_cacheable(batch, resolved):
+                loaded += self.cache.preload(self.cache.batch_keys('price', batch, resolved))
+        return loaded
+
+    def group_trades(self, trades, method=None):
+        groups = {}
+        for i, trade in enumerate(trades):
+            groups.setdefault(self.trade_key(trade, method), []).append(i)
+
+        result = []
+        for (option_style, group_method, _), indices in groups.items():
+            records = [{k: v for k, v in trades[i].items() if k != 'method'} for i in indices]
+            result.append((ContractBatch.from_records(records, option_style), group_method, np.array(indices)))
+        return result
+
+    def trade_key(self, trade, method=None):
+        option_style = trade.get('option_style', 'european')
+        if option_style not in self.calculators:
+            raise UnsupportedOptionTypeError(option_style)
+
+        trade_method = trade.get('method', method)
+        columns = tuple(k for k in CONTRACT_COLUMNS if k in trade and k not in ('q', 't_today'))
+        settings = tuple(sorted(
+            (k, _freeze(v)) for k, v in trade.items()
+            if k not in CONTRACT_COLUMNS and k not in ('option_style', 'method')
+        ))
+        curves = tuple(
+            (k, trade[k].key) for k in CURVE_SETTINGS if isinstance(trade.get(k, None), YieldCurve)
+        )
+        return option_style, trade_method, (columns, settings, curves)
+
+    def resolve_method(self, params, method=None):
+        if method is not None:
+            return method
+        option_style = params.get('option_style', 'european')
+        calculator = self.calculators.get(option_style)
+        if not calculator:
+            raise UnsupportedOptionTypeError(option_style)
+        return inspect.signature(calculator.calculate).parameters['method'].default
+
+    def _price_group(self, group):
+        batch, group_method, indices = group
+        start = time.perf_counter()
+        result = self.price_option(batch, group_method)
+        elapsed = time.perf_counter() - start
+
+        return {
+            'option_style': batch.option_style,
+            'method': group_method,
+            'n_trades': len(indices),
+            'elapsed': elapsed,
+            'price': np.asarray(result['price'], dtype=float).ravel()
+        }
+
+    def _price_option(self, params, method=None):
         option_style = params.get('option_style', 'european')
         calculator = self.calculators.get(option_style)
 
@@ -31,7 +134,7 @@ class PricingService:
         
         return calculator.calculate(params, method)
     
-    def calculate_greeks(self, params, method=None):
+    def _calculate_greeks(self, params, method=None):
         option_style = params.get('option_style', 'european')
         calculator = self.calculators.get(option_style)
 
@@ -41,4 +144,4 @@ class PricingService:
         if method is None:
             return calculator.calculate_greeks(params)
         
-        return calculator.calculate_greeks(params, method)
\ No newline at end of file
+        return calculator.calculate_greeks(params, method)
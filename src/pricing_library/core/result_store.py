@@ -0,0 +1,150 @@
+import hashlib
+import importlib
+import json
+import sqlite3
+import threading
+import time
+import numpy as np
+
+PACKAGE = __name__.split('.')[0]
+
+def _encode(value):
+    if isinstance(value, np.ndarray):
+        return {'__ndarray__': value.tolist(), 'dtype': value.dtype.str, 'shape': list(value.shape)}
+    if isinstance(value, np.generic):
+        return value.item()
+    cls = type(value)
+    if cls.__module__.split('.')[0] == PACKAGE and callable(getattr(cls, 'from_dict', None)):
+        return {'__object__': cls.__module__, 'type': cls.__qualname__, 'state': value.to_dict()}
+    raise TypeError(f'Cannot store value of type {type(value).__name__}')
+
+def _decode(obj):
+    if '__ndarray__' in obj:
+        return np.array(obj['__ndarray__'], dtype=np.dtype(obj['dtype'])).reshape(obj['shape'])
+    if '__object__' in obj and obj['__object__'].split('.')[0] == PACKAGE:
+        return getattr(importlib.import_module(obj['__object__']), obj['type']).from_dict(obj['state'])
+    return obj
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+def _canonical(value):
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return {'float': repr(value)}
+    if isinstance(value, np.generic):
+        return _canonical(value.item())
+    if isinstance(value, bytes):
+        return {'bytes': _digest(value)}
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'O':
+            return {'ndarray': list(value.shape), 'values': _canonical(value.ravel().tolist())}
+        data = _digest(np.ascontiguousarray(value).tobytes())
+        return {'ndarray': list(value.shape), 'dtype': value.dtype.str, 'data': data}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        items = [[_canonical(k), _canonical(v)] for k, v in value.items()]
+        return {'dict': sorted(items, key=json.dumps)}
+
+    name = f'{type(value).__module__}.{type(value).__qualname__}'
+    key = getattr(value, 'key', None)
+    if key is not None and not callable(key):
+        return {'object': name, 'key': _canonical(key)}
+    if callable(getattr(value, 'to_dict', None)):
+        return {'object': name, 'state': _canonical(value.to_dict())}
+    raise TypeError(f'Cannot build a persistent key for a value of type {type(value).__name__}')
+
+class SQLiteResultStore:
+    def __init__(self, path, max_entries=1000000, version=None, chunk_size=500):
+        self.path = path
+        self.max_entries = max_entries
+        self.chunk_size = chunk_size
+        self._version = version
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+        self._connection.commit()
+
+    @property
+    def version(self):
+        if self._version is None:
+            from .. import __version__
+            self._version = __version__
+        return self._version
+
+    def hash_key(self, key):
+        return _digest(json.dumps(_canonical((self.version, key)), separators=(',', ':')).encode())
+
+    def _hash_keys(self, keys):
+        hashed = {}
+        for key in keys:
+            try:
+                hashed[self.hash_key(key)] = key
+            except TypeError:
+                continue
+        return hashed
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def get_many(self, keys):
+        hashed = self._hash_keys(keys)
+        found = {}
+        now = time.time()
+        with self._lock:
+            hashes = list(hashed)
+            for start in range(0, len(hashes), self.chunk_size):
+                chunk = hashes[start:start + self.chunk_size]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._connection.execute(
+                    f'SELECT key, value FROM results WHERE key IN ({placeholders})', chunk
+                ).fetchall()
+                for digest, value in rows:
+                    found[hashed[digest]] = json.loads(value, object_hook=_decode)
+                if rows:
+                    self._connection.executemany(
+                        'UPDATE results SET accessed = ? WHERE key = ?', [(now, digest) for digest, _ in rows]
+                    )
+            self._connection.commit()
+        return found
+
+    def put_many(self, items):
+        now = time.time()
+        values = dict(items)
+        rows = []
+        for digest, key in self._hash_keys(values).items():
+            try:
+                rows.append((digest, json.dumps(values[key], default=_encode), now, now))
+            except TypeError:
+                continue
+        with self._lock:
+            self._connection.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)', rows)
+            self._evict()
+            self._connection.commit()
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute('DELETE FROM results')
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self):
+        if self.max_entries is None:
+            return
+        count = self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                'DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed LIMIT ?)', (excess,)
+            )
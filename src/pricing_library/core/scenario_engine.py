@@ -0,0 +1,93 @@
+import numpy as np
+from .cache import STOCHASTIC_METHODS
+from ..utils.contract_batch import ContractBatch, CONTRACT_COLUMNS
+from .pricing_service import PricingService
+from ..utils.stochastic_processes.path_cache import PathCache
+
+class ScenarioGrid:
+    def __init__(self, spot=(0.0,), vol=(0.0,), rate=(0.0,), spot_relative=True):
+        self.spot = np.atleast_1d(np.asarray(spot, dtype=np.float64))
+        self.vol = np.atleast_1d(np.asarray(vol, dtype=np.float64))
+        self.rate = np.atleast_1d(np.asarray(rate, dtype=np.float64))
+        self.spot_relative = spot_relative
+
+        spot_shocks, vol_shocks, rate_shocks = np.meshgrid(self.spot, self.vol, self.rate, indexing='ij')
+        self.spot_shocks = spot_shocks.ravel()
+        self.vol_shocks = vol_shocks.ravel()
+        self.rate_shocks = rate_shocks.ravel()
+
+    @property
+    def shape(self):
+        return len(self.spot), len(self.vol), len(self.rate)
+
+    def __len__(self):
+        return len(self.spot_shocks)
+
+    def apply(self, S, sigma, r, start=0, stop=None):
+        spot_shocks = self.spot_shocks[None, start:stop]
+        S = S[:, None] * (1.0 + spot_shocks) if self.spot_relative else S[:, None] + spot_shocks
+        sigma = np.maximum(sigma[:, None] + self.vol_shocks[None, start:stop], 1e-8)
+        r = r[:, None] + self.rate_shocks[None, start:stop]
+        return S, sigma, r
+
+class ScenarioEngine:
+    def __init__(self, service=None, max_cells=2000000, seed=0):
+        self.service = service or PricingService(path_cache=PathCache())
+        self.max_cells = max_cells
+        self.seed = seed
+
+    def run(self, portfolio, grid, method=None):
+        if isinstance(portfolio, ContractBatch):
+            trades = [portfolio.row(i) for i in range(len(portfolio))]
+        else:
+            trades = list(portfolio)
+
+        quantities = np.array([trade.get('quantity', 1.0) for trade in trades], dtype=np.float64)
+        trades = [{k: v for k, v in trade.items() if k != 'quantity'} for trade in trades]
+
+        n_scenarios = len(grid)
+        base = np.full(len(trades), np.nan)
+        prices = np.full((len(trades), n_scenarios), np.nan)
+        report = []
+
+        for batch, group_method, indices in self.service.group_trades(trades, method):
+            resolved = self.service.resolve_method(batch, group_method)
+            if resolved in STOCHASTIC_METHODS and batch.settings.get('seed', None) is None:
+                batch.settings['seed'] = self.seed
+
+            base[indices] = self._price(batch, group_method, ScenarioGrid(), 0, 1)[:, 0]
+            chunk = max(1, self.max_cells // max(len(indices), 1))
+            for start in range(0, n_scenarios, chunk):
+                stop = min(start + chunk, n_scenarios)
+                prices[indices, start:stop] = self._price(batch, group_method, grid, start, stop)
+
+            report.append({
+                'option_style': batch.option_style,
+                'method': resolved,
+                'n_positions': len(indices),
+                'n_chunks': -(-n_scenarios // chunk)
+            })
+
+        return {
+            'pnl': quantities[:, None] * (prices - base[:, None]),
+            'prices': prices,
+            'base': base,
+            'scenarios': {
+                'spot': grid.spot_shocks,
+                'vol': grid.vol_shocks,
+                'rate': grid.rate_shocks
+            },
+            'groups': report
+        }
+
+    def _price(self, batch, method, grid, start, stop):
+        params = {k: v[:, None] for k, v in batch.columns.items() if k in CONTRACT_COLUMNS}
+        params['S'], params['sigma'], params['r'] = grid.apply(
+            batch.columns['S'], batch.columns['sigma'], batch.columns['r'], start, stop
+        )
+        params.update(batch.settings)
+        params['option_style'] = batch.option_style
+
+        n_cells = (len(batch), len(grid.spot_shocks[start:stop]))
+        price = self.service.price_option(params, method)['price']
+        return np.broadcast_to(np.asarray(price, dtype=np.float64), n_cells)
@@ -0,0 +1,152 @@
+import asyncio
+import time
+import numpy as np
+from .pricing_graph import PricingGraph, MARKET_FIELDS, GREEKS
+
+LATENCY_STAGES = ('debounce', 'pricing', 'tick_to_quote')
+
+class TickSimulator:
+    def __init__(self, spots, sigma=0.2, n_ticks=1000, ticks_per_second=None, dt=1.0 / (252 * 23400), seed=None):
+        if not spots:
+            raise ValueError("spots must map at least one underlying to an initial price")
+        if ticks_per_second is not None and ticks_per_second <= 0:
+            raise ValueError("ticks_per_second must be positive")
+        self.spots = dict(spots)
+        self.sigma = sigma
+        self.n_ticks = n_ticks
+        self.ticks_per_second = ticks_per_second
+        self.dt = dt
+        self.seed = seed
+
+    def __aiter__(self):
+        return self._generate()
+
+    async def _generate(self):
+        rng = np.random.default_rng(self.seed)
+        names = list(self.spots)
+        spots = np.array([self.spots[name] for name in names], dtype=np.float64)
+        sigma = np.array([self.sigma.get(name, 0.2) if isinstance(self.sigma, dict) else self.sigma for name in names])
+        choices = rng.integers(len(names), size=self.n_ticks)
+        shocks = rng.standard_normal(self.n_ticks)
+
+        start = time.perf_counter()
+        for i in range(self.n_ticks):
+            if self.ticks_per_second is None:
+                await asyncio.sleep(0)
+                timestamp = time.perf_counter()
+            else:
+                timestamp = start + i / self.ticks_per_second
+                await asyncio.sleep(max(timestamp - time.perf_counter(), 0.0))
+
+            j = choices[i]
+            spots[j] *= np.exp(-0.5 * sigma[j]**2 * self.dt + sigma[j] * np.sqrt(self.dt) * shocks[i])
+            yield {'underlying': names[j], 'spot': spots[j].item(), 'timestamp': timestamp}
+
+class QuotePipeline:
+    def __init__(self, service=None, method=None, debounce=0.001, max_batch_size=None, executor=None,
+                 thresholds=None, taylor=False, greeks=True):
+        self.graph = PricingGraph(service, method, thresholds, taylor, greeks)
+        self.debounce = debounce
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self.stats = {'ticks': 0, 'updates': 0, 'quotes': 0}
+        self.latency = {stage: [] for stage in LATENCY_STAGES}
+
+    def __len__(self):
+        return len(self.graph)
+
+    def add_positions(self, trades):
+        return self.graph.add_positions(trades)
+
+    async def stream(self, ticks):
+        loop = asyncio.get_running_loop()
+        window = {'pending': {}, 'oldest': None, 'opened': None}
+        arrived, ready = asyncio.Event(), asyncio.Event()
+
+        async def read():
+            try:
+                async for tick in ticks:
+                    timestamp = tick.get('timestamp', time.perf_counter())
+                    if not window['pending']:
+                        window['oldest'], window['opened'] = timestamp, loop.time()
+                    window['oldest'] = min(window['oldest'], timestamp)
+                    self._merge(window['pending'], tick)
+                    arrived.set()
+                    if self.max_batch_size is not None and len(window['pending']) >= self.max_batch_size:
+                        ready.set()
+            finally:
+                arrived.set()
+                ready.set()
+
+        reader = asyncio.ensure_future(read())
+        try:
+            while True:
+                if not reader.done():
+                    await arrived.wait()
+                    remaining = window['opened'] + self.debounce - loop.time() if window['pending'] else 0.0
+                    if remaining > 0 and not ready.is_set():
+                        try:
+                            await asyncio.wait_for(ready.wait(), remaining)
+                        except asyncio.TimeoutError:
+                            pass
+
+                pending, oldest = window['pending'], window['oldest']
+                window['pending'] = {}
+                arrived.clear()
+                ready.clear()
+                if pending:
+                    yield await self._flush(pending, oldest)
+                elif reader.done():
+                    break
+            await reader
+        finally:
+            reader.cancel()
+
+    async def run(self, ticks):
+        return [update async for update in self.stream(ticks)]
+
+    def latency_percentiles(self, percentiles=(50, 90, 99)):
+        return {
+            stage: {f'p{p}': float(np.percentile(values, p)) if values else np.nan for p in percentiles}
+            for stage, values in self.latency.items()
+        }
+
+    def _merge(self, pending, tick):
+        self.stats['ticks'] += 1
+        for field, (_, key) in MARKET_FIELDS.items():
+            if field in tick:
+                if key not in tick:
+                    raise ValueError(f"A '{field}' tick needs a '{key}'")
+                pending[(field, tick[key])] = float(tick[field])
+
+    async def _flush(self, pending, oldest):
+        start = time.perf_counter()
+        updates = {field: {} for field in MARKET_FIELDS}
+        for (field, name), value in pending.items():
+            updates[field][name] = value
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, self._apply, updates)
+        end = time.perf_counter()
+
+        latency = {'debounce': start - oldest, 'pricing': end - start, 'tick_to_quote': end - oldest}
+        for stage, value in latency.items():
+            self.latency[stage].append(value)
+        self.stats['updates'] += 1
+        self.stats['quotes'] += len(result['positions'])
+        result['underlyings'] = sorted({name for field, name in pending if MARKET_FIELDS[field][1] == 'underlying'})
+        result['latency'] = latency
+        return result
+
+    def _apply(self, updates):
+        result = self.graph.update(**updates)
+        positions = result['positions']
+        update = {
+            'positions': positions,
+            'price': self.graph.quotes[positions],
+            'repriced': result['repriced'],
+            'estimated': result['estimated']
+        }
+        if self.graph.greeks:
+            update.update({greek: self.graph.risk[greek][positions] for greek in GREEKS})
+        return update
@@ -2,10 +2,15 @@ from .base_model import PricingModel
 from .black_scholes import BlackScholesModel
 from .monte_carlo import VanillaMonteCarlo
 from .binomial import BinomialModel
+from .american_analytic import AnalyticAmericanModel
 from .least_squares_mc import LeastSquaresMC
+from .exercise_policy import ExercisePolicy
 from .black_scholes_gap import BlackScholesGapModel
 from .black_scholes_barrier import BlackScholesBarrierModel
-from .implied_volatility import ImpliedVolatility
+from .fourier import FourierModel
+from .merton import MertonJumpDiffusionModel
+from .surrogate import ChebyshevSurrogate
+from .implied_volatility import ImpliedVolatility, AmericanImpliedVolatility
 
 __all__ = [
     'PricingModel',
@@ -13,9 +18,15 @@ __all__ = [
     'BlackScholesModel',
     'BlackScholesGapModel',
     'BlackScholesBarrierModel',
+    'MertonJumpDiffusionModel',
     'VanillaMonteCarlo', 
     'LeastSquaresMC',
+    'ExercisePolicy',
     'BinomialModel',
+    'AnalyticAmericanModel',
+    'FourierModel',
+    'ChebyshevSurrogate',
 
-    'ImpliedVolatility'
+    'ImpliedVolatility',
+    'AmericanImpliedVolatility'
 ]
\ No newline at end of file
@@ -0,0 +1,229 @@
+import numpy as np
+from scipy.stats import norm
+from .base_model import PricingModel
+from .black_scholes import BlackScholesModel
+from ..utils.broadcasting import broadcast_arrays
+from ..utils.distributions import bivariate_normal_cdf
+
+APPROXIMATIONS = ('bjerksund_stensland', 'barone_adesi_whaley')
+
+def _normal_terms(y, slope):
+    density = norm.pdf(y)
+    return norm.cdf(y), density * slope, -y * density * slope**2
+
+def _bivariate_terms(a, b, rho, slope_a, slope_b):
+    scale = np.sqrt(1 - rho**2)
+    u_a, u_b = (b - rho * a) / scale, (a - rho * b) / scale
+    M_a, M_b = norm.pdf(a) * norm.cdf(u_a), norm.pdf(b) * norm.cdf(u_b)
+    M_ab = norm.pdf(a) * norm.pdf(u_a) / scale
+    first = slope_a * M_a + slope_b * M_b
+    second = (slope_a**2 * (-a * M_a - rho * M_ab) + 2 * slope_a * slope_b * M_ab
+              + slope_b**2 * (-b * M_b - rho * M_ab))
+    return bivariate_normal_cdf(a, b, rho), first, second
+
+def _log_derivatives(power, m, terms):
+    # Value and first two log(S) derivatives of power * F, where power is proportional to S**m.
+    value, first, second = terms
+    return power * np.stack([value, m * value + first, m**2 * value + 2 * m * first + second])
+
+class AnalyticAmericanModel(PricingModel):
+    vectorized = True
+
+    def calculate(self, S, K, T, r, sigma, option_type='put', q=0.0, **kwargs):
+        S, K, T, r, sigma, q, option_type = broadcast_arrays(S, K, T, r, sigma, q, option_type)
+        price, european, _, _ = self._price(S, K, T, r, sigma, option_type, q, **kwargs)
+
+        return {
+            'price': price,
+            'european_price': european,
+            'method': 'analytic',
+            'approximation': kwargs.get('approximation', 'bjerksund_stensland'),
+            'option_style': 'american'
+        }
+
+    def calculate_greeks(self, S, K, T, r, sigma, option_type='put', q=0.0, **kwargs):
+        S, K, T, r, sigma, q, option_type = broadcast_arrays(S, K, T, r, sigma, q, option_type)
+        base_price, _, delta, gamma = self._price(S, K, T, r, sigma, option_type, q, derivatives=True, **kwargs)
+        price = lambda **bumped: self.calculate(
+            **{'S': S, 'K': K, 'T': T, 'r': r, 'sigma': sigma, 'q': q, **bumped}, option_type=option_type, **kwargs
+        )['price']
+
+        h_sigma = 1e-4
+        h_r = 1e-5
+        bump_T = 1 / 365
+
+        return {
+            'price': base_price,
+            'delta': delta,
+            'gamma': gamma,
+            'vega': (price(sigma=sigma + h_sigma) - price(sigma=np.maximum(sigma - h_sigma, 1e-8))) / (2 * h_sigma),
+            'theta': price(T=np.maximum(T - bump_T, 0.0)) - base_price,
+            'rho': (price(r=r + h_r) - price(r=r - h_r)) / (2 * h_r)
+        }
+
+    def _price(self, S, K, T, r, sigma, option_type, q, derivatives=False, **kwargs):
+        approximation = kwargs.get('approximation', 'bjerksund_stensland')
+        if approximation not in APPROXIMATIONS:
+            raise ValueError(f"Unsupported approximation: {approximation}. Supported: {list(APPROXIMATIONS)}")
+
+        bs_model = BlackScholesModel()
+        european = bs_model.calculate(S, K, T, r, sigma, option_type, q)['price']
+        european_values = np.stack([european, np.zeros(S.shape), np.zeros(S.shape)])
+        if derivatives:
+            bs_greeks = bs_model.calculate_greeks(S, K, T, r, sigma, option_type, q)
+            european_values[1], european_values[2] = bs_greeks['delta'], bs_greeks['gamma']
+        values = european_values.copy()
+
+        is_call = option_type == 'call'
+        b = r - q
+        early = (T > 0) & np.where(is_call, b < r, r > 0)
+
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            if approximation == 'bjerksund_stensland':
+                calls = early & is_call
+                values[:, calls] = self._bs2002_call(S[calls], K[calls], T[calls], r[calls], b[calls], sigma[calls])
+                # Puts use the transformation P(S, K) = C(K, S); homogeneity of degree one in (S, K)
+                # turns the call's spot derivatives into the put's.
+                puts = early & ~is_call
+                call, call_delta, call_gamma = self._bs2002_call(K[puts], S[puts], T[puts], q[puts], -b[puts], sigma[puts])
+                values[:, puts] = call, (call - K[puts] * call_delta) / S[puts], K[puts]**2 * call_gamma / S[puts]**2
+            else:
+                values[:, early] = self._baw(
+                    S[early], K[early], T[early], r[early], b[early], sigma[early], is_call[early],
+                    european_values[:, early], kwargs.get('tolerance', 1e-8), kwargs.get('max_iterations', 100)
+                )
+
+        intrinsic = np.where(is_call, np.maximum(S - K, 0), np.maximum(K - S, 0))
+        continuation = np.fmax(values[0], european)
+        price = np.fmax(continuation, intrinsic)
+        if not derivatives:
+            return price, european, None, None
+
+        below_european = ~(values[0] >= european)
+        delta = np.where(below_european, european_values[1], values[1])
+        gamma = np.where(below_european, european_values[2], values[2])
+        exercised = intrinsic > continuation
+        delta = np.where(exercised, np.where(is_call, 1.0, -1.0), delta)
+        gamma = np.where(exercised, 0.0, gamma)
+        return price, european, delta, gamma
+
+    def _bs2002_call(self, S, K, T, r, b, sigma):
+        if S.size == 0:
+            return np.zeros((3, 0))
+
+        variance = sigma**2
+        beta = (0.5 - b / variance) + np.sqrt((b / variance - 0.5)**2 + 2 * r / variance)
+        B_inf = beta / (beta - 1) * K
+        B_0 = np.maximum(K, r / np.maximum(r - b, 1e-300) * K)
+
+        t1 = 0.5 * (np.sqrt(5) - 1) * T
+        spread = K**2 / ((B_inf - B_0) * B_0)
+        h1 = -(b * t1 + 2 * sigma * np.sqrt(t1)) * spread
+        h2 = -(b * T + 2 * sigma * np.sqrt(T)) * spread
+        I1 = B_0 + (B_inf - B_0) * (1 - np.exp(h1))
+        I2 = B_0 + (B_inf - B_0) * (1 - np.exp(h2))
+        alpha1 = (I1 - K) * I1**(-beta)
+        alpha2 = (I2 - K) * I2**(-beta)
+
+        phi = lambda gamma, H, I, t: self._phi(S, t, gamma, H, I, r, b, sigma)
+        psi = lambda gamma, H: self._psi(S, T, gamma, H, I2, I1, t1, r, b, sigma)
+        one, zero = np.ones_like(S), np.zeros_like(S)
+
+        log_values = (
+            _log_derivatives(alpha2 * S**beta, beta, (one, zero, zero)) - alpha2 * phi(beta, I2, I2, t1)
+            + phi(one, I2, I2, t1) - phi(one, I1, I2, t1)
+            - K * phi(zero, I2, I2, t1) + K * phi(zero, I1, I2, t1)
+            + alpha1 * phi(beta, I1, I2, t1) - alpha1 * psi(beta, I1)
+            + psi(one, I1) - psi(one, K)
+            - K * psi(zero, I1) + K * psi(zero, K)
+        )
+        price, d_log, d2_log = log_values
+        values = np.stack([price, d_log / S, (d2_log - d_log) / S**2])
+        return np.where(S >= I2, np.stack([S - K, one, zero]), values)
+
+    def _phi(self, S, T, gamma, H, I, r, b, sigma):
+        sig_sqrt_T = sigma * np.sqrt(T)
+        lam = (-r + gamma * b + 0.5 * gamma * (gamma - 1) * sigma**2) * T
+        d = -(np.log(S / H) + (b + (gamma - 0.5) * sigma**2) * T) / sig_sqrt_T
+        kappa = 2 * b / sigma**2 + (2 * gamma - 1)
+        return np.exp(lam) * (
+            _log_derivatives(S**gamma, gamma, _normal_terms(d, -1 / sig_sqrt_T))
+            - _log_derivatives(S**gamma * (I / S)**kappa, gamma - kappa,
+                               _normal_terms(d - 2 * np.log(I / S) / sig_sqrt_T, 1 / sig_sqrt_T))
+        )
+
+    def _psi(self, S, T, gamma, H, I2, I1, t1, r, b, sigma):
+        drift = b + (gamma - 0.5) * sigma**2
+        sig_sqrt_t1 = sigma * np.sqrt(t1)
+        sig_sqrt_T = sigma * np.sqrt(T)
+
+        e1 = (np.log(S / I1) + drift * t1) / sig_sqrt_t1
+        e2 = (np.log(I2**2 / (S * I1)) + drift * t1) / sig_sqrt_t1
+        e3 = (np.log(S / I1) - drift * t1) / sig_sqrt_t1
+        e4 = (np.log(I2**2 / (S * I1)) - drift * t1) / sig_sqrt_t1
+        f1 = (np.log(S / H) + drift * T) / sig_sqrt_T
+        f2 = (np.log(I2**2 / (S * H)) + drift * T) / sig_sqrt_T
+        f3 = (np.log(I1**2 / (S * H)) + drift * T) / sig_sqrt_T
+        f4 = (np.log(S * I1**2 / (H * I2**2)) + drift * T) / sig_sqrt_T
+
+        rho = np.sqrt(t1 / T)
+        lam = -r + gamma * b + 0.5 * gamma * (gamma - 1) * sigma**2
+        kappa = 2 * b / sigma**2 + (2 * gamma - 1)
+        u1, u = 1 / sig_sqrt_t1, 1 / sig_sqrt_T
+
+        return np.exp(lam * T) * (
+            _log_derivatives(S**gamma, gamma, _bivariate_terms(-e1, -f1, rho, -u1, -u))
+            - _log_derivatives(S**gamma * (I2 / S)**kappa, gamma - kappa, _bivariate_terms(-e2, -f2, rho, u1, u))
+            - _log_derivatives(S**gamma * (I1 / S)**kappa, gamma - kappa, _bivariate_terms(-e3, -f3, -rho, -u1, u))
+            + _log_derivatives(S**gamma * (I1 / I2)**kappa, gamma, _bivariate_terms(-e4, -f4, -rho, u1, -u))
+        )
+
+    def _baw(self, S, K, T, r, b, sigma, is_call, european, tolerance, max_iterations):
+        if S.size == 0:
+            return np.zeros((3, 0))
+
+        sign = np.where(is_call, 1.0, -1.0)
+        sig_sqrt_T = sigma * np.sqrt(T)
+        carry = np.exp((b - r) * T)
+        N = 2 * b / sigma**2
+        M = 2 * r / sigma**2
+
+        q_exponent = 0.5 * (-(N - 1) + sign * np.sqrt((N - 1)**2 + 4 * M / (1 - np.exp(-r * T))))
+        q_infinite = 0.5 * (-(N - 1) + sign * np.sqrt((N - 1)**2 + 4 * M))
+        S_infinite = K / (1 - 1 / q_infinite)
+        h = np.where(
+            is_call,
+            -(b * T + 2 * sig_sqrt_T) * K / (S_infinite - K),
+            (b * T - 2 * sig_sqrt_T) * K / (K - S_infinite)
+        )
+        critical = np.where(is_call, K + (S_infinite - K) * (1 - np.exp(h)), S_infinite + (K - S_infinite) * np.exp(h))
+
+        option_type = np.where(is_call, 'call', 'put')
+        bs_model = BlackScholesModel()
+        active = np.ones(S.shape, dtype=bool)
+        for _ in range(max_iterations):
+            idx = np.flatnonzero(active)
+            if len(idx) == 0:
+                break
+            Si = critical[idx]
+            s, k, t, rr, bb, sig = sign[idx], K[idx], T[idx], r[idx], b[idx], sigma[idx]
+            value = bs_model.calculate(Si, k, t, rr, sig, option_type[idx], rr - bb)['price']
+            d1 = (np.log(Si / k) + (bb + 0.5 * sig**2) * t) / sig_sqrt_T[idx]
+            n_d1 = norm.cdf(s * d1)
+
+            lhs = s * (Si - k)
+            rhs = value + s * (1 - carry[idx] * n_d1) * Si / q_exponent[idx]
+            slope = (s * carry[idx] * n_d1 * (1 - 1 / q_exponent[idx])
+                     + s * (1 - s * carry[idx] * norm.pdf(d1) / sig_sqrt_T[idx]) / q_exponent[idx])
+
+            converged = np.abs(lhs - rhs) / k < tolerance
+            active[idx[converged]] = False
+            update = ~converged
+            critical[idx[update]] = ((s * k + rhs - slope * Si) / (s - slope))[update]
+
+        d1 = (np.log(critical / K) + (b + 0.5 * sigma**2) * T) / sig_sqrt_T
+        A = sign * critical / q_exponent * (1 - carry * norm.cdf(sign * d1))
+        premium = A * (S / critical)**q_exponent
+        exercise = np.where(is_call, S >= critical, S <= critical)
+        continuation = european + np.stack([premium, premium * q_exponent / S, premium * q_exponent * (q_exponent - 1) / S**2])
+        return np.where(exercise, np.stack([sign * (S - K), sign, np.zeros(S.shape)]), continuation)
@@ -1,11 +1,20 @@
+import numpy as np
 from abc import ABC, abstractmethod
+from ..utils.contract_batch import ContractBatch, CONTRACT_COLUMNS
+from ..utils.broadcasting import broadcast_params
+from ..utils.stochastic_processes.path_cache import PathCache
 
 class PricingModel(ABC):
+    vectorized = False
+
     @abstractmethod
     def calculate(self, S, K, T, r, sigma, option_type, **kwargs):
         pass
 
     def calculate_greeks(self, S, K, T, r, sigma, option_type, **kwargs):
+        if kwargs.get('seed', None) is not None and kwargs.get('path_cache', None) is None:
+            kwargs['path_cache'] = PathCache(max_entries=1)
+
         base_price = self.calculate(S, K, T, r, sigma, option_type, **kwargs)['price']
         
         bump_S = 1.0
@@ -19,7 +28,7 @@ class PricingModel(ABC):
         vega = (price_vega - base_price) / bump_sigma
         
         bump_T = 1/365
-        price_theta = self.calculate(S, K, max(T - bump_T, 1e-6), r, sigma, option_type, **kwargs)['price']
+        price_theta = self.calculate(S, K, np.maximum(T - bump_T, 1e-6), r, sigma, option_type, **kwargs)['price']
         theta = price_theta - base_price
       
         bump_r = 0.01
@@ -33,4 +42,46 @@ class PricingModel(ABC):
             'vega': vega,
             'theta': theta,
             'rho': rho
-        }
\ No newline at end of file
+        }
+
+    def calculate_batch(self, batch, **kwargs):
+        return self._evaluate_batch(self.calculate, batch, kwargs)
+
+    def calculate_greeks_batch(self, batch, **kwargs):
+        return self._evaluate_batch(self.calculate_greeks, batch, kwargs)
+
+    def _evaluate_batch(self, func, batch, kwargs):
+        inputs = batch.model_inputs() if isinstance(batch, ContractBatch) else dict(batch)
+        for key in [k for k in kwargs if k in CONTRACT_COLUMNS]:
+            inputs[key] = kwargs.pop(key)
+        inputs = broadcast_params(inputs)
+
+        if self.vectorized:
+            return func(**inputs, **kwargs)
+
+        shape = inputs['S'].shape
+        executor = kwargs.pop('executor', None)
+        if executor is not None:
+            columns = {k: v.ravel() for k, v in inputs.items()}
+            rows = executor.map_rows(self, func.__name__, columns, kwargs)
+        else:
+            rows = [
+                func(**{k: v[index] for k, v in inputs.items()}, **kwargs)
+                for index in np.ndindex(shape)
+            ]
+        return self._merge_rows(rows, shape)
+
+    def _merge_rows(self, rows, shape):
+        merged = {}
+        for key, value in rows[0].items():
+            values = [row[key] for row in rows]
+            if isinstance(value, (np.ndarray, float, int, np.number)) and not isinstance(value, bool):
+                merged[key] = np.array([np.asarray(v).item() for v in values]).reshape(shape)
+            elif isinstance(value, (str, bool, type(None))) and all(v == value for v in values):
+                merged[key] = value
+            else:
+                column = np.empty(len(values), dtype=object)
+                for i, v in enumerate(values):
+                    column[i] = v
+                merged[key] = column.reshape(shape)
+        return merged
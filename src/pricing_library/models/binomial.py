@@ -19,6 +19,12 @@ class BinomialModel(PricingModel):
             price = self._price_european(stock_tree, K, option_type, p, discount_factor, n_steps)
         elif option_style == 'american':
             price = self._price_american(stock_tree, K, option_type, p, discount_factor, n_steps)
+        elif option_style == 'bermudan':
+            exercise_dates = kwargs.get('exercise_dates', None)
+            if exercise_dates is None:
+                raise ValueError("exercise_dates are required for bermudan options")
+            exercise_steps = set(np.rint(np.ravel(exercise_dates) * n_steps / T).astype(int).tolist())
+            price = self._price_american(stock_tree, K, option_type, p, discount_factor, n_steps, exercise_steps)
         else:
             raise ValueError(f'Unsupported option style: {option_style}')
         
@@ -50,7 +56,7 @@ class BinomialModel(PricingModel):
         
         return option_values[0]
     
-    def _price_american(self, stock_tree, K, option_type, p, discount_factor, n_steps):
+    def _price_american(self, stock_tree, K, option_type, p, discount_factor, n_steps, exercise_steps=None):
         option_tree = np.zeros_like(stock_tree)
         option_tree[:, n_steps] = european_payoff(stock_tree[:, n_steps], K, option_type)
         
@@ -59,6 +65,9 @@ class BinomialModel(PricingModel):
                 continuation = discount_factor * (
                     p * option_tree[node, step + 1] + (1 - p) * option_tree[node + 1, step + 1]
                 )
+                if exercise_steps is not None and step not in exercise_steps:
+                    option_tree[node, step] = continuation
+                    continue
                 exercise = european_payoff(np.array([stock_tree[node, step]]), K, option_type)[0]
                 option_tree[node, step] = max(continuation, exercise)
         
@@ -1,18 +1,15 @@
 import numpy as np
 from scipy.stats import norm
 from .base_model import PricingModel
+from ..utils.broadcasting import broadcast_arrays
 
 class BlackScholesModel(PricingModel):
+    vectorized = True
+
     def calculate(self, S, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
-        S = np.atleast_1d(S).astype(float)
-        K = np.atleast_1d(K).astype(float)
-        T = np.atleast_1d(T).astype(float)
-        r = np.atleast_1d(r).astype(float)
-        sigma = np.atleast_1d(sigma).astype(float)
-        q = np.atleast_1d(q).astype(float)
-        option_type = np.atleast_1d(option_type)
+        S, K, T, r, sigma, q, option_type = broadcast_arrays(S, K, T, r, sigma, q, option_type)
 
-        price = np.zeros_like(S)
+        price = np.zeros(S.shape)
         expired = T <= 0
         alive = ~expired
 
@@ -37,20 +34,13 @@ class BlackScholesModel(PricingModel):
         }
 
     def calculate_greeks(self, S, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
-        S = np.atleast_1d(S).astype(float)
-        K = np.atleast_1d(K).astype(float)
-        T = np.atleast_1d(T).astype(float)
-        r = np.atleast_1d(r).astype(float)
-        sigma = np.atleast_1d(sigma).astype(float)
-        q = np.atleast_1d(q).astype(float)
-        option_type = np.atleast_1d(option_type)
+        S, K, T, r, sigma, q, option_type = broadcast_arrays(S, K, T, r, sigma, q, option_type)
 
-        n = len(S)
-        delta = np.zeros(n)
-        gamma = np.zeros(n)
-        vega = np.zeros(n)
-        theta = np.zeros(n)
-        rho = np.zeros(n)
+        delta = np.zeros(S.shape)
+        gamma = np.zeros(S.shape)
+        vega = np.zeros(S.shape)
+        theta = np.zeros(S.shape)
+        rho = np.zeros(S.shape)
 
         expired = T <= 0
         alive = ~expired
@@ -2,95 +2,90 @@ import numpy as np
 from scipy.stats import norm
 from .black_scholes import BlackScholesModel
 from .base_model import PricingModel
+from ..utils.broadcasting import broadcast_arrays
 
 
 class BlackScholesBarrierModel(PricingModel):
+    vectorized = True
 
     def calculate(self, S, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
         barrier_type = kwargs.get('barrier_type', 'down-and-out')
         barrier_level = kwargs.get('barrier_level', 0)
-        q = kwargs.get('q', 0)
 
         if barrier_type is None:
             raise ValueError("barrier_type is required for barrier options")
         if barrier_level is None:
             raise ValueError("barrier_level is required for barrier options")
 
-        bs_model = BlackScholesModel()
-        vanilla_price = bs_model.calculate(S, K, T, r, sigma, option_type)['price']
+        S, K, T, r, sigma, q, H, option_type, barrier_type = broadcast_arrays(
+            S, K, T, r, sigma, q, barrier_level, option_type, barrier_type
+        )
+        valid_types = np.isin(barrier_type, ["down-and-out", "down-and-in", "up-and-out", "up-and-in"])
+        if not np.all(valid_types):
+            raise ValueError(f"Invalid barrier_type: {np.unique(barrier_type[~valid_types])}")
+
+        is_call = option_type == "call"
+        is_down = np.char.startswith(barrier_type, "down")
+        is_in = np.char.endswith(barrier_type, "-in")
+        breached = np.where(is_down, S <= H, S >= H)
+
+        vanilla_price = BlackScholesModel().calculate(S, K, T, r, sigma, option_type, q)['price']
+
+        expired = T <= 0
+        T = np.where(expired, 1.0, T)
+        sqrt_T = np.sqrt(T)
+        sig_sqrt_T = sigma * sqrt_T
+        df_q = np.exp(-q * T)
+        df_r = np.exp(-r * T)
 
         lambda_param = (r - q + 0.5 * sigma**2) / sigma**2
-        y = np.log(barrier_level**2 / (S * K)) / (sigma * np.sqrt(T)) + lambda_param * sigma * np.sqrt(T)
-        x1 = np.log(S / barrier_level) / (sigma * np.sqrt(T)) + lambda_param * sigma * np.sqrt(T)
-        y1 = np.log(barrier_level / S) / (sigma * np.sqrt(T)) + lambda_param * sigma * np.sqrt(T)
+        y = np.log(H**2 / (S * K)) / sig_sqrt_T + lambda_param * sig_sqrt_T
+        x1 = np.log(S / H) / sig_sqrt_T + lambda_param * sig_sqrt_T
+        y1 = np.log(H / S) / sig_sqrt_T + lambda_param * sig_sqrt_T
+        ratio_S = (H / S)**(2 * lambda_param)
+        ratio_K = (H / S)**(2 * lambda_param - 2)
 
-        if option_type == "call":
-            if barrier_type in ["down-and-in", "down-and-out"]:
-                if S > barrier_level:
-                    if barrier_level <= K:
-                        price_di = S * np.exp(-q * T) * (barrier_level / S)**(2 * lambda_param) * norm.cdf(y) - K * np.exp(
-                            -r * T) * (barrier_level / S)**(2 * lambda_param - 2) * norm.cdf(y - sigma * np.sqrt(T))
-                        price_do = vanilla_price - price_di
+        call_di = S * df_q * ratio_S * norm.cdf(y) - K * df_r * ratio_K * norm.cdf(y - sig_sqrt_T)
+        call_do = (S * norm.cdf(x1) * df_q - K * df_r * norm.cdf(x1 - sig_sqrt_T)
+                   - S * df_q * ratio_S * norm.cdf(y1) + K * df_r * ratio_K * norm.cdf(y1 - sig_sqrt_T))
+        call_ui = (S * norm.cdf(x1) * df_q - K * df_r * norm.cdf(x1 - sig_sqrt_T)
+                   - S * df_q * ratio_S * (norm.cdf(-y) - norm.cdf(-y1))
+                   + K * df_r * ratio_K * (norm.cdf(-y + sig_sqrt_T) - norm.cdf(-y1 + sig_sqrt_T)))
+        put_ui = -S * df_q * ratio_S * norm.cdf(-y) + K * df_r * ratio_K * norm.cdf(-y + sig_sqrt_T)
+        put_uo = (-S * norm.cdf(-x1) * df_q + K * df_r * norm.cdf(-x1 + sig_sqrt_T)
+                  + S * df_q * ratio_S * norm.cdf(-y1) - K * df_r * ratio_K * norm.cdf(-y1 + sig_sqrt_T))
+        put_di = (-S * norm.cdf(-x1) * df_q + K * df_r * norm.cdf(-x1 + sig_sqrt_T)
+                  + S * df_q * ratio_S * (norm.cdf(y) - norm.cdf(y1))
+                  - K * df_r * ratio_K * (norm.cdf(y - sig_sqrt_T) - norm.cdf(y1 - sig_sqrt_T)))
 
-                    else:
-                        price_do = S * norm.cdf(x1) * np.exp(-q * T) - K * np.exp(-r * T) * norm.cdf(
-                            x1 - sigma * np.sqrt(T)) - S * np.exp(-q * T) * (barrier_level / S)**(2 * lambda_param) * norm.cdf(
-                            y1) + K * np.exp(-r * T) * (barrier_level / S)**(2 * lambda_param - 2) * norm.cdf(y1 - sigma * np.sqrt(T))
-                        price_di = vanilla_price - price_do
-                else:
-                    price_do = 0
-                    price_di = vanilla_price
-                final_price = price_do if barrier_type == "down-and-out" else price_di
-            if barrier_type in ["up-and-out", "up-and-in"]:
-                if S < barrier_level:
-                    if barrier_level <= K:
-                        price_uo = 0
-                        price_ui = vanilla_price
-                    else:
-                        price_ui = S * norm.cdf(x1) * np.exp(-q * T) - K * np.exp(-r * T) * norm.cdf(
-                            x1 - sigma * np.sqrt(T)) - S * np.exp(-q * T) * (barrier_level / S)**(2 * lambda_param) * (
-                            norm.cdf(-y) - norm.cdf(-y1)) + K * np.exp(-r * T) * (barrier_level / S)**(2 * lambda_param - 2) * (
-                            norm.cdf(-y + sigma * np.sqrt(T)) - norm.cdf(-y1 + sigma * np.sqrt(T)))
-                        price_uo = vanilla_price - price_ui
-                else:
-                    price_uo = 0
-                    price_ui = vanilla_price
-                final_price = price_uo if barrier_type == "up-and-out" else price_ui
-        if option_type == "put":
-            if barrier_type in ["up-and-out", "up-and-in"]:
-                if S < barrier_level:
-                    if barrier_level >= K:
-                        price_ui = -S * np.exp(-q * T) * (barrier_level / S)**(2 * lambda_param) * norm.cdf(-y) + K * np.exp(
-                            -r * T) * (barrier_level / S)**(2 * lambda_param - 2) * norm.cdf(-y + sigma * np.sqrt(T))
-                        price_uo = vanilla_price - price_ui
-                    else:
-                        price_uo = -S * norm.cdf(-x1) * np.exp(-q * T) + K * np.exp(-r * T) * norm.cdf(
-                            -x1 + sigma * np.sqrt(T)) + S * np.exp(-q * T) * (barrier_level / S)**(2 * lambda_param) * norm.cdf(
-                            -y1) - K * np.exp(-r * T) * (barrier_level / S) ** (2 * lambda_param - 2) * norm.cdf(-y1 + sigma * np.sqrt(T))
-                        price_ui = vanilla_price - price_uo
-                else:
-                    price_uo = 0
-                    price_ui = vanilla_price
-                final_price = price_uo if barrier_type == "up-and-out" else price_ui   
-            if barrier_type in ["down-and-out", "down-and-in"]:
-                if S > barrier_level:  
-                    if barrier_level > K:
-                        price_do = 0
-                        price_di = vanilla_price
-                    else:
-                        price_di = -S * norm.cdf(-x1) * np.exp(-q * T) + K * np.exp(-r * T) * norm.cdf(
-                            -x1 + sigma * np.sqrt(T)) + S * np.exp(-q * T) * (barrier_level / S)**(2 * lambda_param) * (
-                            norm.cdf(y) - norm.cdf(y1)) - K * np.exp(-r * T) * (barrier_level / S)**(2 * lambda_param - 2) * (
-                            norm.cdf(y - sigma * np.sqrt(T)) - norm.cdf(y1 - sigma * np.sqrt(T)))
-                        price_do = vanilla_price - price_di
-                else: 
-                    price_do = 0
-                    price_di = vanilla_price
-                final_price = price_do if barrier_type == "down-and-out" else price_di
+        knock_out_price = np.select(
+            [
+                breached,
+                is_call & is_down & (H <= K),
+                is_call & is_down,
+                is_call & (H <= K),
+                is_call,
+                ~is_down & (H >= K),
+                ~is_down,
+                H > K
+            ],
+            [
+                0.0,
+                vanilla_price - call_di,
+                call_do,
+                0.0,
+                vanilla_price - call_ui,
+                vanilla_price - put_ui,
+                put_uo,
+                0.0
+            ],
+            default=vanilla_price - put_di
+        )
+        knock_out_price = np.where(expired, vanilla_price * ~breached, knock_out_price)
+        final_price = np.where(is_in, vanilla_price - knock_out_price, knock_out_price)
 
         return {
             'price': final_price,
             'method': 'black_scholes',
             'option_style': 'barrier'
         }
-        
\ No newline at end of file
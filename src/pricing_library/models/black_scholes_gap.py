@@ -2,23 +2,18 @@ import numpy as np
 from scipy.stats import norm
 from .base_model import PricingModel
 from ..utils import gap_payoff
+from ..utils.broadcasting import broadcast_arrays
 
 class BlackScholesGapModel(PricingModel):
-    
+    vectorized = True
+
     def calculate(self, S, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
         K1 = kwargs.get('K1', K)
         K2 = kwargs.get('K2', K)
 
-        S = np.atleast_1d(S).astype(float)
-        K1 = np.atleast_1d(K1).astype(float)
-        K2 = np.atleast_1d(K2).astype(float)
-        T = np.atleast_1d(T).astype(float)
-        r = np.atleast_1d(r).astype(float)
-        sigma = np.atleast_1d(sigma).astype(float)
-        q = np.atleast_1d(q).astype(float)
-        option_type = np.atleast_1d(option_type)
+        S, K1, K2, T, r, sigma, q, option_type = broadcast_arrays(S, K1, K2, T, r, sigma, q, option_type)
 
-        price = np.zeros_like(S, dtype=float)
+        price = np.zeros(S.shape)
         expired = T <= 0
         alive = ~expired
 
@@ -44,20 +39,13 @@ class BlackScholesGapModel(PricingModel):
         K1 = kwargs.get('K1', K)
         K2 = kwargs.get('K2', K)
 
-        S = np.atleast_1d(S).astype(float)
-        K1 = np.atleast_1d(K1).astype(float)
-        K2 = np.atleast_1d(K2).astype(float)
-        T = np.atleast_1d(T).astype(float)
-        r = np.atleast_1d(r).astype(float)
-        sigma = np.atleast_1d(sigma).astype(float)
-        q = np.atleast_1d(q).astype(float)
-        option_type = np.atleast_1d(option_type)
+        S, K1, K2, T, r, sigma, q, option_type = broadcast_arrays(S, K1, K2, T, r, sigma, q, option_type)
 
-        delta = np.zeros_like(S)
-        gamma = np.zeros_like(S)
-        vega = np.zeros_like(S)
-        theta = np.zeros_like(S)
-        rho = np.zeros_like(S)
+        delta = np.zeros(S.shape)
+        gamma = np.zeros(S.shape)
+        vega = np.zeros(S.shape)
+        theta = np.zeros(S.shape)
+        rho = np.zeros(S.shape)
 
         expired = T <= 0
         alive = ~expired
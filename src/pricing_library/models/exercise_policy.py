@@ -0,0 +1,96 @@
+import json
+import numpy as np
+from ..utils.payoff import intrinsic_value
+from ..utils.regression import get_regressor
+
+class ExercisePolicy:
+    def __init__(self, K, T, r, option_type, n_steps, regression_type, regression_degree,
+                 exercise_steps, coefficients, domains, boundary=None):
+        self.K = float(K)
+        self.T = float(T)
+        self.r = float(r)
+        self.option_type = str(option_type)
+        self.n_steps = int(n_steps)
+        self.regression_type = regression_type
+        self.regression_degree = int(regression_degree)
+        self.exercise_steps = np.asarray(exercise_steps, dtype=np.int64)
+        self.coefficients = [None if beta is None else np.asarray(beta, dtype=np.float64) for beta in coefficients]
+        self.domains = [None if domain is None else tuple(domain) for domain in domains]
+        self.boundary = np.full(len(self.exercise_steps), np.nan) if boundary is None else np.asarray(boundary, dtype=np.float64)
+        self._regressor = get_regressor(regression_type, degree=self.regression_degree)
+
+    @property
+    def exercise_times(self):
+        return self.exercise_steps * self.T / self.n_steps
+
+    def continuation(self, i, S):
+        if self.coefficients[i] is None:
+            return np.full(np.shape(S), np.inf)
+        return self._regressor.predict(np.asarray(S) / self.K, {'beta': self.coefficients[i], 'domain': self.domains[i]})
+
+    def exercise(self, i, S):
+        S = np.asarray(S, dtype=np.float64)
+        exercise_value = intrinsic_value(S, self.K, self.option_type)
+        decision = exercise_value > 0
+        if np.any(decision):
+            decision[decision] = exercise_value[decision] > self.continuation(i, S[decision])
+        return decision
+
+    def evaluate(self, paths, rates=None):
+        num_paths, num_points = paths.shape
+        if num_points != self.n_steps + 1:
+            raise ValueError(f"Policy was fitted on {self.n_steps} steps, paths have {num_points - 1}")
+
+        rates = np.broadcast_to(self.r if rates is None else rates, (self.n_steps,))
+        log_discount = np.concatenate([[0.0], np.cumsum(rates * self.T / self.n_steps)])
+        values = intrinsic_value(paths[:, -1], self.K, self.option_type) * np.exp(-log_discount[-1])
+        alive = np.ones(num_paths, dtype=bool)
+        for i, step in enumerate(self.exercise_steps):
+            if step >= self.n_steps or not np.any(alive):
+                continue
+            index = np.flatnonzero(alive)
+            S = paths[index, step]
+            stop = index[self.exercise(i, S)]
+            values[stop] = intrinsic_value(paths[stop, step], self.K, self.option_type) * np.exp(-log_discount[step])
+            alive[stop] = False
+
+        return np.mean(values), np.std(values) / np.sqrt(num_paths)
+
+    def compute_boundary(self, n_grid=200):
+        for i, beta in enumerate(self.coefficients):
+            if beta is None:
+                continue
+            lo, hi = self.domains[i]
+            S = np.linspace(lo, hi, n_grid) * self.K
+            exercised = S[self.exercise(i, S)]
+            if len(exercised):
+                self.boundary[i] = exercised.max() if self.option_type == 'put' else exercised.min()
+        return self.boundary
+
+    def to_dict(self):
+        return {
+            'K': self.K,
+            'T': self.T,
+            'r': self.r,
+            'option_type': self.option_type,
+            'n_steps': self.n_steps,
+            'regression_type': self.regression_type,
+            'regression_degree': self.regression_degree,
+            'exercise_steps': self.exercise_steps.tolist(),
+            'coefficients': [None if beta is None else beta.tolist() for beta in self.coefficients],
+            'domains': [None if domain is None else list(domain) for domain in self.domains],
+            'boundary': [None if np.isnan(b) else float(b) for b in self.boundary]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data['boundary'] = [np.nan if b is None else b for b in data.get('boundary') or []] or None
+        return cls(**data)
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
@@ -1,6 +1,7 @@
 import numpy as np
 from .black_scholes import BlackScholesModel
 from scipy.stats import norm
+from ..utils.broadcasting import broadcast_arrays
 
 class ImpliedVolatility:
 
@@ -50,3 +51,104 @@ class ImpliedVolatility:
                 return guess
 
         return guess
+
+    @staticmethod
+    def calculate_batch(params, max_iterations=100, tol=1e-8, vol_bounds=(1e-6, 5.0)):
+        S, K, T, r, q, option_type, market_price = broadcast_arrays(
+            params['S'], params['K'], params['T'], params['r'], params.get('q', 0.0),
+            params.get('option_type', 'call'), params['price']
+        )
+        shape = S.shape
+        S, K, T, r, q, option_type, market_price = (x.ravel() for x in (S, K, T, r, q, option_type, market_price))
+        bs_model = BlackScholesModel()
+        price = lambda sigma, i: bs_model.calculate(S[i], K[i], T[i], r[i], sigma, option_type[i], q[i])['price']
+
+        def vega(sigma, i, value):
+            d1 = (np.log(S[i] / K[i]) + (r[i] - q[i] + 0.5 * sigma**2) * T[i]) / (sigma * np.sqrt(T[i]))
+            return S[i] * np.exp(-q[i] * T[i]) * norm.pdf(d1) * np.sqrt(T[i])
+
+        return _solve_volatility(price, vega, market_price, np.full(shape, 0.2), vol_bounds, tol, max_iterations)[0]
+
+class AmericanImpliedVolatility:
+
+    @staticmethod
+    def calculate(params, mode='direct', model=None, max_iterations=50, tol=1e-8, vol_bounds=(1e-4, 5.0), **model_kwargs):
+        if mode not in ('direct', 'deamericanize'):
+            raise ValueError("mode must be 'direct' or 'deamericanize'")
+
+        S, K, T, r, q, option_type, market_price = broadcast_arrays(
+            params['S'], params['K'], params['T'], params['r'], params.get('q', 0.0),
+            params.get('option_type', 'put'), params['price']
+        )
+        if model is None:
+            from .american_analytic import AnalyticAmericanModel
+            model = AnalyticAmericanModel()
+
+        price = lambda sigma, i: model.calculate(S[i], K[i], T[i], r[i], sigma, option_type[i], q[i], **model_kwargs)['price']
+        def vega(sigma, i, value):
+            h = 1e-5 * np.maximum(sigma, 1e-2)
+            return (price(sigma + h, i) - value) / h
+
+        guess = ImpliedVolatility.calculate_batch(
+            {'S': S, 'K': K, 'T': T, 'r': r, 'q': q, 'option_type': option_type, 'price': market_price},
+            tol=1e-6, vol_bounds=vol_bounds
+        )
+        guess = np.where(np.isfinite(guess), guess, 0.2)
+        implied_vol, iterations = _solve_volatility(price, vega, market_price, guess, vol_bounds, tol, max_iterations)
+
+        result = {
+            'implied_vol': implied_vol,
+            'iterations': iterations,
+            'converged': np.isfinite(implied_vol),
+            'mode': mode
+        }
+        if mode == 'deamericanize':
+            european_price = BlackScholesModel().calculate(S, K, T, r, np.where(np.isfinite(implied_vol), implied_vol, 0.2),
+                                                           option_type, q)['price']
+            result['european_price'] = np.where(np.isfinite(implied_vol), european_price, np.nan)
+            result['early_exercise_premium'] = market_price - result['european_price']
+        return result
+
+def _solve_volatility(price, vega, target, guess, vol_bounds, tol, max_iterations):
+    vol_min, vol_max = vol_bounds
+    index = np.arange(target.size).reshape(target.shape)
+    flat = lambda x: x.reshape(-1)
+    target, index = flat(target), flat(index)
+
+    lower = np.full(target.shape, vol_min)
+    upper = np.full(target.shape, vol_max)
+    sigma = np.clip(flat(guess).astype(np.float64), vol_min, vol_max)
+    solved = np.full(target.shape, np.nan)
+    iterations = np.zeros(target.shape, dtype=np.int64)
+
+    bounds_price = price(np.concatenate([lower, upper]), np.concatenate([index, index]))
+    active = (target >= bounds_price[:target.size] - tol) & (target <= bounds_price[target.size:] + tol)
+
+    for _ in range(max_iterations):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        iterations[idx] += 1
+        s = sigma[idx]
+        value = price(s, index[idx])
+        diff = value - target[idx]
+
+        converged = np.abs(diff) < tol
+        solved[idx[converged]] = s[converged]
+        active[idx[converged]] = False
+
+        keep = ~converged
+        idx, s, value, diff = idx[keep], s[keep], value[keep], diff[keep]
+        upper[idx] = np.where(diff > 0, s, upper[idx])
+        lower[idx] = np.where(diff < 0, s, lower[idx])
+
+        slope = vega(s, index[idx], value)
+        newton = s - diff / np.where(slope > 1e-12, slope, np.nan)
+        inside = np.isfinite(newton) & (newton > lower[idx]) & (newton < upper[idx])
+        sigma[idx] = np.where(inside, newton, 0.5 * (lower[idx] + upper[idx]))
+
+        narrow = upper[idx] - lower[idx] < 1e-12
+        solved[idx[narrow]] = sigma[idx[narrow]]
+        active[idx[narrow]] = False
+
+    return solved.reshape(guess.shape), iterations.reshape(guess.shape)
@@ -1,8 +1,10 @@
 import numpy as np
-from ..utils.stochastic_processes.gbm import GeometricBrownianMotion
+from ..utils.stochastic_processes import get_process, process_parameters
 from ..utils.payoff import intrinsic_value
 from ..utils.regression import get_regressor
+from ..utils.curves import step_rates
 from .base_model import PricingModel
+from .exercise_policy import ExercisePolicy
 
 class LeastSquaresMC(PricingModel):    
     def calculate(self, S, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
@@ -12,60 +14,107 @@ class LeastSquaresMC(PricingModel):
         regression_degree = kwargs.get('regression_degree', 2)
         seed = kwargs.get('seed', None)
         
-        paths = GeometricBrownianMotion.simulate(S, T, r, sigma, q, n_paths, n_steps, seed=seed)
+        r_path = step_rates(r, T, n_steps, kwargs.get('rate_curve', None))
+        q_path = step_rates(q, T, n_steps, kwargs.get('dividend_curve', None))
+        process = get_process(kwargs.get('process', 'gbm'))
+        paths = process.simulate(S, T, r_path, sigma, q_path, n_paths, n_steps, seed=seed,
+                                 path_cache=kwargs.get('path_cache', None), **process_parameters(process, kwargs))
         
-        price, std_error = self._lsm_pricing(
-            paths, K, r, T, option_type, regression_type, regression_degree
-        )
-        
-        return {
+        policy = kwargs.get('exercise_policy', None)
+        policy_cache = kwargs.get('policy_cache', None)
+        key = self.policy_key(K, T, r, sigma, option_type, q, **kwargs)
+        if policy is None and policy_cache is not None:
+            policy = policy_cache.get(key, None)
+
+        if policy is not None:
+            price, std_error = policy.evaluate(paths, r_path)
+            policy_reused = True
+        else:
+            exercise_steps = self._exercise_steps(T, n_steps, kwargs.get('exercise_dates', None))
+            price, std_error, policy = self._lsm_pricing(
+                paths, K, r, T, option_type, regression_type, regression_degree, exercise_steps, r_path
+            )
+            policy_reused = False
+            if policy_cache is not None:
+                policy_cache[key] = policy
+
+        result = {
             'price': price,
             'std_error': std_error,
             'n_paths': n_paths,
             'n_steps': n_steps,
             'method': 'least_squares_mc',
-            'option_style': 'american',
+            'option_style': 'american' if kwargs.get('exercise_dates', None) is None else 'bermudan',
             'regression_type': regression_type,
-            'regression_degree': regression_degree
+            'regression_degree': regression_degree,
+            'policy_reused': policy_reused
         }
-    
-    def _lsm_pricing(self, paths, K, r, T, option_type, regression_type, degree):
+        if kwargs.get('return_policy', False):
+            policy.compute_boundary()
+            result['policy'] = policy
+        return result
+
+    def policy_key(self, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
+        process_name = kwargs.get('process', 'gbm')
+        process_params = process_parameters(get_process(process_name), kwargs)
+        return (
+            'lsm', str(option_type), float(K), float(T), float(r), float(sigma), float(q),
+            kwargs.get('n_steps', 100), kwargs.get('regression_type', 'polynomial'), kwargs.get('regression_degree', 2),
+            process_name, tuple(sorted(process_params.items())),
+            None if kwargs.get('exercise_dates', None) is None else tuple(np.ravel(kwargs['exercise_dates']).tolist()),
+            tuple(None if kwargs.get(name, None) is None else kwargs[name].key for name in ('rate_curve', 'dividend_curve'))
+        )
+
+    def _exercise_steps(self, T, n_steps, exercise_dates=None):
+        if exercise_dates is None:
+            return np.arange(n_steps)
+
+        exercise_dates = np.ravel(np.asarray(exercise_dates, dtype=np.float64))
+        if np.any(exercise_dates < 0) or np.any(exercise_dates > T * (1 + 1e-12)):
+            raise ValueError("exercise_dates must lie between 0 and the option maturity")
+        steps = np.unique(np.rint(exercise_dates * n_steps / T).astype(np.int64))
+        return steps[steps < n_steps]
+
+    def _lsm_pricing(self, paths, K, r, T, option_type, regression_type, degree, exercise_steps=None, rates=None):
         num_paths, num_steps = paths.shape
         dt = T / (num_steps - 1)
-        discount_factor = np.exp(-r * dt)
-      
+        if exercise_steps is None:
+            exercise_steps = np.arange(num_steps - 1)
+        rates = np.broadcast_to(r if rates is None else rates, (num_steps - 1,))
+        log_discount = np.concatenate([[0.0], np.cumsum(rates * dt)])
+
         regressor = get_regressor(regression_type, degree=degree)
-        
-        exercise_values = intrinsic_value(paths, K, option_type)
-        
-        option_values = np.zeros_like(paths)
-        option_values[:, -1] = exercise_values[:, -1]  
-        
-        for t in range(num_steps - 2, -1, -1):
-            discounted_next_values = option_values[:, t + 1] * discount_factor
-            
-            itm_mask = exercise_values[:, t] > 0
-            
-            if np.any(itm_mask):
-                itm_paths = paths[itm_mask, t]
-                itm_discounted_values = discounted_next_values[itm_mask]
 
-                continuation_estimates = regressor.fit_predict(
-                    itm_paths, itm_discounted_values, itm_paths
-                )
-                exercise_decision = exercise_values[itm_mask, t] > continuation_estimates
-                
-                option_values[itm_mask, t] = np.where(
-                    exercise_decision,
-                    exercise_values[itm_mask, t],  
-                    discounted_next_values[itm_mask]  
-                )
-            
-            otm_mask = ~itm_mask
-            option_values[otm_mask, t] = discounted_next_values[otm_mask]
-        
-        price = np.mean(option_values[:, 0])
-        payoffs = option_values[:, 0]
-        std_error = np.std(payoffs) / np.sqrt(num_paths)
-        
-        return price, std_error
\ No newline at end of file
+        values = intrinsic_value(paths[:, -1], K, option_type)
+        coefficients, domains = [], []
+
+        next_step = num_steps - 1
+        for t in exercise_steps[::-1]:
+            values *= np.exp(log_discount[t] - log_discount[next_step])
+            next_step = t
+            exercise_values = intrinsic_value(paths[:, t], K, option_type)
+            itm_index = np.flatnonzero(exercise_values > 0)
+
+            beta, domain = None, None
+            if len(itm_index):
+                itm_paths = paths[itm_index, t] / K
+                fitted, design = regressor.fit_with_design(itm_paths, values[itm_index])
+                continuation_estimates = design @ fitted['beta']
+                beta = fitted['beta']
+                domain = fitted['domain'] or (float(itm_paths.min()), float(itm_paths.max()))
+
+                exercise = exercise_values[itm_index] > continuation_estimates
+                values[itm_index[exercise]] = exercise_values[itm_index[exercise]]
+
+            coefficients.append(beta)
+            domains.append(domain)
+        values *= np.exp(-log_discount[next_step])
+
+        price = np.mean(values)
+        std_error = np.std(values) / np.sqrt(num_paths)
+
+        policy = ExercisePolicy(
+            K, T, r, option_type, num_steps - 1, regression_type, degree,
+            exercise_steps, coefficients[::-1], domains[::-1]
+        )
+        return price, std_error, policy
@@ -0,0 +1,44 @@
+import numpy as np
+from scipy.stats import poisson
+from .base_model import PricingModel
+from .black_scholes import BlackScholesModel
+from ..utils.broadcasting import broadcast_arrays
+from ..utils.stochastic_processes.merton import MertonJumpDiffusion
+
+class MertonJumpDiffusionModel(PricingModel):
+    vectorized = True
+
+    def calculate(self, S, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
+        params = MertonJumpDiffusion.resolve_parameters(**kwargs)
+        lam, mu_j, delta = (params[k] for k in MertonJumpDiffusion.parameters)
+        tolerance = kwargs.get('tolerance', 1e-10)
+        max_terms = kwargs.get('max_terms', 1000)
+
+        S, K, T, r, sigma, q, option_type = broadcast_arrays(S, K, T, r, sigma, q, option_type)
+        shape = S.shape
+        S, K, T, r, sigma, q, option_type = (x.ravel() for x in (S, K, T, r, sigma, q, option_type))
+
+        compensator = MertonJumpDiffusion.compensator(mu_j, delta)
+        intensity = lam * (1 + compensator) * T
+        T_safe = np.where(T > 0, T, 1.0)
+
+        scale = S * np.exp(-q * T) + K * np.exp(-r * T)
+        tail = poisson.isf(tolerance / scale, np.maximum(intensity, 1e-300))
+        n_terms = np.minimum(np.where(intensity > 0, tail, 0), max_terms).astype(np.int64) + 1
+
+        bs_model = BlackScholesModel()
+        price = np.zeros(S.size)
+        for n in range(int(n_terms.max())):
+            active = n_terms > n
+            weight = poisson.pmf(n, intensity[active])
+            sigma_n = np.sqrt(sigma[active]**2 + n * delta**2 / T_safe[active])
+            r_n = r[active] - lam * compensator + n * np.log1p(compensator) / T_safe[active]
+            term = bs_model.calculate(S[active], K[active], T[active], r_n, sigma_n, option_type[active], q[active])['price']
+            price[active] += weight * term
+
+        return {
+            'price': price.reshape(shape),
+            'n_terms': n_terms.reshape(shape),
+            'method': 'merton',
+            'option_style': 'european'
+        }
@@ -1,6 +1,8 @@
 import numpy as np
-from ..utils.stochastic_processes.gbm import GeometricBrownianMotion
+from ..utils.stochastic_processes import get_process, process_parameters
 from ..utils.payoff import intrinsic_value, asian_payoff
+from ..utils.payoff_plan import compile_payoff
+from ..utils.curves import step_rates
 from .base_model import PricingModel
 
 class VanillaMonteCarlo(PricingModel):
@@ -18,7 +20,9 @@ class VanillaMonteCarlo(PricingModel):
             
             monitored_prices = self._simulate_asian_prices(
                 S, T, r, sigma, q, n_paths, n_steps, observed_values, 
-                monitoring_dates, t_today, seed
+                monitoring_dates, t_today, seed, kwargs.get('path_cache', None),
+                kwargs.get('process', 'gbm'), process_parameters(get_process(kwargs.get('process', 'gbm')), kwargs),
+                kwargs.get('rate_curve', None), kwargs.get('dividend_curve', None)
             )
             payoffs = asian_payoff(monitored_prices, K, option_type, averaging_type)
             price = np.exp(-r * (T - t_today)) * np.mean(payoffs)
@@ -33,7 +37,42 @@ class VanillaMonteCarlo(PricingModel):
                 'option_style': option_style
             }
 
-        paths = GeometricBrownianMotion.simulate(S, T, r, sigma, q, n_paths, n_steps, seed=seed)
+        width = None
+        if option_style == 'custom':
+            if kwargs.get('payoff', None) is None:
+                raise ValueError("payoff is required for custom options")
+            kwargs['payoff'] = compile_payoff(kwargs['payoff'])
+            width = None if kwargs['payoff'].names is None else len(kwargs['payoff'])
+
+        r_path = step_rates(r, T, n_steps, kwargs.get('rate_curve', None))
+        q_path = step_rates(q, T, n_steps, kwargs.get('dividend_curve', None))
+
+        executor = kwargs.get('executor', None)
+        if executor is not None and executor.should_split(n_paths):
+            payoffs = executor.simulate_payoffs(self, S, K, T, r_path, sigma, q_path, option_type, width=width, **kwargs)
+        else:
+            process = get_process(kwargs.get('process', 'gbm'))
+            paths = process.simulate(S, T, r_path, sigma, q_path, n_paths, n_steps, seed=seed,
+                                     path_cache=kwargs.get('path_cache', None), **process_parameters(process, kwargs))
+            payoffs = self._payoffs(paths, K, option_type, **kwargs)
+
+        price = np.exp(-r * T) * np.mean(payoffs, axis=0)
+        std_error = np.std(payoffs, axis=0) / np.sqrt(n_paths)
+
+        result = {
+            'price': price, 
+            'std_error': std_error,
+            'n_paths': n_paths,
+            'n_steps': n_steps,
+            'method': 'monte_carlo',
+            'option_style': option_style
+        }
+        if width is not None:
+            result['payoffs'] = list(kwargs['payoff'].names)
+        return result
+    
+    def _payoffs(self, paths, K, option_type='call', **kwargs):
+        option_style = kwargs.get('option_style', 'european')
         final_prices = paths[:, -1]
 
         if option_style == 'european':
@@ -73,22 +112,16 @@ class VanillaMonteCarlo(PricingModel):
             
             payoffs = intrinsic_value(final_prices, K2, option_type) * trigger_valid
         
+        elif option_style == 'custom':
+            payoffs = compile_payoff(kwargs['payoff']).evaluate(paths, **{'K': K, **kwargs.get('payoff_variables', {})})
+
         else: 
             raise ValueError(f'Unsupported option style: {option_style}')
 
-        price = np.exp(-r * T) * np.mean(payoffs)
-        std_error = np.std(payoffs) / np.sqrt(n_paths)
+        return payoffs
 
-        return {
-            'price': price, 
-            'std_error': std_error,
-            'n_paths': n_paths,
-            'n_steps': n_steps,
-            'method': 'monte_carlo',
-            'option_style': option_style
-        }
-    
-    def _simulate_asian_prices(self, S, T, r, sigma, q, n_paths, n_steps, observed_values=None, monitoring_dates=None, t_today=0.0, seed=None):
+    def _simulate_asian_prices(self, S, T, r, sigma, q, n_paths, n_steps, observed_values=None, monitoring_dates=None, t_today=0.0, seed=None, path_cache=None, process='gbm', process_params=None,
+                               rate_curve=None, dividend_curve=None):
         if monitoring_dates is None:
             monitoring_dates = np.linspace(0, T, n_steps + 1)
         elif isinstance(monitoring_dates, int):
@@ -106,7 +139,10 @@ class VanillaMonteCarlo(PricingModel):
 
         future_monitoring_dates = monitoring_dates[monitoring_dates > t_today]
         n_steps_future = int(n_steps * (T - t_today) / T)
-        paths_future = GeometricBrownianMotion.simulate(S, T - t_today, r, sigma, q, n_paths, n_steps_future, seed=seed)
+        r_path = step_rates(r, T - t_today, n_steps_future, rate_curve)
+        q_path = step_rates(q, T - t_today, n_steps_future, dividend_curve)
+        paths_future = get_process(process).simulate(S, T - t_today, r_path, sigma, q_path, n_paths, n_steps_future, seed=seed,
+                                                     path_cache=path_cache, **(process_params or {}))
         time_points_future = np.linspace(0, T - t_today, n_steps_future + 1)
 
         monitored_future_prices = np.array([np.interp(future_monitoring_dates - t_today, time_points_future, path) for path in paths_future])
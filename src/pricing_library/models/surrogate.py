@@ -0,0 +1,189 @@
+import json
+import numpy as np
+from numpy.polynomial import chebyshev
+from .base_model import PricingModel
+from ..utils.broadcasting import broadcast_arrays
+
+DIMENSIONS = ('S', 'K', 'T', 'r', 'sigma', 'q')
+POSITIVE = ('S', 'K', 'T', 'sigma')
+
+class ChebyshevSurrogate(PricingModel):
+    vectorized = True
+
+    def __init__(self, model=None, box=None, fixed=None, degree=8, executor=None, padding=0.1, auto_rebuild=True,
+                 **model_kwargs):
+        if not box:
+            raise ValueError("box must declare at least one parameter range")
+        unknown = [k for k in box if k not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unsupported surrogate dimensions: {unknown}. Supported: {list(DIMENSIONS)}")
+
+        self.model = model
+        self.dimensions = [d for d in DIMENSIONS if d in box]
+        self.box = {d: (float(box[d][0]), float(box[d][1])) for d in self.dimensions}
+        if any(lo >= hi for lo, hi in self.box.values()):
+            raise ValueError("Each box range must satisfy low < high")
+        self.degree = {d: int(degree.get(d, 8) if isinstance(degree, dict) else degree) for d in self.dimensions}
+        self.fixed = {'q': 0.0, 'option_type': 'call', **(fixed or {})}
+        for d in self.dimensions:
+            self.fixed.pop(d, None)
+        missing = [d for d in DIMENSIONS if d not in self.box and d not in self.fixed]
+        if missing:
+            raise ValueError(f"Parameters {missing} must be given either in box or in fixed")
+
+        self.executor = executor
+        self.padding = padding
+        self.auto_rebuild = auto_rebuild
+        self.model_kwargs = model_kwargs
+        self.coefficients = None
+        self.error = None
+        self.n_builds = 0
+
+    def build(self):
+        if self.model is None:
+            raise ValueError("A pricing model is required to build the surrogate")
+
+        nodes = [np.cos(np.pi * (np.arange(self.degree[d] + 1) + 0.5) / (self.degree[d] + 1)) for d in self.dimensions]
+        grids = np.meshgrid(*(self._scale(d, x) for d, x in zip(self.dimensions, nodes)), indexing='ij')
+        inputs = {d: grid.ravel() for d, grid in zip(self.dimensions, grids)}
+        inputs.update({k: np.full(grids[0].size, v) for k, v in self.fixed.items()})
+
+        kwargs = dict(self.model_kwargs)
+        if self.executor is not None:
+            kwargs['executor'] = self.executor
+        values = np.asarray(self.model.calculate_batch(inputs, **kwargs)['price'], dtype=np.float64).reshape(grids[0].shape)
+
+        coefficients = values
+        for axis, x in enumerate(nodes):
+            transform = 2.0 / len(x) * chebyshev.chebvander(x, len(x) - 1).T
+            transform[0] *= 0.5
+            coefficients = np.moveaxis(np.tensordot(transform, coefficients, axes=(1, axis)), 0, axis)
+
+        self.coefficients = coefficients
+        self.error = None
+        self.n_builds += 1
+        return self
+
+    def calculate(self, S, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
+        shape, x = self._prepare(S, K, T, r, sigma, q, option_type)
+        return {
+            'price': self._evaluate(self.coefficients, x).reshape(shape),
+            'method': 'surrogate',
+            'n_builds': self.n_builds
+        }
+
+    def calculate_greeks(self, S, K, T, r, sigma, option_type='call', q=0.0, **kwargs):
+        shape, x = self._prepare(S, K, T, r, sigma, q, option_type)
+
+        def derivative(d, order=1):
+            if d not in self.box:
+                return np.full(shape, np.nan)
+            lo, hi = self.box[d]
+            axis = self.dimensions.index(d)
+            coefficients = chebyshev.chebder(self.coefficients, m=order, scl=2.0 / (hi - lo), axis=axis)
+            return self._evaluate(coefficients, x).reshape(shape)
+
+        return {
+            'price': self._evaluate(self.coefficients, x).reshape(shape),
+            'delta': derivative('S'),
+            'gamma': derivative('S', 2),
+            'vega': derivative('sigma'),
+            'theta': -derivative('T') / 365,
+            'rho': derivative('r')
+        }
+
+    def validate(self, n_points=200, seed=None):
+        if self.coefficients is None:
+            self.build()
+        rng = np.random.default_rng(seed)
+        inputs = {d: rng.uniform(*self.box[d], n_points) for d in self.dimensions}
+        inputs.update({k: np.full(n_points, v) for k, v in self.fixed.items()})
+
+        exact = np.asarray(self.model.calculate_batch(dict(inputs), **self.model_kwargs)['price'], dtype=np.float64)
+        approx = self.calculate(**inputs)['price']
+        error = np.abs(approx - exact)
+        self.error = {
+            'max_error': float(error.max()),
+            'rms_error': float(np.sqrt(np.mean(error**2))),
+            'max_relative_error': float(np.max(error / np.maximum(np.abs(exact), 1e-8))),
+            'n_points': int(n_points)
+        }
+        return self.error
+
+    def to_dict(self):
+        if self.coefficients is None:
+            self.build()
+        return {
+            'box': {d: list(self.box[d]) for d in self.dimensions},
+            'fixed': self.fixed,
+            'degree': self.degree,
+            'padding': self.padding,
+            'coefficients': self.coefficients.tolist(),
+            'error': self.error
+        }
+
+    @classmethod
+    def from_dict(cls, data, model=None, **kwargs):
+        surrogate = cls(model, data['box'], data['fixed'], data['degree'], padding=data.get('padding', 0.1), **kwargs)
+        surrogate.coefficients = np.asarray(data['coefficients'], dtype=np.float64)
+        surrogate.error = data.get('error')
+        return surrogate
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text, model=None, **kwargs):
+        return cls.from_dict(json.loads(text), model, **kwargs)
+
+    def _prepare(self, S, K, T, r, sigma, q, option_type):
+        arrays = broadcast_arrays(S, K, T, r, sigma, q, option_type)
+        values = dict(zip(('S', 'K', 'T', 'r', 'sigma', 'q', 'option_type'), arrays))
+        fixed, box = dict(self.fixed), dict(self.box)
+        stale = self.coefficients is None
+
+        for key, current in self.fixed.items():
+            observed = np.unique(values[key])
+            if len(observed) > 1:
+                raise ValueError(f"{key} varies across queries but is fixed in the surrogate")
+            value = observed[0].item()
+            changed = value != current if key == 'option_type' else not np.isclose(value, current, rtol=1e-12, atol=1e-14)
+            if changed:
+                fixed[key] = value
+                stale = True
+
+        for d in self.dimensions:
+            lo, hi = self.box[d]
+            low, high = float(values[d].min()), float(values[d].max())
+            if low < lo or high > hi:
+                margin = self.padding * (max(hi, high) - min(lo, low))
+                lo, hi = min(lo, low - margin), max(hi, high + margin)
+                box[d] = (max(lo, 1e-8) if d in POSITIVE else lo, hi)
+                stale = True
+
+        if stale:
+            if self.coefficients is not None and not self.auto_rebuild:
+                raise ValueError("Query leaves the surrogate box and auto_rebuild is disabled")
+            self.fixed, self.box = fixed, box
+            self.build()
+
+        x = [self._unit(d, values[d].ravel()) for d in self.dimensions]
+        return values['S'].shape, x
+
+    def _scale(self, d, x):
+        lo, hi = self.box[d]
+        return lo + 0.5 * (x + 1) * (hi - lo)
+
+    def _unit(self, d, values):
+        lo, hi = self.box[d]
+        return np.clip(2 * (values - lo) / (hi - lo) - 1, -1.0, 1.0)
+
+    def _evaluate(self, coefficients, x):
+        result = coefficients
+        for axis in reversed(range(len(x))):
+            basis = chebyshev.chebvander(x[axis], result.shape[axis] - 1)
+            if axis == len(x) - 1:
+                result = result @ basis.T
+            else:
+                result = np.einsum('...an,na->...n', result, basis)
+        return result
@@ -1,14 +1,41 @@
 from .payoff import european_payoff, asian_payoff, intrinsic_value, gap_payoff
+from .payoff_plan import compile_payoff, PayoffPlan
 from .stochastic_processes.gbm import GeometricBrownianMotion
-from .regression import get_regressor, PolynomialRegression, LaguerreRegression
+from .stochastic_processes.heston import HestonProcess
+from .stochastic_processes.merton import MertonJumpDiffusion
+from .stochastic_processes import get_process
+from .stochastic_processes.path_cache import PathCache
+from .regression import (get_regressor, PolynomialRegression, LaguerreRegression, HermiteRegression,
+                         ChebyshevRegression, PiecewiseLinearRegression)
+from .curves import YieldCurve, DividendCurve, forward_price
+from .contract_batch import ContractBatch, CONTRACT_COLUMNS
+from .broadcasting import as_array, as_float_array, broadcast_arrays, broadcast_params
 
 __all__ = [
     'european_payoff',
     'asian_payoff', 
     'intrinsic_value',
     'gap_payoff',
+    'compile_payoff',
+    'PayoffPlan',
     'GeometricBrownianMotion',
+    'HestonProcess',
+    'MertonJumpDiffusion',
+    'get_process',
+    'PathCache',
     'get_regressor',
     'PolynomialRegression',
-    'LaguerreRegression'
+    'LaguerreRegression',
+    'HermiteRegression',
+    'ChebyshevRegression',
+    'PiecewiseLinearRegression',
+    'YieldCurve',
+    'DividendCurve',
+    'forward_price',
+    'ContractBatch',
+    'CONTRACT_COLUMNS',
+    'as_array',
+    'as_float_array',
+    'broadcast_arrays',
+    'broadcast_params'
 ]
\ No newline at end of file
@@ -0,0 +1,17 @@
+import numpy as np
+
+def as_array(x):
+    arr = np.atleast_1d(np.asarray(x))
+    if arr.dtype.kind in 'biuf' and arr.dtype != np.float64:
+        arr = arr.astype(np.float64)
+    return arr
+
+def as_float_array(x):
+    return np.atleast_1d(np.asarray(x, dtype=np.float64))
+
+def broadcast_arrays(*values):
+    return np.broadcast_arrays(*[as_array(v) for v in values])
+
+def broadcast_params(params):
+    keys = list(params)
+    return dict(zip(keys, broadcast_arrays(*[params[k] for k in keys])))
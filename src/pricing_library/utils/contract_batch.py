@@ -0,0 +1,196 @@
+import numpy as np
+from .curves import YieldCurve
+
+FLOAT_COLUMNS = ('S', 'K', 'T', 'r', 'sigma', 'q', 'K1', 'K2', 'K_call', 'K_put', 'barrier_level', 't_today')
+TEXT_COLUMNS = ('option_type', 'barrier_type', 'averaging_type')
+CONTRACT_COLUMNS = FLOAT_COLUMNS + TEXT_COLUMNS
+
+REQUIRED_COLUMNS = {
+    'european': ('S', 'K', 'T', 'r', 'sigma', 'option_type'),
+    'american': ('S', 'K', 'T', 'r', 'sigma', 'option_type'),
+    'bermudan': ('S', 'K', 'T', 'r', 'sigma', 'option_type'),
+    'asian': ('S', 'K', 'T', 'r', 'sigma', 'option_type'),
+    'barrier': ('S', 'K', 'T', 'r', 'sigma', 'option_type', 'barrier_type', 'barrier_level'),
+    'gap': ('S', 'K1', 'K2', 'T', 'r', 'sigma', 'option_type'),
+    'combination': ('S', 'T', 'r', 'sigma')
+}
+
+CURVE_SETTINGS = {'r': 'rate_curve', 'q': 'dividend_curve'}
+
+def _same_setting(a, b):
+    return a is b or (type(a) is type(b) and repr(a) == repr(b))
+
+def _shared_curve(key, value):
+    values = list(value) if isinstance(value, (list, tuple)) else [value]
+    curves = [v for v in values if isinstance(v, YieldCurve)]
+    if not curves:
+        return None
+    if len(curves) != len(values) or len({curve.key for curve in curves}) > 1:
+        raise ValueError(f'All records in a ContractBatch must share the same {CURVE_SETTINGS[key]}')
+    return curves[0]
+
+class ContractBatch:
+    __slots__ = ('option_style', 'columns', 'settings', '_length')
+
+    def __init__(self, columns, option_style='european', settings=None, validate=True):
+        self.option_style = option_style
+        self.settings = dict(settings or {})
+
+        columns = dict(columns)
+        curves = {}
+        for key in CURVE_SETTINGS:
+            curve = _shared_curve(key, columns.get(key, None))
+            if curve is not None:
+                curves[key] = curve
+                del columns[key]
+
+        values = [np.asarray(v) for v in columns.values()]
+        shape = np.broadcast_shapes(*[v.shape for v in values]) if values else (0,)
+        if len(shape) > 1:
+            raise ValueError(f'ContractBatch columns must be 1-d, got shape {shape}')
+        self._length = shape[0] if shape else 1
+
+        self.columns = {}
+        for key, value in zip(columns, values):
+            dtype = np.float64 if key in FLOAT_COLUMNS else None
+            column = np.broadcast_to(np.asarray(value, dtype=dtype), (self._length,))
+            if key in TEXT_COLUMNS:
+                column = column.astype(str)
+            self.columns[key] = np.ascontiguousarray(column)
+
+        # Curves travel as settings; the column holds each row's zero rate to expiry.
+        for key, curve in curves.items():
+            self.settings[CURVE_SETTINGS[key]] = curve
+            if 'T' in self.columns:
+                self.columns[key] = np.asarray(
+                    curve.zero_rate(self.columns['T'] - self.columns.get('t_today', 0.0)), dtype=np.float64
+                ).reshape(self._length)
+
+        if option_style == 'gap' and 'K' not in self.columns and 'K1' in self.columns:
+            self.columns['K'] = self.columns['K1']
+        if 'q' not in self.columns and option_style != 'combination':
+            self.columns['q'] = np.zeros(self._length)
+
+        if validate:
+            self.validate()
+
+    @classmethod
+    def from_params(cls, params, validate=True):
+        option_style = params.get('option_style', 'european')
+        columns = {k: v for k, v in params.items() if k in CONTRACT_COLUMNS}
+        settings = {k: v for k, v in params.items() if k not in CONTRACT_COLUMNS and k != 'option_style'}
+        return cls(columns, option_style, settings, validate)
+
+    @classmethod
+    def from_records(cls, records, option_style=None, validate=True):
+        if not records:
+            raise ValueError('Cannot build a ContractBatch from an empty list of records')
+        option_style = option_style or records[0].get('option_style', 'european')
+        keys = [k for k in CONTRACT_COLUMNS if any(k in record for record in records)]
+        defaults = {'q': 0.0, 't_today': 0.0}
+        columns = {k: [record.get(k, defaults.get(k)) for record in records] for k in keys}
+        settings = {k: v for k, v in records[0].items() if k not in CONTRACT_COLUMNS and k != 'option_style'}
+        for record in records[1:]:
+            other = {k: v for k, v in record.items() if k not in CONTRACT_COLUMNS and k != 'option_style'}
+            if other.keys() != settings.keys() or any(not _same_setting(settings[k], other[k]) for k in settings):
+                raise ValueError('All records in a ContractBatch must share the same settings')
+        return cls(columns, option_style, settings, validate)
+
+    @classmethod
+    def _from_columns(cls, columns, option_style, settings, length):
+        batch = cls.__new__(cls)
+        batch.option_style = option_style
+        batch.columns = columns
+        batch.settings = settings
+        batch._length = length
+        return batch
+
+    def validate(self):
+        required = REQUIRED_COLUMNS.get(self.option_style)
+        if required is None:
+            raise ValueError(f'Unsupported option style: {self.option_style}')
+        missing = [k for k in required if k not in self.columns]
+        if missing:
+            raise ValueError(f'Missing columns for {self.option_style} contracts: {missing}')
+
+        for key in ('S', 'K', 'K1', 'K2', 'K_call', 'K_put', 'barrier_level'):
+            if key in self.columns and np.any(self.columns[key] <= 0):
+                raise ValueError(f'{key} must be strictly positive')
+        if np.any(self.columns['sigma'] <= 0):
+            raise ValueError('sigma must be strictly positive')
+        if np.any(self.columns['T'] < 0):
+            raise ValueError('T must be non-negative')
+        for key in FLOAT_COLUMNS:
+            if key in self.columns and np.any(np.isnan(self.columns[key])):
+                raise ValueError(f'{key} contains NaN values')
+        if 'option_type' in self.columns:
+            invalid = ~np.isin(self.columns['option_type'], ('call', 'put'))
+            if np.any(invalid):
+                raise ValueError(f"option_type must be 'call' or 'put', got {np.unique(self.columns['option_type'][invalid])}")
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, key):
+        return key in self.columns or key in self.settings or key == 'option_style'
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in self.columns:
+                return self.columns[key]
+            if key == 'option_style':
+                return self.option_style
+            return self.settings[key]
+        if isinstance(key, (int, np.integer)):
+            return self.row(key)
+        return self.take(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self.columns) + list(self.settings) + ['option_style']
+
+    def take(self, index):
+        columns = {k: v[index] for k, v in self.columns.items()}
+        length = len(next(iter(columns.values()))) if columns else 0
+        return ContractBatch._from_columns(columns, self.option_style, self.settings, length)
+
+    def row(self, i):
+        params = {k: v[i].item() for k, v in self.columns.items()}
+        params.update(self.settings)
+        params['option_style'] = self.option_style
+        return params
+
+    def group_by(self, *keys):
+        if not keys or self._length == 0:
+            return {(): np.arange(self._length)}
+        codes = []
+        uniques = []
+        for key in keys:
+            values, inverse = np.unique(self.columns[key], return_inverse=True)
+            uniques.append(values)
+            codes.append(inverse.ravel())
+        combined = np.ravel_multi_index(codes, [len(u) for u in uniques])
+        order = np.argsort(combined, kind='stable')
+        group_codes, starts = np.unique(combined[order], return_index=True)
+        groups = {}
+        for code, index in zip(group_codes, np.split(order, starts[1:])):
+            parts = np.unravel_index(code, [len(u) for u in uniques])
+            groups[tuple(u[p].item() for u, p in zip(uniques, parts))] = index
+        return groups
+
+    def model_inputs(self):
+        return dict(self.columns)
+
+    def to_params(self):
+        params = dict(self.columns)
+        params.update(self.settings)
+        params['option_style'] = self.option_style
+        return params
+
+    def __repr__(self):
+        return f'ContractBatch(option_style={self.option_style!r}, n={self._length}, columns={list(self.columns)})'
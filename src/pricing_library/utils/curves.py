@@ -0,0 +1,90 @@
+import numpy as np
+
+class YieldCurve:
+    max_cache_entries = 100000
+
+    def __init__(self, times, rates):
+        times = np.ravel(np.asarray(times, dtype=np.float64))
+        rates = np.ravel(np.asarray(rates, dtype=np.float64))
+        if len(times) == 0 or len(times) != len(rates):
+            raise ValueError("times and rates must be non-empty and of equal length")
+        if np.any(times <= 0) or np.any(np.diff(times) <= 0):
+            raise ValueError("times must be strictly positive and increasing")
+
+        self.times = times
+        self.rates = rates
+        self._knots = np.concatenate([[0.0], times])
+        self._integrated = np.concatenate([[0.0], rates * times])
+        self._tail_rate = (self._integrated[-1] - self._integrated[-2]) / (self._knots[-1] - self._knots[-2])
+        self._cache = {}
+        self._step_cache = {}
+
+    @classmethod
+    def flat(cls, rate):
+        return cls([1.0], [rate])
+
+    @classmethod
+    def from_discount_factors(cls, times, discount_factors):
+        times = np.asarray(times, dtype=np.float64)
+        return cls(times, -np.log(np.asarray(discount_factors, dtype=np.float64)) / times)
+
+    @property
+    def key(self):
+        return (self.__class__.__name__, tuple(self.times.tolist()), tuple(self.rates.tolist()))
+
+    def integrated(self, T):
+        T = np.asarray(T, dtype=np.float64)
+        maturities, inverse = np.unique(T, return_inverse=True)
+        values = np.array([self._cache.get(t, np.nan) for t in maturities.tolist()])
+        missing = np.isnan(values)
+        if np.any(missing):
+            values[missing] = self._interpolate(maturities[missing])
+            if len(self._cache) > self.max_cache_entries:
+                self._cache.clear()
+            self._cache.update(zip(maturities[missing].tolist(), values[missing].tolist()))
+        return values[inverse.ravel()].reshape(T.shape)
+
+    def zero_rate(self, T):
+        T = np.asarray(T, dtype=np.float64)
+        safe_T = np.where(T > 0, T, 1.0)
+        rate = np.where(T > 0, self.integrated(safe_T) / safe_T, self.rates[0])
+        return rate.item() if rate.ndim == 0 else rate
+
+    def discount(self, T):
+        factor = np.exp(-self.integrated(T))
+        return factor.item() if factor.ndim == 0 else factor
+
+    def forward_rate(self, t1, t2):
+        t1, t2 = np.asarray(t1, dtype=np.float64), np.asarray(t2, dtype=np.float64)
+        if np.any(t2 <= t1):
+            raise ValueError("forward_rate requires t2 > t1")
+        rate = (self.integrated(t2) - self.integrated(t1)) / (t2 - t1)
+        return rate.item() if rate.ndim == 0 else rate
+
+    def step_rates(self, T, n_steps):
+        key = (np.asarray(T, dtype=np.float64).item(), int(n_steps))
+        rates = self._step_cache.get(key)
+        if rates is None:
+            grid = np.linspace(0.0, key[0], key[1] + 1)
+            rates = np.diff(self._interpolate(grid)) / (key[0] / key[1])
+            rates.setflags(write=False)
+            if len(self._step_cache) > self.max_cache_entries:
+                self._step_cache.clear()
+            self._step_cache[key] = rates
+        return rates
+
+    def _interpolate(self, T):
+        inside = np.interp(T, self._knots, self._integrated)
+        return np.where(T > self._knots[-1], self._integrated[-1] + self._tail_rate * (T - self._knots[-1]), inside)
+
+class DividendCurve(YieldCurve):
+    pass
+
+def forward_price(S, T, rate_curve, dividend_curve=None):
+    carry = rate_curve.integrated(T) - (0.0 if dividend_curve is None else dividend_curve.integrated(T))
+    return np.asarray(S, dtype=np.float64) * np.exp(carry)
+
+def step_rates(rate, T, n_steps, curve=None):
+    if curve is None:
+        return rate
+    return curve.step_rates(T, n_steps) + (np.asarray(rate, dtype=np.float64).item() - curve.zero_rate(T))
@@ -22,7 +22,10 @@ def asian_payoff(prices, K, option_type='call', averaging_type='arithmetic'):
         return np.maximum(K - average_prices, 0)
     
 def gap_payoff(S, K1, K2, option_type='call'):
-    if option_type == 'call':
-        return max(S - K2, 0) if S > K1 else 0
-    elif option_type == 'put':
-        return max(K2 - S, 0) if S < K1 else 0
\ No newline at end of file
+    S, K1, K2, option_type = np.broadcast_arrays(np.asarray(S, dtype=np.float64), K1, K2, option_type)
+    is_call = option_type == 'call'
+    if not np.all(is_call | (option_type == 'put')):
+        raise ValueError("option_type must be 'call' or 'put'")
+    call = np.where(S > K1, np.maximum(S - K2, 0), 0.0)
+    put = np.where(S < K1, np.maximum(K2 - S, 0), 0.0)
+    return np.where(is_call, call, put)
@@ -0,0 +1,133 @@
+import ast
+from functools import lru_cache
+import numpy as np
+
+REDUCTIONS = {
+    'terminal': lambda paths: paths[:, -1],
+    'S': lambda paths: paths[:, -1],
+    'spot': lambda paths: paths[:, 0],
+    'average': lambda paths: np.mean(paths, axis=1),
+    'geometric_average': lambda paths: np.exp(np.mean(np.log(paths), axis=1)),
+    'path_max': lambda paths: np.max(paths, axis=1),
+    'path_min': lambda paths: np.min(paths, axis=1)
+}
+
+OPERATIONS = {
+    'add': np.add,
+    'sub': np.subtract,
+    'mul': np.multiply,
+    'div': np.divide,
+    'pow': np.power,
+    'neg': np.negative,
+    'abs': np.abs,
+    'exp': np.exp,
+    'log': np.log,
+    'max': lambda *args: np.maximum.reduce(np.broadcast_arrays(*args)),
+    'min': lambda *args: np.minimum.reduce(np.broadcast_arrays(*args)),
+    'gt': lambda a, b: (a > b).astype(np.float64),
+    'ge': lambda a, b: (a >= b).astype(np.float64),
+    'lt': lambda a, b: (a < b).astype(np.float64),
+    'le': lambda a, b: (a <= b).astype(np.float64)
+}
+
+COMMUTATIVE = ('add', 'mul', 'max', 'min')
+BINARY = {ast.Add: 'add', ast.Sub: 'sub', ast.Mult: 'mul', ast.Div: 'div', ast.Pow: 'pow'}
+COMPARISONS = {ast.Gt: 'gt', ast.GtE: 'ge', ast.Lt: 'lt', ast.LtE: 'le'}
+FUNCTIONS = {'max': (2, None), 'min': (2, None), 'abs': (1, 1), 'exp': (1, 1), 'log': (1, 1),
+             'hit_above': (1, 1), 'hit_below': (1, 1)}
+
+class PayoffPlan:
+    def __init__(self, names, steps, outputs, variables):
+        self.names = names
+        self.steps = steps
+        self.outputs = outputs
+        self.variables = variables
+
+    def __len__(self):
+        return len(self.outputs)
+
+    def evaluate(self, paths, **variables):
+        paths = np.asarray(paths, dtype=np.float64)
+        missing = [name for name in self.variables if name not in variables]
+        if missing:
+            raise ValueError(f"Missing payoff variables: {missing}")
+
+        values = []
+        for kind, *args in self.steps:
+            if kind == 'const':
+                values.append(args[0])
+            elif kind == 'var':
+                values.append(np.asarray(variables[args[0]], dtype=np.float64))
+            elif kind == 'reduce':
+                values.append(REDUCTIONS[args[0]](paths))
+            else:
+                values.append(OPERATIONS[kind](*(values[i] for i in args)))
+
+        n_paths = paths.shape[0]
+        columns = [np.broadcast_to(values[i], (n_paths,)).astype(np.float64) for i in self.outputs]
+        return columns[0] if len(columns) == 1 and self.names is None else np.column_stack(columns)
+
+def compile_payoff(payoff):
+    if isinstance(payoff, PayoffPlan):
+        return payoff
+    if isinstance(payoff, str):
+        return _compile(None, (payoff,))
+    if isinstance(payoff, dict):
+        return _compile(tuple(payoff), tuple(payoff.values()))
+    return _compile(tuple(range(len(payoff))), tuple(payoff))
+
+@lru_cache(maxsize=256)
+def _compile(names, expressions):
+    nodes = {}
+    steps = []
+    variables = []
+
+    def emit(key):
+        if key not in nodes:
+            nodes[key] = len(steps)
+            steps.append(key)
+        return nodes[key]
+
+    def operation(kind, *args):
+        if kind in COMMUTATIVE:
+            args = sorted(args)
+        return emit((kind, *args))
+
+    def visit(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return emit(('const', float(node.value)))
+        if isinstance(node, ast.Name):
+            if node.id in REDUCTIONS:
+                return emit(('reduce', 'terminal' if node.id == 'S' else node.id))
+            if node.id not in variables:
+                variables.append(node.id)
+            return emit(('var', node.id))
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY:
+            return operation(BINARY[type(node.op)], visit(node.left), visit(node.right))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = visit(node.operand)
+            return operand if isinstance(node.op, ast.UAdd) else operation('neg', operand)
+        if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in COMPARISONS:
+            return operation(COMPARISONS[type(node.ops[0])], visit(node.left), visit(node.comparators[0]))
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS and not node.keywords:
+            name = node.func.id
+            low, high = FUNCTIONS[name]
+            if len(node.args) < low or (high is not None and len(node.args) > high):
+                raise ValueError(f"Wrong number of arguments to {name}()")
+            args = [visit(arg) for arg in node.args]
+            if name == 'hit_above':
+                return operation('ge', emit(('reduce', 'path_max')), args[0])
+            if name == 'hit_below':
+                return operation('le', emit(('reduce', 'path_min')), args[0])
+            return operation(name, *args)
+        raise ValueError(f"Unsupported payoff expression: {ast.unparse(node)}")
+
+    outputs = []
+    for expression in expressions:
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f"Invalid payoff expression: {expression}") from e
+        outputs.append(visit(tree.body))
+
+    return PayoffPlan(names, steps, outputs, tuple(variables))
@@ -1,18 +1,29 @@
 from .base_regression import BaseRegression
 from .polynomial import PolynomialRegression
 from .laguerre import LaguerreRegression
+from .hermite import HermiteRegression
+from .chebyshev import ChebyshevRegression
+from .piecewise_linear import PiecewiseLinearRegression
+
+REGRESSORS = {
+    'polynomial': PolynomialRegression,
+    'laguerre': LaguerreRegression,
+    'hermite': HermiteRegression,
+    'chebyshev': ChebyshevRegression,
+    'piecewise_linear': PiecewiseLinearRegression
+}
 
 def get_regressor(regression_type='polynomial', **kwargs):
-    if regression_type == 'polynomial':
-        return PolynomialRegression(**kwargs)
-    elif regression_type == 'laguerre':
-        return LaguerreRegression(**kwargs)
-    else:
+    if regression_type not in REGRESSORS:
         raise ValueError(f"Unknown regression type: {regression_type}")
+    return REGRESSORS[regression_type](**kwargs)
 
 __all__ = [
     'BaseRegression',
     'PolynomialRegression', 
     'LaguerreRegression',
+    'HermiteRegression',
+    'ChebyshevRegression',
+    'PiecewiseLinearRegression',
     'get_regressor'
-]
\ No newline at end of file
+]
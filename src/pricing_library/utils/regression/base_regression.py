@@ -1,7 +1,64 @@
+import numpy as np
 from abc import ABC, abstractmethod
+from scipy.linalg import cho_factor, cho_solve, solve_triangular, LinAlgError
 
 class BaseRegression(ABC):
-    
+    uses_domain = False
+    max_condition = 1e10
+
+    def __init__(self, degree=2):
+        if degree < 0:
+            raise ValueError("Degree must be non-negative")
+        self.degree = degree
+
     @abstractmethod
+    def basis(self, x):
+        pass
+
+    def design(self, X, domain=None):
+        x = np.asarray(X, dtype=np.float64).ravel()
+        if self.uses_domain:
+            lo, hi = domain
+            x = 2 * (x - lo) / max(hi - lo, 1e-12) - 1
+        return self.basis(x)
+
+    def fit(self, X, y):
+        return self.fit_with_design(X, y)[0]
+
+    def fit_with_design(self, X, y):
+        X = np.asarray(X, dtype=np.float64).ravel()
+        domain = (float(X.min()), float(X.max())) if self.uses_domain else None
+        design = self.design(X, domain)
+        return {'beta': self._solve(design, np.asarray(y, dtype=np.float64)), 'domain': domain}, design
+
+    def predict(self, X, fitted):
+        return self.design(X, fitted['domain']) @ fitted['beta']
+
     def fit_predict(self, X, y, X_pred):
-        pass
\ No newline at end of file
+        if len(X) != len(y):
+            raise ValueError("X and y must have the same length")
+
+        if len(X) == 0:
+            return np.zeros_like(X_pred)
+
+        fitted, X_design = self.fit_with_design(X, y)
+        X_pred_design = X_design if X_pred is X else self.design(X_pred, fitted['domain'])
+
+        return X_pred_design @ fitted['beta']
+
+    def _solve(self, design, y):
+        gram = design.T @ design
+        try:
+            factor = cho_factor(gram, lower=False, check_finite=False)
+            diagonal = np.abs(np.diag(factor[0]))
+            if diagonal.min() > 0 and (diagonal.max() / diagonal.min())**2 < self.max_condition:
+                return cho_solve(factor, design.T @ y, check_finite=False)
+        except LinAlgError:
+            pass
+
+        if design.shape[0] < design.shape[1]:
+            return np.linalg.lstsq(design, y, rcond=None)[0]
+        q, r = np.linalg.qr(design)
+        if np.all(np.abs(np.diag(r)) > 1e-12 * max(np.abs(r).max(), 1e-300)):
+            return solve_triangular(r, q.T @ y, check_finite=False)
+        return np.linalg.lstsq(design, y, rcond=None)[0]
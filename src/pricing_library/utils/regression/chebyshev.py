@@ -0,0 +1,14 @@
+import numpy as np
+from .base_regression import BaseRegression
+
+class ChebyshevRegression(BaseRegression):
+    uses_domain = True
+
+    def basis(self, x):
+        basis = np.empty((len(x), self.degree + 1))
+        basis[:, 0] = 1.0
+        if self.degree > 0:
+            basis[:, 1] = x
+        for n in range(1, self.degree):
+            basis[:, n + 1] = 2 * x * basis[:, n] - basis[:, n - 1]
+        return basis
@@ -0,0 +1,14 @@
+import numpy as np
+from .base_regression import BaseRegression
+
+class PiecewiseLinearRegression(BaseRegression):
+    uses_domain = True
+
+    def basis(self, x):
+        knots = np.linspace(-1, 1, self.degree + 1)[1:-1]
+        basis = np.empty((len(x), self.degree + 1))
+        basis[:, 0] = 1.0
+        if self.degree > 0:
+            basis[:, 1] = x
+        basis[:, 2:] = np.maximum(x[:, None] - knots[None, :], 0.0)
+        return basis
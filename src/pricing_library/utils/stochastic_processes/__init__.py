@@ -1,3 +1,20 @@
 from .gbm import GeometricBrownianMotion
+from .heston import HestonProcess
+from .merton import MertonJumpDiffusion
+from .path_cache import PathCache
 
-__all__ = ['GeometricBrownianMotion']
\ No newline at end of file
+PROCESSES = {
+    'gbm': GeometricBrownianMotion,
+    'heston': HestonProcess,
+    'merton': MertonJumpDiffusion
+}
+
+def get_process(name='gbm'):
+    if name not in PROCESSES:
+        raise ValueError(f"Unsupported process: {name}. Supported: {list(PROCESSES)}")
+    return PROCESSES[name]
+
+def process_parameters(process, params):
+    return {k: params[k] for k in process.parameters if params.get(k, None) is not None}
+
+__all__ = ['GeometricBrownianMotion', 'HestonProcess', 'MertonJumpDiffusion', 'PathCache', 'PROCESSES', 'get_process', 'process_parameters']
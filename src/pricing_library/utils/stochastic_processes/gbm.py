@@ -1,14 +1,32 @@
 import numpy as np
+from .path_cache import parameter_key
 
 class GeometricBrownianMotion:
-    
+    parameters = ()
+
+    @staticmethod
+    def simulate(S0, T, r, sigma, q=0.0, n_paths=10000, n_steps=100, seed=None, path_cache=None, **kwargs):
+        if path_cache is not None and seed is not None:
+            key = ('gbm',) + parameter_key(T, r, sigma, q) + (n_paths, n_steps, seed)
+            unit_paths = path_cache.unit_paths(
+                key, lambda: GeometricBrownianMotion.simulate(1.0, T, r, sigma, q, n_paths, n_steps, seed)
+            )
+            return S0 * unit_paths
+
+        z = GeometricBrownianMotion.normals(n_paths, n_steps, seed)
+        return GeometricBrownianMotion.paths_from_normals(S0, T, r, sigma, q, z)
+
     @staticmethod
-    def simulate(S0, T, r, sigma, q=0.0, n_paths=10000, n_steps=100, seed=None):
+    def normals(n_paths, n_steps, seed=None):
         if seed is not None:
             np.random.seed(seed)
         
+        return np.random.normal(0, 1, (n_paths, n_steps))
+
+    @staticmethod
+    def paths_from_normals(S0, T, r, sigma, q, z, **kwargs):
+        n_paths, n_steps = z.shape
         dt = T / n_steps
-        z = np.random.normal(0, 1, (n_paths, n_steps))
         
         increments = (r - q - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * z
         log_returns = np.cumsum(increments, axis=1)
@@ -17,4 +35,17 @@ class GeometricBrownianMotion:
         paths[:, 0] = S0
         paths[:, 1:] = S0 * np.exp(log_returns)
         
-        return paths
\ No newline at end of file
+        return paths
+
+    @staticmethod
+    def characteristic_function(u, T, r, sigma, q=0.0, **kwargs):
+        return np.exp(1j * u * (r - q - 0.5 * sigma**2) * T - 0.5 * sigma**2 * u**2 * T)
+
+    @staticmethod
+    def characteristic_gradient(u, T, r, sigma, q=0.0, **kwargs):
+        cf = GeometricBrownianMotion.characteristic_function(u, T, r, sigma, q)
+        return {'sigma': cf * (-1j * u - u**2) * sigma * T}
+
+    @staticmethod
+    def cumulants(T, r, sigma, q=0.0, **kwargs):
+        return (r - q - 0.5 * sigma**2) * T, sigma**2 * T, 0.0
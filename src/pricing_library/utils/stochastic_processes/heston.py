@@ -0,0 +1,157 @@
+import numpy as np
+from scipy.stats import norm
+from .path_cache import parameter_key
+
+class HestonProcess:
+    parameters = ('v0', 'kappa', 'theta', 'xi', 'rho')
+    psi_critical = 1.5
+
+    @staticmethod
+    def simulate(S0, T, r, sigma, q=0.0, n_paths=10000, n_steps=100, seed=None, path_cache=None, **kwargs):
+        params = HestonProcess.resolve_parameters(sigma, **kwargs)
+        if path_cache is not None and seed is not None:
+            key = ('heston',) + parameter_key(T, r, q) \
+                + tuple(params[k] for k in HestonProcess.parameters) + (n_paths, n_steps, seed)
+            unit_paths = path_cache.unit_paths(
+                key, lambda: HestonProcess.simulate(1.0, T, r, sigma, q, n_paths, n_steps, seed, **kwargs)
+            )
+            return S0 * unit_paths
+
+        z = HestonProcess.normals(n_paths, n_steps, seed)
+        return HestonProcess.paths_from_normals(S0, T, r, sigma, q, z, **kwargs)
+
+    @staticmethod
+    def resolve_parameters(sigma, **kwargs):
+        sigma = np.asarray(sigma, dtype=float).item()
+        params = {
+            'v0': kwargs.get('v0', None),
+            'kappa': kwargs.get('kappa', 1.0),
+            'theta': kwargs.get('theta', None),
+            'xi': kwargs.get('xi', 0.3),
+            'rho': kwargs.get('rho', 0.0)
+        }
+        if params['v0'] is None:
+            params['v0'] = sigma**2
+        if params['theta'] is None:
+            params['theta'] = sigma**2
+        params = {k: float(v) for k, v in params.items()}
+
+        if params['v0'] < 0 or params['theta'] < 0:
+            raise ValueError("v0 and theta must be non-negative")
+        if params['kappa'] <= 0 or params['xi'] <= 0:
+            raise ValueError("kappa and xi must be strictly positive")
+        if not -1 <= params['rho'] <= 1:
+            raise ValueError("rho must lie in [-1, 1]")
+        return params
+
+    @staticmethod
+    def characteristic_function(u, T, r, sigma, q=0.0, **kwargs):
+        params = HestonProcess.resolve_parameters(sigma, **kwargs)
+        v0, kappa, theta, xi, rho = (params[k] for k in HestonProcess.parameters)
+
+        beta = kappa - rho * xi * 1j * u
+        d = np.sqrt(beta**2 + xi**2 * (1j * u + u**2))
+        g = (beta - d) / (beta + d)
+        decay = np.exp(-d * T)
+
+        C = 1j * u * (r - q) * T + kappa * theta / xi**2 * (
+            (beta - d) * T - 2 * np.log((1 - g * decay) / (1 - g))
+        )
+        D = (beta - d) / xi**2 * (1 - decay) / (1 - g * decay)
+        return np.exp(C + D * v0)
+
+    @staticmethod
+    def characteristic_gradient(u, T, r, sigma, q=0.0, **kwargs):
+        params = HestonProcess.resolve_parameters(sigma, **kwargs)
+        v0, kappa, theta, xi, rho = (params[k] for k in HestonProcess.parameters)
+
+        beta = kappa - rho * xi * 1j * u
+        d = np.sqrt(beta**2 + xi**2 * (1j * u + u**2))
+        g = (beta - d) / (beta + d)
+        decay = np.exp(-d * T)
+        log_term = np.log((1 - g * decay) / (1 - g))
+        ratio = (1 - decay) / (1 - g * decay)
+        D = (beta - d) / xi**2 * ratio
+        cf = np.exp(1j * u * (r - q) * T + kappa * theta / xi**2 * ((beta - d) * T - 2 * log_term) + D * v0)
+
+        gradient = {
+            'v0': cf * D,
+            'theta': cf * kappa / xi**2 * ((beta - d) * T - 2 * log_term)
+        }
+        # Chain rule through beta, d, g and exp(-d T) for the parameters entering the Riccati solution.
+        for name, d_beta, d_xi2, d_coefficient in (
+            ('kappa', 1.0, 0.0, theta / xi**2),
+            ('xi', -rho * 1j * u, 2 * xi, -2 * kappa * theta / xi**3),
+            ('rho', -xi * 1j * u, 0.0, 0.0)
+        ):
+            d_d = (beta * d_beta + 0.5 * d_xi2 * (1j * u + u**2)) / d
+            d_g = 2 * (d * d_beta - beta * d_d) / (beta + d)**2
+            d_decay = -T * decay * d_d
+            d_log_term = d_g / (1 - g) - (d_g * decay + g * d_decay) / (1 - g * decay)
+            d_ratio = (-d_decay * (1 - g * decay) + (1 - decay) * (d_g * decay + g * d_decay)) / (1 - g * decay)**2
+            d_C = d_coefficient * ((beta - d) * T - 2 * log_term) \
+                + kappa * theta / xi**2 * ((d_beta - d_d) * T - 2 * d_log_term)
+            d_D = ((d_beta - d_d) / xi**2 - (beta - d) * d_xi2 / xi**4) * ratio + (beta - d) / xi**2 * d_ratio
+            gradient[name] = cf * (d_C + v0 * d_D)
+        return {k: gradient[k] for k in HestonProcess.parameters}
+
+    @staticmethod
+    def normals(n_paths, n_steps, seed=None):
+        if seed is not None:
+            np.random.seed(seed)
+
+        return np.random.normal(0, 1, (n_paths, n_steps, 2))
+
+    @staticmethod
+    def paths_from_normals(S0, T, r, sigma, q, z, return_variance=False, **kwargs):
+        params = HestonProcess.resolve_parameters(sigma, **kwargs)
+        v0, kappa, theta, xi, rho = (params[k] for k in HestonProcess.parameters)
+        n_paths, n_steps, _ = z.shape
+        dt = T / n_steps
+
+        decay = np.exp(-kappa * dt)
+        k0 = -rho * kappa * theta * dt / xi
+        k1 = 0.5 * dt * (kappa * rho / xi - 0.5) - rho / xi
+        k2 = 0.5 * dt * (kappa * rho / xi - 0.5) + rho / xi
+        k3 = 0.5 * dt * (1 - rho**2)
+        drift = np.broadcast_to((r - q) * dt + k0, (n_steps,))
+
+        log_paths = np.zeros((n_paths, n_steps + 1))
+        variance = np.empty((n_paths, n_steps + 1))
+        variance[:, 0] = v0
+
+        for t in range(n_steps):
+            v = variance[:, t]
+            z_v = z[:, t, 0]
+
+            m = theta + (v - theta) * decay
+            s2 = v * xi**2 * decay * (1 - decay) / kappa + theta * xi**2 * (1 - decay)**2 / (2 * kappa)
+            psi = s2 / np.maximum(m**2, 1e-300)
+
+            quadratic = psi <= HestonProcess.psi_critical
+            v_next = np.empty(n_paths)
+
+            psi_q = psi[quadratic]
+            b2 = 2 / psi_q - 1 + np.sqrt(2 / psi_q) * np.sqrt(2 / psi_q - 1)
+            a = m[quadratic] / (1 + b2)
+            v_next[quadratic] = a * (np.sqrt(b2) + z_v[quadratic])**2
+
+            exponential = ~quadratic
+            psi_e = psi[exponential]
+            p = (psi_e - 1) / (psi_e + 1)
+            beta = (1 - p) / m[exponential]
+            u = norm.cdf(z_v[exponential])
+            v_next[exponential] = np.where(
+                u <= p, 0.0, np.log((1 - p) / np.maximum(1 - u, 1e-300)) / beta
+            )
+
+            variance[:, t + 1] = v_next
+            log_paths[:, t + 1] = (
+                log_paths[:, t] + drift[t] + k1 * v + k2 * v_next
+                + np.sqrt(np.maximum(k3 * (v + v_next), 0.0)) * z[:, t, 1]
+            )
+
+        paths = S0 * np.exp(log_paths)
+        if return_variance:
+            return paths, variance
+        return paths
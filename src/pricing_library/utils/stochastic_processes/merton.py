@@ -0,0 +1,97 @@
+import numpy as np
+from scipy.stats import norm, poisson
+from .path_cache import parameter_key
+
+class MertonJumpDiffusion:
+    parameters = ('jump_intensity', 'jump_mean', 'jump_std')
+
+    @staticmethod
+    def resolve_parameters(**kwargs):
+        params = {
+            'jump_intensity': float(kwargs.get('jump_intensity', 0.0)),
+            'jump_mean': float(kwargs.get('jump_mean', 0.0)),
+            'jump_std': float(kwargs.get('jump_std', 0.0))
+        }
+        if params['jump_intensity'] < 0 or params['jump_std'] < 0:
+            raise ValueError("jump_intensity and jump_std must be non-negative")
+        return params
+
+    @staticmethod
+    def compensator(jump_mean, jump_std):
+        return np.exp(jump_mean + 0.5 * jump_std**2) - 1
+
+    @staticmethod
+    def characteristic_function(u, T, r, sigma, q=0.0, **kwargs):
+        params = MertonJumpDiffusion.resolve_parameters(**kwargs)
+        lam, mu_j, delta = (params[k] for k in MertonJumpDiffusion.parameters)
+
+        drift = r - q - 0.5 * sigma**2 - lam * MertonJumpDiffusion.compensator(mu_j, delta)
+        jumps = lam * T * (np.exp(1j * u * mu_j - 0.5 * delta**2 * u**2) - 1)
+        return np.exp(1j * u * drift * T - 0.5 * sigma**2 * u**2 * T + jumps)
+
+    @staticmethod
+    def characteristic_gradient(u, T, r, sigma, q=0.0, **kwargs):
+        params = MertonJumpDiffusion.resolve_parameters(**kwargs)
+        lam, mu_j, delta = (params[k] for k in MertonJumpDiffusion.parameters)
+
+        cf = MertonJumpDiffusion.characteristic_function(u, T, r, sigma, q, **kwargs)
+        jump = np.exp(1j * u * mu_j - 0.5 * delta**2 * u**2)
+        growth = np.exp(mu_j + 0.5 * delta**2)
+        return {
+            'sigma': cf * (-1j * u - u**2) * sigma * T,
+            'jump_intensity': cf * T * (jump - 1 - 1j * u * (growth - 1)),
+            'jump_mean': cf * lam * T * 1j * u * (jump - growth),
+            'jump_std': cf * lam * T * delta * (-u**2 * jump - 1j * u * growth)
+        }
+
+    @staticmethod
+    def cumulants(T, r, sigma, q=0.0, **kwargs):
+        params = MertonJumpDiffusion.resolve_parameters(**kwargs)
+        lam, mu_j, delta = (params[k] for k in MertonJumpDiffusion.parameters)
+
+        c1 = (r - q - 0.5 * sigma**2 - lam * MertonJumpDiffusion.compensator(mu_j, delta) + lam * mu_j) * T
+        c2 = (sigma**2 + lam * (mu_j**2 + delta**2)) * T
+        c4 = lam * (mu_j**4 + 6 * mu_j**2 * delta**2 + 3 * delta**4) * T
+        return c1, c2, c4
+
+    @staticmethod
+    def simulate(S0, T, r, sigma, q=0.0, n_paths=10000, n_steps=100, seed=None, path_cache=None, **kwargs):
+        params = MertonJumpDiffusion.resolve_parameters(**kwargs)
+        if path_cache is not None and seed is not None:
+            key = ('merton',) + parameter_key(T, r, sigma, q) \
+                + tuple(params[k] for k in MertonJumpDiffusion.parameters) + (n_paths, n_steps, seed)
+            unit_paths = path_cache.unit_paths(
+                key, lambda: MertonJumpDiffusion.simulate(1.0, T, r, sigma, q, n_paths, n_steps, seed, **kwargs)
+            )
+            return S0 * unit_paths
+
+        z = MertonJumpDiffusion.normals(n_paths, n_steps, seed)
+        return MertonJumpDiffusion.paths_from_normals(S0, T, r, sigma, q, z, **kwargs)
+
+    @staticmethod
+    def normals(n_paths, n_steps, seed=None):
+        if seed is not None:
+            np.random.seed(seed)
+
+        return np.random.normal(0, 1, (n_paths, n_steps, 3))
+
+    @staticmethod
+    def paths_from_normals(S0, T, r, sigma, q, z, **kwargs):
+        params = MertonJumpDiffusion.resolve_parameters(**kwargs)
+        lam, mu_j, delta = (params[k] for k in MertonJumpDiffusion.parameters)
+        n_paths, n_steps, _ = z.shape
+        dt = T / n_steps
+
+        mean_jumps = lam * dt
+        max_jumps = int(poisson.ppf(1 - 1e-15, mean_jumps)) + 1 if mean_jumps > 0 else 0
+        thresholds = poisson.cdf(np.arange(max_jumps), mean_jumps)
+        n_jumps = np.searchsorted(thresholds, norm.cdf(z[:, :, 1]), side='right')
+
+        drift = (r - q - 0.5 * sigma**2 - lam * MertonJumpDiffusion.compensator(mu_j, delta)) * dt
+        increments = (drift + sigma * np.sqrt(dt) * z[:, :, 0]
+                      + n_jumps * mu_j + delta * np.sqrt(n_jumps) * z[:, :, 2])
+
+        paths = np.zeros((n_paths, n_steps + 1))
+        paths[:, 0] = S0
+        paths[:, 1:] = S0 * np.exp(np.cumsum(increments, axis=1))
+        return paths
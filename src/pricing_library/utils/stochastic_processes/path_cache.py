@@ -0,0 +1,56 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+
+def parameter_key(*values):
+    arrays = (np.asarray(x, dtype=float) for x in values)
+    return tuple(x.item() if x.size == 1 else tuple(x.ravel().tolist()) for x in arrays)
+
+class PathCache:
+    def __init__(self, max_bytes=512 * 2**20, max_entries=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def unit_paths(self, key, simulate):
+        with self._lock:
+            paths = self._entries.get(key)
+            if paths is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return paths
+            self.stats['misses'] += 1
+
+        paths = simulate()
+        paths.setflags(write=False)
+        if self.max_bytes is not None and paths.nbytes > self.max_bytes:
+            return paths
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = paths
+                self._bytes += paths.nbytes
+            while self._entries and (
+                (self.max_bytes is not None and self._bytes > self.max_bytes)
+                or (self.max_entries is not None and len(self._entries) > self.max_entries)
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.stats['evictions'] += 1
+        return paths
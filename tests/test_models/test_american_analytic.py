@@ -0,0 +1,34 @@
+import pytest
+import numpy as np
+from pricing_library.models.american_analytic import AnalyticAmericanModel
+from pricing_library.models.binomial import BinomialModel
+
+cases = [(90, 0.5, 0.2), (100, 0.5, 0.2), (110, 0.5, 0.2), (100, 1.0, 0.3), (100, 0.1, 0.15)]
+
+@pytest.mark.parametrize("approximation", ["bjerksund_stensland", "barone_adesi_whaley"])
+def test_put_against_binomial_tree(approximation):
+    S, T, sigma = (np.array(x, dtype=float) for x in zip(*cases))
+    prices = AnalyticAmericanModel().calculate(S, 100, T, 0.06, sigma, 'put', approximation=approximation)['price']
+    for i, (S_i, T_i, sigma_i) in enumerate(cases):
+        tree = BinomialModel().calculate(S_i, 100, T_i, 0.06, sigma_i, 'put', n_steps=300)['price']
+        assert abs(prices[i] - tree) / tree < 0.02
+
+def test_call_without_dividends_is_european():
+    res = AnalyticAmericanModel().calculate(100, 100, 1.0, 0.05, 0.2, 'call')
+    assert abs(res['price'][0] - res['european_price'][0]) < 1e-12
+
+@pytest.mark.parametrize("approximation", ["bjerksund_stensland", "barone_adesi_whaley"])
+def test_closed_form_delta_gamma_match_finite_differences(approximation):
+    S = np.array([70.0, 85.0, 95.0, 100.0, 105.0, 120.0, 150.0])
+    option_type = np.array(['put', 'put', 'call', 'put', 'call', 'call', 'call'])
+    model = AnalyticAmericanModel()
+    args = (100.0, 0.75, 0.06, 0.25, option_type, 0.04)
+    greeks = model.calculate_greeks(S, *args, approximation=approximation)
+
+    h = 1e-3 * S
+    price = lambda spot: model.calculate(spot, *args, approximation=approximation)['price']
+    up, base, down = price(S + h), price(S), price(S - h)
+    assert np.allclose(greeks['price'], base)
+    assert np.allclose(greeks['delta'], (up - down) / (2 * h), atol=1e-5)
+    assert np.allclose(greeks['gamma'], (up - 2 * base + down) / h**2, atol=1e-5)
+    assert greeks['delta'][0] == -1.0 and greeks['gamma'][0] == 0.0
@@ -0,0 +1,92 @@
+import time
+import asyncio
+import pytest
+import numpy as np
+from pricing_library.core.async_service import AsyncPricingService
+from pricing_library.core.pricing_service import PricingService
+from pricing_library.models.black_scholes import BlackScholesModel
+
+class SlowService(PricingService):
+    def price_option(self, params, method=None):
+        time.sleep(0.2)
+        return super().price_option(params, method)
+
+def contract(K, option_type='call'):
+    return {'S': 100.0, 'K': K, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': option_type}
+
+async def gather_results(service, requests):
+    return await asyncio.gather(*[service.price_option(params) for params in requests], return_exceptions=True)
+
+def test_requests_are_micro_batched():
+    service = AsyncPricingService(batch_window=0.01)
+    requests = [contract(80.0 + 5 * i, 'call' if i % 2 else 'put') for i in range(10)]
+    results = asyncio.run(service.price_options(requests))
+
+    for params, result in zip(requests, results):
+        expected = BlackScholesModel().calculate(**params)['price'][0]
+        assert result['price'] == pytest.approx(expected)
+    assert service.stats['requests'] == 10 and service.stats['batches'] == 1
+
+def test_full_bucket_is_dispatched_without_waiting_for_the_window():
+    service = AsyncPricingService(batch_window=10.0, max_batch_size=4)
+
+    async def run():
+        start = time.perf_counter()
+        await service.price_options([contract(100.0 + i) for i in range(8)])
+        return time.perf_counter() - start
+
+    assert asyncio.run(run()) < 5.0
+    assert service.stats['batches'] == 2
+
+def test_bad_contract_fails_only_its_own_caller():
+    service = AsyncPricingService(batch_window=0.01)
+    requests = [contract(100.0), {**contract(100.0), 'sigma': -0.2}, contract(110.0)]
+    results = asyncio.run(gather_results(service, requests))
+
+    assert isinstance(results[1], ValueError)
+    assert np.isfinite(results[0]['price']) and np.isfinite(results[2]['price'])
+    assert service.stats['batches'] == 1
+
+def test_timeouts_and_backpressure():
+    service = AsyncPricingService(SlowService(), batch_window=0.0, max_pending=1)
+
+    async def run():
+        first = asyncio.ensure_future(service.price_option(contract(100.0)))
+        await asyncio.sleep(0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await service.price_option(contract(105.0), timeout=0.05)
+        return await first
+
+    assert np.isfinite(asyncio.run(run())['price'])
+    assert service.stats['rejected'] == 1
+
+    service = AsyncPricingService(SlowService(), batch_window=0.0)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(service.price_option(contract(100.0), timeout=0.05))
+    assert service.stats['timeouts'] == 1
+
+def test_timeout_covers_queueing_and_pricing_together():
+    service = AsyncPricingService(SlowService(), batch_window=0.0, max_pending=1)
+
+    async def run():
+        first = asyncio.ensure_future(service.price_option(contract(100.0)))
+        await asyncio.sleep(0.01)
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await service.price_option(contract(105.0), timeout=0.3)
+        elapsed = time.perf_counter() - start
+        await first
+        await service.flush()
+        return elapsed
+
+    assert asyncio.run(run()) < 0.35
+    assert service.stats['rejected'] == 0 and service.stats['timeouts'] == 1
+
+def test_batched_callers_get_their_own_exercise_policy():
+    requests = [{**contract(K, 'put'), 'option_style': 'american', 'n_paths': 2000, 'n_steps': 20, 'seed': 1,
+                 'return_policy': True} for K in (90.0, 110.0)]
+    service = AsyncPricingService(batch_window=0.01)
+    results = asyncio.run(service.price_options(requests, 'least_squares_mc'))
+
+    assert [result['policy'].K for result in results] == [90.0, 110.0]
+    assert service.stats['batches'] == 1
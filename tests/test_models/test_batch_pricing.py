@@ -0,0 +1,78 @@
+import csv
+import pytest
+import numpy as np
+from pricing_library.core.batch_pricing import price_file
+from pricing_library.cli import main
+from pricing_library.models.black_scholes import BlackScholesModel
+
+FIELDS = ['id', 'option_style', 'S', 'K', 'T', 'r', 'sigma', 'option_type', 'barrier_type', 'barrier_level']
+
+def make_rows(n=23):
+    rows = []
+    for i in range(n):
+        row = {'id': f'T{i}', 'option_style': 'european', 'S': 100.0, 'K': 80.0 + 2 * i, 'T': 1.0, 'r': 0.03,
+               'sigma': 0.2, 'option_type': 'call' if i % 2 else 'put', 'barrier_type': '', 'barrier_level': ''}
+        if i % 5 == 0:
+            row.update(option_style='barrier', option_type='call', barrier_type='up-and-out', barrier_level=150.0)
+        rows.append(row)
+    rows[7]['sigma'] = -0.1
+    return rows
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def read_output(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+def test_csv_is_priced_in_chunks(tmp_path):
+    rows = make_rows()
+    write_csv(tmp_path / 'book.csv', rows)
+    report = price_file(str(tmp_path / 'book.csv'), str(tmp_path / 'out.csv'), chunk_size=6)
+    assert report['rows'] == len(rows) and report['chunks'] == 4 and report['errors'] == 1
+    assert report['rows_per_second'] > 0
+
+    output = read_output(tmp_path / 'out.csv')
+    assert [r['id'] for r in output] == [r['id'] for r in rows]
+    assert 'sigma' in output[7]['error'] and output[7]['price'] == 'nan'
+    for row, out in zip(rows, output):
+        if row['option_style'] == 'european' and row['sigma'] > 0:
+            expected = BlackScholesModel().calculate(row['S'], row['K'], row['T'], row['r'], row['sigma'], row['option_type'])
+            assert float(out['price']) == pytest.approx(expected['price'][0])
+        elif row['option_style'] == 'barrier':
+            assert np.isfinite(float(out['price']))
+
+def test_resume_from_checkpoint_matches_full_run(tmp_path):
+    write_csv(tmp_path / 'book.csv', make_rows())
+    source, output = str(tmp_path / 'book.csv'), str(tmp_path / 'out.csv')
+    price_file(source, str(tmp_path / 'full.csv'), chunk_size=5)
+
+    def interrupt(status):
+        if status['chunks'] == 2:
+            raise KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        price_file(source, output, chunk_size=5, progress=interrupt)
+    with open(output, 'a') as f:
+        f.write('T10,partial')
+
+    report = price_file(source, output, chunk_size=5, resume=True)
+    assert report['resumed_from'] == 10 and report['processed'] == 13
+    assert open(output).read() == open(tmp_path / 'full.csv').read()
+    assert price_file(source, output, chunk_size=5, resume=True)['processed'] == 0
+
+def test_npy_columns_and_cli(tmp_path):
+    columns = tmp_path / 'columns'
+    columns.mkdir()
+    K = np.linspace(80, 120, 11)
+    for name, values in {'S': np.full(11, 100.0), 'K': K, 'T': np.full(11, 0.5), 'r': np.full(11, 0.02),
+                         'sigma': np.full(11, 0.25), 'option_type': np.array(['call'] * 11)}.items():
+        np.save(columns / f'{name}.npy', values)
+
+    assert main([str(columns), str(tmp_path / 'out.csv'), '--chunk-size', '4', '--greeks', '--quiet']) == 0
+    output = read_output(tmp_path / 'out.csv')
+    expected = BlackScholesModel().calculate_greeks(100.0, K, 0.5, 0.02, 0.25, 'call')
+    assert np.allclose([float(r['price']) for r in output], expected['price'])
+    assert np.allclose([float(r['delta']) for r in output], expected['delta'])
@@ -25,3 +25,11 @@ def test_put_call_parity(bs_model):
     call = bs_model.calculate(S, K, T, r, sigma, option_type='call')['price']
     put = bs_model.calculate(S, K, T, r, sigma, option_type='put')['price']
     assert abs((call - put) - (S - K*np.exp(-r*T))) < 0.01
+
+def test_strike_maturity_grid(bs_model):
+    K = np.array([90.0, 100.0, 110.0])[:, None]
+    T = np.array([0.25, 0.5, 1.0, 2.0])[None, :]
+    res = bs_model.calculate(100, K, T, 0.05, 0.2, option_type='call')
+    assert res['price'].shape == (3, 4)
+    single = bs_model.calculate(100, 110.0, 0.5, 0.05, 0.2, option_type='call')['price']
+    assert abs(res['price'][2, 1] - single[0]) < 1e-12
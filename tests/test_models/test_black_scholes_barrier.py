@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+from scipy.stats import norm
 from pricing_library.models.black_scholes import BlackScholesModel
 from pricing_library.models.black_scholes_barrier import BlackScholesBarrierModel
 
@@ -63,3 +65,37 @@ def test_in_out_sum_equals_european(option_type):
     
     assert abs(down_in + down_out - euro_price) < 1e-8, f"Down in+out != européen pour {option_type}"
     assert abs(up_in + up_out - euro_price) < 1e-8, f"Up in+out != européen pour {option_type}"
+
+def down_and_out_call_reference(S, K, T, r, sigma, q, H):
+    lam = (r - q + 0.5 * sigma**2) / sigma**2
+    y = np.log(H**2 / (S * K)) / (sigma * np.sqrt(T)) + lam * sigma * np.sqrt(T)
+    down_in = (S * np.exp(-q * T) * (H / S)**(2 * lam) * norm.cdf(y)
+               - K * np.exp(-r * T) * (H / S)**(2 * lam - 2) * norm.cdf(y - sigma * np.sqrt(T)))
+    return euro_model.calculate(S, K, T, r, sigma, 'call', q)['price'] - down_in
+
+def test_dividend_yield_is_honoured():
+    price = barrier_model.calculate(S0, K, T, r, sigma, 'call', 0.03, barrier_type='down-and-out',
+                                    barrier_level=barrier_down)['price']
+    assert price == pytest.approx(down_and_out_call_reference(S0, K, T, r, sigma, 0.03, barrier_down), rel=1e-10)
+    no_dividend = barrier_model.calculate(S0, K, T, r, sigma, 'call', 0.0, barrier_type='down-and-out',
+                                          barrier_level=barrier_down)['price']
+    assert price < no_dividend
+
+def test_vectorized_kernel_matches_scalar_calls():
+    barrier_types = np.array([b for b, _ in barriers] * 2)
+    levels = np.array([h for _, h in barriers] * 2, dtype=float)
+    option_types = np.repeat(options, len(barriers))
+    S = np.linspace(92.0, 108.0, len(levels))
+
+    batch = barrier_model.calculate(S, K, T, r, sigma, option_types, 0.02, barrier_type=barrier_types,
+                                    barrier_level=levels)['price']
+    for i in range(len(levels)):
+        scalar = barrier_model.calculate(S[i], K, T, r, sigma, option_types[i], 0.02, barrier_type=barrier_types[i],
+                                         barrier_level=levels[i])['price']
+        assert batch[i] == pytest.approx(np.asarray(scalar).item(), rel=1e-12)
+
+    breached = barrier_model.calculate(np.array([85.0, 115.0]), K, T, r, sigma, 'call', 0.02,
+                                       barrier_type=np.array(['down-and-out', 'up-and-in']),
+                                       barrier_level=np.array([90.0, 110.0]))['price']
+    vanilla = euro_model.calculate(115.0, K, T, r, sigma, 'call', 0.02)['price']
+    assert breached[0] == 0.0 and breached[1] == pytest.approx(np.asarray(vanilla).item())
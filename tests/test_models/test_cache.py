@@ -0,0 +1,114 @@
+import time
+import threading
+import numpy as np
+from pricing_library.core.cache import ResultCache, _sizeof
+from pricing_library.core.pricing_service import PricingService
+from pricing_library.utils.contract_batch import ContractBatch
+from pricing_library.utils.curves import YieldCurve, DividendCurve
+
+def contract(**overrides):
+    return {'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'call', **overrides}
+
+def test_inputs_within_tolerance_share_an_entry():
+    cache = ResultCache(tolerances={'S': 1e-4})
+    service = PricingService(cache=cache)
+    first = service.price_option(contract())
+    second = service.price_option(contract(S=100.0 + 1e-6))
+    service.price_option(contract(S=100.001))
+
+    assert second['price'] == first['price']
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 2 and len(cache) == 2
+    assert cache.make_key('price', contract(), 'black_scholes') != cache.make_key('price', contract(q=0.01), 'black_scholes')
+
+def test_monte_carlo_is_cached_only_with_a_seed():
+    cache = ResultCache()
+    service = PricingService(cache=cache)
+    params = contract(monte_carlo_paths=2000, monte_carlo_steps=10)
+
+    service.price_option(params, 'monte_carlo')
+    service.price_option(params, 'monte_carlo')
+    assert cache.stats['bypassed'] == 2 and len(cache) == 0
+
+    seeded = {**params, 'seed': 3}
+    first = service.price_option(seeded, 'monte_carlo')
+    second = service.price_option(seeded, 'monte_carlo')
+    assert second['price'] == first['price'] and cache.stats['hits'] == 1
+    assert service.price_option({**seeded, 'seed': 4}, 'monte_carlo')['price'] != first['price']
+
+def test_lru_ttl_and_byte_budget_eviction():
+    cache = ResultCache(max_entries=2)
+    cache.put('a', {'price': 1.0})
+    cache.put('b', {'price': 2.0})
+    assert cache.get('a') == {'price': 1.0}
+    cache.put('c', {'price': 3.0})
+    assert cache.get('b') is None and cache.get('a') is not None and cache.stats['evictions'] == 1
+
+    cache = ResultCache(ttl=0.01)
+    cache.put('a', {'price': 1.0})
+    time.sleep(0.02)
+    assert cache.get('a') is None and cache.stats['expirations'] == 1 and len(cache) == 0
+
+    value = {'price': np.zeros(100)}
+    cache = ResultCache(max_bytes=int(2.5 * _sizeof(value)))
+    for key in 'abc':
+        cache.put(key, value)
+    assert list(cache._entries) == ['b', 'c'] and cache.stats['bytes'] == 2 * _sizeof(value)
+    cache.put('big', {'price': np.zeros(10000)})
+    assert cache.get('big') is None and len(cache) == 2
+
+def test_concurrent_access_keeps_accounting_consistent():
+    cache = ResultCache(max_entries=50)
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(2000):
+                key = (offset + i) % 120
+                if cache.get(key) is None:
+                    cache.put(key, {'price': float(key)})
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work, args=(17 * n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats
+    assert not errors and stats['entries'] <= 50
+    assert stats['bytes'] == sum(size for _, _, size in cache._entries.values())
+    assert stats['hits'] + stats['misses'] == 8 * 2000
+
+def test_contract_batches_are_cached_row_by_row():
+    cache = ResultCache()
+    priced = []
+
+    def compute(batch, method):
+        priced.append(len(batch))
+        return {'price': batch['K'] * 2.0, 'method': method}
+
+    batch = ContractBatch({'S': 100.0, 'K': [90.0, 100.0, 110.0], 'T': 1.0, 'r': 0.03, 'sigma': 0.2,
+                           'option_type': 'call'})
+    cache.get_or_compute('price', batch, 'black_scholes', compute)
+    wider = ContractBatch({'S': 100.0, 'K': [110.0, 120.0, 90.0, 130.0], 'T': 1.0, 'r': 0.03, 'sigma': 0.2,
+                           'option_type': 'call'})
+    result = cache.get_or_compute('price', wider, 'black_scholes', compute)
+
+    assert priced == [3, 2]
+    assert np.array_equal(result['price'], [220.0, 240.0, 180.0, 260.0]) and result['method'] == 'black_scholes'
+    assert cache.stats['hits'] == 2 and len(cache) == 5
+
+def test_curves_are_keyed_by_their_nodes():
+    cache = ResultCache()
+    service = PricingService(cache=cache)
+    curve = lambda rates: YieldCurve([0.5, 1.0, 2.0], rates)
+    params = contract(r=curve([0.02, 0.03, 0.035]), q=DividendCurve([1.0, 2.0], [0.01, 0.015]))
+
+    first = service.price_option(params)
+    second = service.price_option({**params, 'r': curve([0.02, 0.03, 0.035])})
+    shifted = service.price_option({**params, 'r': curve([0.02, 0.04, 0.035])})
+
+    assert second['price'] == first['price'] and shifted['price'] != first['price']
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 2
+    assert first['price'] == PricingService().price_option(params)['price']
@@ -0,0 +1,33 @@
+import numpy as np
+from pricing_library.core.calibration import ModelCalibrator
+from pricing_library.models.fourier import FourierModel
+
+def test_heston_recovers_parameters():
+    true_params = {'v0': 0.03, 'kappa': 2.5, 'theta': 0.05, 'xi': 0.6, 'rho': -0.6}
+    K = np.linspace(80, 120, 15)[None, :]
+    T = np.array([0.25, 1.0, 2.0])[:, None]
+    option_type = np.where(K >= 100, 'call', 'put')
+    market = FourierModel().calculate(100, K, T, 0.03, 0.2, option_type, 0.01, process='heston', **true_params)['price']
+    chain = {'S': 100, 'K': K, 'T': T, 'r': 0.03, 'q': 0.01, 'option_type': option_type, 'price': market}
+
+    calibrator = ModelCalibrator('heston')
+    res = calibrator.calibrate(chain)
+    for name, value in true_params.items():
+        assert abs(res['params'][name] - value) < 1e-4
+
+    warm = calibrator.calibrate(chain)
+    assert warm['warm_start'] and warm['n_evaluations'] < res['n_evaluations']
+
+def test_analytic_jacobian_matches_finite_differences():
+    true_params = {'sigma': 0.18, 'jump_intensity': 0.8, 'jump_mean': -0.12, 'jump_std': 0.15}
+    K = np.linspace(80, 120, 9)[None, :]
+    T = np.array([0.5, 1.0])[:, None]
+    market = FourierModel().calculate(100, K, T, 0.03, option_type='call', q=0.0, process='merton', **true_params)['price']
+    chain = {'S': 100, 'K': K, 'T': T, 'r': 0.03, 'option_type': 'call', 'price': market}
+
+    analytic = ModelCalibrator('merton', error='iv').calibrate(chain)
+    numeric = ModelCalibrator('merton', error='iv', jac='2-point').calibrate(chain)
+    assert analytic['rmse'] < 1e-8 and analytic['n_evaluations'] < numeric['n_evaluations']
+    for name, value in true_params.items():
+        assert abs(analytic['params'][name] - value) < 1e-4
+        assert abs(analytic['params'][name] - numeric['params'][name]) < 1e-4
@@ -0,0 +1,89 @@
+import pytest
+import numpy as np
+from pricing_library.calculators.combination_calculator import OptionCombinationCalculator
+from pricing_library.core.pricing_service import PricingService
+from pricing_library.core.scenario_engine import ScenarioEngine, ScenarioGrid
+from pricing_library.models.black_scholes import BlackScholesModel
+from pricing_library.models.binomial import BinomialModel
+from pricing_library.utils.stochastic_processes.path_cache import PathCache
+
+MARKET = {'S': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2}
+bs = lambda K, option_type, **kw: np.asarray(BlackScholesModel().calculate(
+    kw.get('S', 100.0), K, 1.0, 0.03, kw.get('sigma', 0.2), option_type)['price']).item()
+
+@pytest.mark.parametrize("combination, strikes, legs", [
+    ('straddle', {'K': 100.0}, [(1, 100.0, 'call'), (1, 100.0, 'put')]),
+    ('strangle', {'K_call': 110.0, 'K_put': 90.0}, [(1, 110.0, 'call'), (1, 90.0, 'put')]),
+    ('bull_spread', {'K1': 95.0, 'K2': 105.0}, [(1, 95.0, 'call'), (-1, 105.0, 'call')]),
+    ('bear_spread', {'K1': 95.0, 'K2': 105.0}, [(1, 105.0, 'put'), (-1, 95.0, 'put')])
+])
+def test_templates_match_leg_prices(combination, strikes, legs):
+    result = OptionCombinationCalculator().calculate({**MARKET, **strikes, 'combination': combination})
+    expected = [bs(K, option_type) for _, K, option_type in legs]
+
+    assert result['price'] == pytest.approx([sum(q * p for (q, _, _), p in zip(legs, expected))])
+    for leg, (quantity, K, option_type), price in zip(result['legs'], legs, expected):
+        assert (leg['quantity'], leg['type']) == (quantity, option_type)
+        assert leg['price'] == pytest.approx([price])
+
+def test_shared_legs_are_priced_once_and_aggregated_sparsely():
+    calculator = OptionCombinationCalculator()
+    params = {**MARKET, 'combination': 'bull_spread', 'K1': np.array([90.0, 100.0, 90.0]),
+              'K2': np.array([100.0, 110.0, 110.0])}
+    legs, weights, _, _, shape = calculator._build_legs(params, 'black_scholes')
+
+    assert shape == (3,) and weights.shape == (3, 3) and weights.nnz == 6
+    assert len(legs) == 1 and np.array_equal(np.sort(legs[0]['columns']['K']), [90.0, 100.0, 110.0])
+    price = calculator.calculate(params)['price']
+    assert price == pytest.approx([bs(90.0, 'call') - bs(100.0, 'call'), bs(100.0, 'call') - bs(110.0, 'call'),
+                                   bs(90.0, 'call') - bs(110.0, 'call')])
+
+def test_custom_legs_with_mixed_styles_and_greeks():
+    legs = [
+        {'quantity': 1, 'K': 90.0, 'option_type': 'call'},
+        {'quantity': -2, 'K': 100.0, 'option_type': 'call'},
+        {'quantity': 1, 'K': 110.0, 'option_type': 'call'},
+        {'quantity': 3, 'K': 100.0, 'option_type': 'put', 'option_style': 'american', 'method': 'binomial_tree'}
+    ]
+    calculator = OptionCombinationCalculator()
+    result = calculator.calculate({**MARKET, 'legs': legs, 'binomial_steps': 50})
+
+    american = BinomialModel().calculate(100.0, 100.0, 1.0, 0.03, 0.2, 'put', option_style='american', n_steps=50)
+    butterfly = bs(90.0, 'call') - 2 * bs(100.0, 'call') + bs(110.0, 'call')
+    assert result['price'] == pytest.approx([butterfly + 3 * np.asarray(american['price']).item()])
+
+    greeks = calculator.calculate_greeks({**MARKET, 'legs': legs[:3]})['greeks']
+    single = {K: BlackScholesModel().calculate_greeks(100.0, K, 1.0, 0.03, 0.2, 'call') for K in (90.0, 100.0, 110.0)}
+    expected_delta = single[90.0]['delta'] - 2 * single[100.0]['delta'] + single[110.0]['delta']
+    assert greeks['delta'] == pytest.approx(np.ravel(expected_delta))
+
+def test_market_inputs_are_required_and_validated():
+    calculator = OptionCombinationCalculator()
+    with pytest.raises(ValueError, match='sigma'):
+        calculator.calculate({'S': 100.0, 'T': 1.0, 'r': 0.03, 'K': 100.0, 'combination': 'straddle'})
+    with pytest.raises(ValueError, match='S must be'):
+        calculator.calculate({**MARKET, 'S': -1.0, 'K': 100.0, 'combination': 'straddle'})
+
+def test_multi_dimensional_inputs_keep_their_shape():
+    S = np.array([[90.0, 100.0, 110.0], [95.0, 105.0, 115.0]])
+    result = OptionCombinationCalculator().calculate({**MARKET, 'S': S, 'K': 100.0, 'combination': 'straddle'})
+    assert result['price'].shape == (2, 3) and result['legs'][0]['price'].shape == (2, 3)
+    assert result['price'][1, 2] == pytest.approx(bs(100.0, 'call', S=115.0) + bs(100.0, 'put', S=115.0))
+
+def test_straddle_runs_through_scenario_engine():
+    straddle = {**MARKET, 'K': 100.0, 'combination': 'straddle', 'option_style': 'combination', 'quantity': 2.0}
+    grid = ScenarioGrid(spot=[-0.1, 0.0, 0.1], vol=[0.0, 0.05])
+    result = ScenarioEngine().run([straddle], grid)
+
+    base = bs(100.0, 'call') + bs(100.0, 'put')
+    expected = [2.0 * (bs(100.0, 'call', S=S, sigma=v) + bs(100.0, 'put', S=S, sigma=v) - base)
+                for S, v in zip(100.0 * (1 + grid.spot_shocks), 0.2 + grid.vol_shocks)]
+    assert np.allclose(result['pnl'][0], expected)
+
+def test_shared_sub_calculators_are_not_mutated():
+    service = PricingService(path_cache=PathCache())
+    calculator = service.calculators['combination']
+    calculator.calculate({**MARKET, 'K': 100.0, 'combination': 'straddle', 'monte_carlo_paths': 1000, 'seed': 1},
+                         'monte_carlo')
+    assert all(sub.path_cache is None and sub.executor is None for sub in calculator.calculators.values())
+    assert service.path_cache.stats['misses'] > 0
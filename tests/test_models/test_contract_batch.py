@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+from pricing_library.utils.contract_batch import ContractBatch
+from pricing_library.core.cache import ResultCache
+from pricing_library.core.pricing_service import PricingService
+
+def make_records():
+    return [
+        {'S': 100.0, 'K': 90.0 + 5 * i, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'call' if i % 2 else 'put',
+         'n_steps': 100}
+        for i in range(5)
+    ]
+
+@pytest.mark.parametrize("columns, message", [
+    ({'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.03, 'option_type': 'call'}, 'Missing columns'),
+    ({'S': [100.0, -1.0], 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'call'}, 'S must be'),
+    ({'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': [0.2, 0.0], 'option_type': 'call'}, 'sigma must be'),
+    ({'S': 100.0, 'K': 100.0, 'T': -1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'call'}, 'T must be'),
+    ({'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': np.nan, 'sigma': 0.2, 'option_type': 'call'}, 'r contains NaN'),
+    ({'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': ['call', 'cal']}, 'option_type'),
+    ({'S': [[100.0]], 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'call'}, '1-d')
+])
+def test_validation(columns, message):
+    with pytest.raises(ValueError, match=message):
+        ContractBatch(columns)
+
+def test_from_records_builds_columns_and_settings():
+    records = make_records()
+    records[2]['q'] = 0.01
+    batch = ContractBatch.from_records(records)
+
+    assert len(batch) == 5 and batch.option_style == 'european'
+    assert np.array_equal(batch['K'], [90.0, 95.0, 100.0, 105.0, 110.0])
+    assert np.array_equal(batch['q'], [0.0, 0.0, 0.01, 0.0, 0.0])
+    assert batch.settings == {'n_steps': 100}
+    assert batch.row(1) == {**records[1], 'q': 0.0, 'option_style': 'european'}
+
+    records[3]['n_steps'] = 200
+    with pytest.raises(ValueError, match='same settings'):
+        ContractBatch.from_records(records)
+    with pytest.raises(ValueError, match='empty'):
+        ContractBatch.from_records([])
+
+def test_broadcasting_take_and_group_by():
+    batch = ContractBatch({'S': 100.0, 'K': [90.0, 100.0, 110.0, 100.0], 'T': 1.0, 'r': 0.03, 'sigma': 0.2,
+                           'option_type': ['call', 'put', 'call', 'call']})
+    assert batch['S'].shape == (4,)
+
+    subset = batch.take(np.array([3, 0]))
+    assert len(subset) == 2 and np.array_equal(subset['K'], [100.0, 90.0]) and subset.settings is batch.settings
+
+    groups = batch.group_by('option_type')
+    assert set(groups) == {('call',), ('put',)}
+    assert np.array_equal(groups[('call',)], [0, 2, 3]) and np.array_equal(groups[('put',)], [1])
+    groups = batch.group_by('option_type', 'K')
+    assert np.array_equal(groups[('call', 100.0)], [3])
+    assert np.array_equal(batch.group_by()[()], np.arange(4))
+
+def test_batches_keep_one_exercise_policy_per_row():
+    records = [{'S': 100.0, 'K': K, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'put', 'n_paths': 2000,
+                'n_steps': 20, 'seed': 1, 'return_policy': True} for K in (90.0, 110.0)]
+    batch = ContractBatch.from_records(records, 'american')
+    cache = ResultCache()
+    service = PricingService(cache=cache)
+
+    for _ in range(2):
+        result = service.price_option(batch, 'least_squares_mc')
+        assert result['policy'].shape == (2,) and [policy.K for policy in result['policy']] == [90.0, 110.0]
+    assert cache.stats['hits'] == 2
+    assert result['policy'][0] is not service.price_option(batch, 'least_squares_mc')['policy'][0]
@@ -0,0 +1,48 @@
+import pytest
+import numpy as np
+from pricing_library.utils.curves import YieldCurve, DividendCurve, forward_price, step_rates
+from pricing_library.utils.stochastic_processes.gbm import GeometricBrownianMotion
+from pricing_library.calculators.european_calculator import EuropeanCalculator
+from pricing_library.calculators.american_calculator import AmericanCalculator
+
+rate_curve = YieldCurve([0.25, 0.5, 1.0, 2.0, 5.0], [0.01, 0.02, 0.03, 0.035, 0.04])
+dividend_curve = DividendCurve([1.0, 3.0], [0.01, 0.02])
+
+def test_curve_lookups():
+    assert rate_curve.zero_rate(1.0) == pytest.approx(0.03)
+    assert rate_curve.discount(2.0) == pytest.approx(np.exp(-0.07))
+    assert rate_curve.forward_rate(1.0, 2.0) == pytest.approx(0.04)
+    assert rate_curve.forward_rate(5.0, 7.0) == pytest.approx(rate_curve.forward_rate(2.0, 5.0))
+    assert np.allclose(rate_curve.step_rates(1.0, 4), [0.01, 0.03, 0.04, 0.04])
+    assert YieldCurve.from_discount_factors([1.0, 2.0], rate_curve.discount([1.0, 2.0])).zero_rate(2.0) == pytest.approx(0.035)
+    with pytest.raises(ValueError):
+        YieldCurve([1.0, 0.5], [0.01, 0.02])
+
+def test_gbm_with_stepwise_drift_is_a_martingale():
+    T, n_steps = 2.0, 20
+    z = GeometricBrownianMotion.normals(200000, n_steps, seed=1)
+    paths = GeometricBrownianMotion.paths_from_normals(
+        100.0, T, step_rates(rate_curve.zero_rate(T), T, n_steps, rate_curve), 0.2,
+        step_rates(dividend_curve.zero_rate(T), T, n_steps, dividend_curve), z
+    )
+    for step, t in ((10, 1.0), (20, 2.0)):
+        assert paths[:, step].mean() == pytest.approx(forward_price(100.0, t, rate_curve, dividend_curve), rel=2e-3)
+
+def test_calculators_accept_curves():
+    params = {'S': 100.0, 'K': np.array([90.0, 100.0, 110.0]), 'T': np.array([0.5, 1.0, 2.0]), 'sigma': 0.2,
+              'option_type': 'call', 'r': rate_curve, 'q': dividend_curve}
+    calculator = EuropeanCalculator()
+    curve_prices = calculator.calculate(params, 'black_scholes')['price']
+    flat_prices = calculator.calculate({**params, 'r': rate_curve.zero_rate(params['T']),
+                                        'q': dividend_curve.zero_rate(params['T'])}, 'black_scholes')['price']
+    assert np.allclose(curve_prices, flat_prices)
+
+    mc = calculator.calculate({**params, 'monte_carlo_paths': 100000, 'monte_carlo_steps': 20, 'seed': 2}, 'monte_carlo')
+    assert np.allclose(mc['price'], curve_prices, rtol=0.02)
+
+    american = {'S': 100.0, 'K': 100.0, 'T': 1.0, 'sigma': 0.2, 'option_type': 'put',
+                'monte_carlo_paths': 20000, 'monte_carlo_steps': 20, 'seed': 1}
+    flat = AmericanCalculator().calculate({**american, 'r': 0.03, 'q': 0.01}, 'least_squares_mc')['price']
+    curve = AmericanCalculator().calculate({**american, 'r': YieldCurve.flat(0.03), 'q': DividendCurve.flat(0.01)},
+                                           'least_squares_mc')['price']
+    assert curve == pytest.approx(flat)
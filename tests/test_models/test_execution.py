@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+from pricing_library.core.execution import ProcessPoolBackend
+from pricing_library.core.pricing_service import PricingService
+from pricing_library.utils.stochastic_processes.path_cache import PathCache
+
+@pytest.fixture(scope='module')
+def backend():
+    with ProcessPoolBackend(max_workers=2, min_block_paths=5000) as backend:
+        yield backend
+
+def test_monte_carlo_is_bit_identical_across_workers(backend):
+    params = {'S': 100.0, 'K': 105.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.25, 'option_type': 'call',
+              'option_style': 'european', 'monte_carlo_paths': 20000, 'monte_carlo_steps': 50, 'seed': 11}
+    serial = PricingService().price_option(params, 'monte_carlo')
+    parallel = PricingService(executor=backend).price_option(params, 'monte_carlo')
+
+    assert backend.should_split(20000)
+    assert parallel['price'] == serial['price']
+    assert parallel['std_error'] == serial['std_error']
+
+def test_rows_and_groups_match_serial_pricing(backend):
+    book = [
+        {'S': 100.0, 'K': 90.0 + 5 * i, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'put',
+         'option_style': 'american' if i % 2 else 'european', 'method': 'binomial_tree'}
+        for i in range(8)
+    ]
+    serial = PricingService().price_portfolio(book)
+    parallel = PricingService(executor=backend).price_portfolio(book)
+
+    assert np.array_equal(parallel['price'], serial['price'])
+    assert [(g['option_style'], g['n_trades']) for g in parallel['groups']] == \
+        [(g['option_style'], g['n_trades']) for g in serial['groups']]
+
+def test_path_cache_stays_in_the_parent_process(backend):
+    european = {'S': 100.0, 'K': 105.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.25, 'option_type': 'call',
+                'option_style': 'european', 'monte_carlo_paths': 20000, 'monte_carlo_steps': 20, 'seed': 11}
+    american = {'S': 100.0, 'K': np.array([95.0, 105.0]), 'T': 1.0, 'r': 0.03, 'sigma': 0.25, 'option_type': 'put',
+                'option_style': 'american', 'n_paths': 2000, 'n_steps': 20, 'seed': 11}
+    service = PricingService(executor=backend, path_cache=PathCache())
+
+    assert service.price_option(european, 'monte_carlo')['price'] == \
+        PricingService().price_option(european, 'monte_carlo')['price']
+    assert np.array_equal(service.price_option(american)['price'], PricingService().price_option(american)['price'])
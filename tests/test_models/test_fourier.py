@@ -0,0 +1,38 @@
+import pytest
+import numpy as np
+from pricing_library.models.fourier import FourierModel
+from pricing_library.models.black_scholes import BlackScholesModel
+
+@pytest.mark.parametrize("fourier_method", ["cos", "fft"])
+def test_black_scholes_strike_grid(fourier_method):
+    K = np.linspace(60, 160, 101)
+    ref = BlackScholesModel().calculate(100, K, 1.0, 0.05, 0.2, option_type='put', q=0.02)['price']
+    res = FourierModel().calculate(100, K, 1.0, 0.05, 0.2, option_type='put', q=0.02, fourier_method=fourier_method)
+    assert np.abs(res['price'] - ref).max() < 1e-5
+
+@pytest.mark.parametrize("fourier_method", ["cos", "fft"])
+def test_heston_call(fourier_method):
+    res = FourierModel().calculate(100, 100, 1.0, 0.05, 0.2, option_type='call', fourier_method=fourier_method,
+                                   process='heston', v0=0.04, kappa=2.0, theta=0.04, xi=0.5, rho=-0.7)
+    assert abs(res['price'][0] - 10.154627) < 1e-4
+
+@pytest.mark.parametrize("process, params", [
+    ('gbm', {'sigma': 0.2}),
+    ('merton', {'sigma': 0.2, 'jump_intensity': 0.7, 'jump_mean': -0.1, 'jump_std': 0.2}),
+    ('heston', {'v0': 0.03, 'kappa': 2.5, 'theta': 0.05, 'xi': 0.6, 'rho': -0.6})
+])
+def test_cos_gradient_matches_finite_differences(process, params):
+    K = np.linspace(80, 120, 5)[None, :]
+    T = np.array([0.25, 1.0, 2.0])[:, None]
+    option_type = np.where(K >= 100, 'call', 'put')
+    price = lambda p: FourierModel().calculate(100, K, T, 0.03, p.pop('sigma', 0.2), option_type, 0.01,
+                                               process=process, **p)['price']
+    res = FourierModel().calculate_gradient(100, K, T, 0.03, params.get('sigma', 0.2), option_type, 0.01,
+                                            parameters=tuple(params), process=process,
+                                            **{k: v for k, v in params.items() if k != 'sigma'})
+
+    assert res['gradient'].shape == (3, 5, len(params))
+    for j, name in enumerate(params):
+        h = 1e-5
+        bumped = (price({**params, name: params[name] + h}) - price({**params, name: params[name] - h})) / (2 * h)
+        assert np.abs(res['gradient'][..., j] - bumped).max() < 1e-5
@@ -0,0 +1,18 @@
+import pytest
+import numpy as np
+from pricing_library.models.monte_carlo import VanillaMonteCarlo
+from pricing_library.utils.stochastic_processes.heston import HestonProcess
+
+heston_params = {'v0': 0.04, 'kappa': 2.0, 'theta': 0.04, 'xi': 0.5, 'rho': -0.7}
+
+def test_forward_is_martingale():
+    paths = HestonProcess.simulate(100, 1.0, 0.05, 0.2, 0.02, n_paths=100000, n_steps=50, seed=1, **heston_params)
+    forward = 100 * np.exp((0.05 - 0.02) * 1.0)
+    assert abs(paths[:, -1].mean() - forward) / forward < 0.005
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_vanilla_monte_carlo_heston(option_type):
+    res = VanillaMonteCarlo().calculate(100, 100, 1.0, 0.05, 0.2, option_type, n_paths=100000, n_steps=50,
+                                        seed=7, process='heston', **heston_params)
+    ref = {'call': 10.1546, 'put': 5.2775}[option_type]
+    assert abs(res['price'] - ref) < 4 * res['std_error']
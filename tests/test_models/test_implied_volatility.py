@@ -0,0 +1,34 @@
+import numpy as np
+from pricing_library.models.implied_volatility import ImpliedVolatility, AmericanImpliedVolatility
+from pricing_library.models.american_analytic import AnalyticAmericanModel
+from pricing_library.models.black_scholes import BlackScholesModel
+
+S, r, q = 100.0, 0.05, 0.02
+K = np.array([80.0, 95.0, 100.0, 105.0, 120.0])
+T = np.array([0.25, 0.5, 1.0, 1.5, 2.0])
+sigma = np.array([0.15, 0.25, 0.3, 0.4, 0.55])
+
+def test_batch_matches_european_volatility():
+    prices = BlackScholesModel().calculate(S, K, T, r, sigma, 'call', q)['price']
+    iv = ImpliedVolatility.calculate_batch({'S': S, 'K': K, 'T': T, 'r': r, 'q': q, 'option_type': 'call', 'price': prices})
+    assert np.allclose(iv, sigma, atol=1e-6)
+
+    grid = BlackScholesModel().calculate(S, K[None, :], T[:, None], r, sigma[:, None], 'put', q)['price']
+    iv = ImpliedVolatility.calculate_batch({'S': S, 'K': K[None, :], 'T': T[:, None], 'r': r, 'q': q,
+                                            'option_type': 'put', 'price': grid})
+    assert iv.shape == (5, 5) and np.allclose(iv, np.broadcast_to(sigma[:, None], (5, 5)), atol=1e-6)
+
+def test_american_inversion_and_deamericanization():
+    prices = AnalyticAmericanModel().calculate(S, K, T, r, sigma, 'put', q)['price']
+    res = AmericanImpliedVolatility.calculate(
+        {'S': S, 'K': K, 'T': T, 'r': r, 'q': q, 'option_type': 'put', 'price': prices}, mode='deamericanize'
+    )
+    assert np.all(res['converged'])
+    assert np.allclose(res['implied_vol'], sigma, atol=1e-5)
+    european = BlackScholesModel().calculate(S, K, T, r, sigma, 'put', q)['price']
+    assert np.allclose(res['european_price'], european, atol=1e-6)
+    assert np.all(res['early_exercise_premium'] >= 0)
+
+def test_price_below_intrinsic_is_not_solved():
+    res = AmericanImpliedVolatility.calculate({'S': 80.0, 'K': 100.0, 'T': 1.0, 'r': r, 'price': 15.0})
+    assert np.isnan(res['implied_vol'][0]) and not res['converged'][0]
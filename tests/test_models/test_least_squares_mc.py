@@ -1,6 +1,10 @@
 import pytest
+import numpy as np
 from pricing_library.models.least_squares_mc import LeastSquaresMC
 from pricing_library.models.black_scholes import BlackScholesModel
+from pricing_library.models.exercise_policy import ExercisePolicy
+from pricing_library.models.binomial import BinomialModel
+from pricing_library.utils.stochastic_processes.gbm import GeometricBrownianMotion
 
 lsm_model = LeastSquaresMC()
 euro_model = BlackScholesModel()
@@ -36,3 +40,21 @@ def test_american_vs_european(option_type):
         assert abs(american_price - european_price) / european_price < 0.01, (
             f"Prix américain {american_price} trop différent du prix européen {european_price} pour un call"
         )
+
+def test_exported_policy_reprices_same_paths():
+    res = lsm_model.calculate(S=S0, K=K, r=r, sigma=sigma, T=T, option_type="put",
+                              n_paths=5000, n_steps=50, seed=11, return_policy=True)
+    policy = ExercisePolicy.from_json(res['policy'].to_json())
+    paths = GeometricBrownianMotion.simulate(S0, T, r, sigma, 0.0, 5000, 50, seed=11)
+    price, _ = policy.evaluate(paths)
+    assert abs(price - res['price']) < 1e-10
+    assert np.nanmax(policy.boundary) < K
+
+def test_bermudan_exercise_dates():
+    dates = np.linspace(1 / 12, 1, 12)
+    res = lsm_model.calculate(S=S0, K=K, r=r, sigma=sigma, T=T, option_type="put", n_paths=50000,
+                              n_steps=240, seed=5, exercise_dates=dates, return_policy=True)
+    ref = BinomialModel().calculate(S0, K, T, r, sigma, 'put', n_steps=1200, option_style='bermudan',
+                                    exercise_dates=dates)['price']
+    assert res['option_style'] == 'bermudan' and len(res['policy'].exercise_steps) == 11
+    assert abs(res['price'] - ref) < 4 * res['std_error'] + 0.02
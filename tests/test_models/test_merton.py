@@ -0,0 +1,25 @@
+import numpy as np
+from pricing_library.models.merton import MertonJumpDiffusionModel
+from pricing_library.models.fourier import FourierModel
+from pricing_library.models.black_scholes import BlackScholesModel
+from pricing_library.models.monte_carlo import VanillaMonteCarlo
+
+jump_params = {'jump_intensity': 0.8, 'jump_mean': -0.1, 'jump_std': 0.2}
+
+def test_series_matches_fourier():
+    K = np.linspace(70, 140, 30)[:, None]
+    T = np.array([0.1, 1.0, 3.0])[None, :]
+    series = MertonJumpDiffusionModel().calculate(100, K, T, 0.03, 0.15, 'put', 0.01, **jump_params)['price']
+    fourier = FourierModel().calculate(100, K, T, 0.03, 0.15, 'put', 0.01, process='merton', **jump_params)['price']
+    assert np.abs(series - fourier).max() < 1e-6
+
+def test_no_jumps_reduces_to_black_scholes():
+    res = MertonJumpDiffusionModel().calculate(100, 100, 1.0, 0.05, 0.2, 'call')
+    ref = BlackScholesModel().calculate(100, 100, 1.0, 0.05, 0.2, 'call')['price']
+    assert abs(res['price'][0] - ref[0]) < 1e-12 and res['n_terms'][0] == 1
+
+def test_monte_carlo_paths():
+    ref = MertonJumpDiffusionModel().calculate(100, 100, 1.0, 0.03, 0.15, 'call', **jump_params)['price'][0]
+    res = VanillaMonteCarlo().calculate(100, 100, 1.0, 0.03, 0.15, 'call', n_paths=100000, n_steps=50,
+                                        seed=3, process='merton', **jump_params)
+    assert abs(res['price'] - ref) < 4 * res['std_error']
@@ -0,0 +1,37 @@
+import pytest
+import numpy as np
+from pricing_library.utils.stochastic_processes import get_process
+from pricing_library.utils.stochastic_processes.path_cache import PathCache
+
+@pytest.mark.parametrize("name, params", [
+    ('gbm', {}),
+    ('heston', {'kappa': 2.0, 'xi': 0.4, 'rho': -0.5}),
+    ('merton', {'lam': 0.5, 'mu_j': -0.1, 'delta': 0.2})
+])
+def test_rescaled_paths_match_fresh_simulation_bit_for_bit(name, params):
+    process = get_process(name)
+    cache = PathCache()
+    process.simulate(100.0, 1.0, 0.03, 0.2, 0.01, 500, 20, seed=5, path_cache=cache, **params)
+
+    cached = process.simulate(123.4, 1.0, 0.03, 0.2, 0.01, 500, 20, seed=5, path_cache=cache, **params)
+    fresh = process.simulate(123.4, 1.0, 0.03, 0.2, 0.01, 500, 20, seed=5, **params)
+    assert cache.stats == {'hits': 1, 'misses': 1, 'evictions': 0}
+    assert np.array_equal(cached, fresh)
+
+def test_lru_and_byte_budget_eviction():
+    simulate = lambda: np.zeros((100, 11))
+    cache = PathCache(max_entries=2)
+    for key in ('a', 'b'):
+        cache.unit_paths(key, simulate)
+    cache.unit_paths('a', simulate)
+    cache.unit_paths('c', simulate)
+    assert list(cache._entries) == ['a', 'c'] and cache.stats['evictions'] == 1
+
+    nbytes = simulate().nbytes
+    cache = PathCache(max_bytes=int(2.5 * nbytes))
+    for key in ('a', 'b', 'c'):
+        cache.unit_paths(key, simulate)
+    assert list(cache._entries) == ['b', 'c'] and cache.nbytes == 2 * nbytes
+
+    paths = cache.unit_paths('huge', lambda: np.zeros((1000, 11)))
+    assert paths.shape == (1000, 11) and 'huge' not in cache._entries and not paths.flags.writeable
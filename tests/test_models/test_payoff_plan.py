@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from pricing_library.utils.payoff import intrinsic_value, asian_payoff, gap_payoff
+from pricing_library.utils.payoff_plan import compile_payoff
+from pricing_library.models.monte_carlo import VanillaMonteCarlo
+
+paths = np.random.default_rng(0).lognormal(np.log(100), 0.2, size=(1000, 13))
+
+def test_expressions_match_payoff_functions():
+    plan = compile_payoff({
+        'call': 'max(S - K, 0)',
+        'asian_put': 'max(K - average, 0)',
+        'up_and_out': 'max(S - K, 0) * (1 - hit_above(B))',
+        'gap': '(S > K1) * max(S - K2, 0)'
+    })
+    values = plan.evaluate(paths, K=100, B=130, K1=100, K2=105)
+    assert values.shape == (1000, 4)
+    assert np.allclose(values[:, 0], intrinsic_value(paths[:, -1], 100))
+    assert np.allclose(values[:, 1], asian_payoff(paths, 100, 'put'))
+    assert np.allclose(values[:, 2], intrinsic_value(paths[:, -1], 100) * (paths.max(axis=1) < 130))
+    assert np.allclose(values[:, 3], gap_payoff(paths[:, -1], 100, 105))
+
+def test_shared_subexpressions_are_compiled_once():
+    plan = compile_payoff(['max(S - K, 0)', 'max(0, S - K) * hit_above(B)', 'path_max - S'])
+    assert sum(step[0] == 'max' for step in plan.steps) == 1
+    assert sum(step == ('reduce', 'path_max') for step in plan.steps) == 1
+
+def test_invalid_expressions():
+    with pytest.raises(ValueError):
+        compile_payoff('S.mean()')
+    with pytest.raises(ValueError):
+        compile_payoff('max(S - K, 0)').evaluate(paths)
+
+def test_custom_monte_carlo_matches_vanilla():
+    kwargs = {'n_paths': 20000, 'n_steps': 10, 'seed': 3}
+    vanilla = VanillaMonteCarlo().calculate(100, 100, 1, 0.05, 0.2, 'call', **kwargs)
+    custom = VanillaMonteCarlo().calculate(100, 100, 1, 0.05, 0.2, 'call', option_style='custom',
+                                           payoff=['max(S - K, 0)', 'max(K - S, 0)'], **kwargs)
+    assert custom['price'][0] == pytest.approx(vanilla['price'])
+    assert custom['price'][0] - custom['price'][1] == pytest.approx(100 - 100 * np.exp(-0.05), abs=0.3)
@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from pricing_library.core.pricing_graph import PricingGraph
+from pricing_library.models.black_scholes import BlackScholesModel
+from pricing_library.utils.curves import YieldCurve
+
+def make_book():
+    trades = []
+    for i, underlying in enumerate(['AAA', 'BBB', 'CCC'] * 4):
+        trades.append({'underlying': underlying, 'S': 100.0, 'K': 90.0 + 5 * (i % 4), 'T': 1.0, 'r': 0.03,
+                       'sigma': 0.2, 'option_type': 'call' if i % 2 else 'put', 'option_style': 'european'})
+    trades.append({'underlying': 'AAA', 'S': 100.0, 'K': 100.0, 'T': 0.5, 'r': 0.03, 'sigma': 0.2,
+                   'option_type': 'put', 'option_style': 'american', 'method': 'binomial_tree'})
+    return trades
+
+def exact(trades, spot):
+    return np.array([
+        BlackScholesModel().calculate(spot.get(t['underlying'], 100.0), t['K'], t['T'], t['r'], t['sigma'], t['option_type'])['price'][0]
+        for t in trades if t['option_style'] == 'european'
+    ])
+
+def test_only_dependent_positions_are_repriced():
+    trades = make_book()
+    graph = PricingGraph()
+    graph.add_positions(trades)
+
+    res = graph.update(spot={'AAA': 105.0})
+    assert res['touched'] == 5 and res['repriced'] == 5
+    assert np.allclose(res['price'][:12], exact(trades, {'AAA': 105.0}))
+
+    res = graph.update(spot={'AAA': 105.0, 'ZZZ': 1.0})
+    assert res['touched'] == 0
+    res = graph.update(rate={'default': 0.04})
+    assert res['repriced'] == len(trades)
+
+def test_taylor_estimates_below_threshold():
+    trades = make_book()[:12]
+    graph = PricingGraph(taylor=True, thresholds={'spot': 0.01})
+    graph.add_positions(trades)
+
+    res = graph.update(spot={'BBB': 100.5})
+    assert res['repriced'] == 0 and res['estimated'] == 4
+    assert np.allclose(res['price'], exact(trades, {'BBB': 100.5}), atol=1e-3)
+
+    res = graph.update(spot={'BBB': 102.0})
+    assert res['repriced'] == 4
+    assert np.allclose(res['price'], exact(trades, {'BBB': 102.0}))
+    assert graph.stats['updates'] == 2 and graph.stats['estimated'] == 4
+
+def test_positions_need_an_underlying():
+    with pytest.raises(ValueError):
+        PricingGraph().add_positions([{'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'call'}])
+
+def test_rate_updates_shift_curve_backed_positions():
+    curve = YieldCurve([0.5, 1.0, 2.0], [0.02, 0.03, 0.035])
+    trades = [{'underlying': 'AAA', 'currency': 'USD', 'S': 100.0, 'K': 90.0 + 10 * i, 'T': 0.5 + 0.5 * i,
+               'r': curve, 'sigma': 0.2, 'option_type': 'call'} for i in range(3)]
+    graph = PricingGraph()
+    graph.add_positions(trades)
+    res = graph.update(rate={'USD': 0.01})
+
+    expected = [BlackScholesModel().calculate(100.0, t['K'], t['T'], curve.zero_rate(t['T']) + 0.01, 0.2, 'call')['price'][0]
+                for t in trades]
+    assert res['repriced'] == 3 and np.allclose(res['price'], expected)
+    with pytest.raises(ValueError, match='mixes curves'):
+        graph.add_positions([{**trades[0], 'r': 0.03}])
+
+def test_combination_positions_carry_aggregated_greeks():
+    market = {'underlying': 'AAA', 'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2}
+    trades = [{**market, 'option_style': 'combination', 'combination': 'straddle'},
+              {**market, 'option_type': 'call'}, {**market, 'option_type': 'put'}]
+    graph = PricingGraph()
+    graph.add_positions(trades)
+    res = graph.update(spot={'AAA': 105.0})
+
+    assert res['repriced'] == 3 and res['price'][0] == pytest.approx(res['price'][1] + res['price'][2])
+    for greek in ('delta', 'gamma', 'vega'):
+        assert graph.risk[greek][0] == pytest.approx(graph.risk[greek][1] + graph.risk[greek][2])
@@ -0,0 +1,70 @@
+import numpy as np
+from pricing_library.core.pricing_service import PricingService
+from pricing_library.core.cache import ResultCache
+from pricing_library.utils.curves import YieldCurve, DividendCurve
+
+def make_book():
+    base = {'S': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2}
+    book = []
+    for i in range(12):
+        kind = i % 4
+        if kind == 0:
+            book.append({**base, 'K': 90.0 + i, 'option_type': 'call', 'option_style': 'european'})
+        elif kind == 1:
+            book.append({**base, 'K': 95.0 + i, 'option_type': 'put', 'option_style': 'american',
+                         'method': 'binomial_tree'})
+        elif kind == 2:
+            book.append({**base, 'K': 100.0, 'option_type': 'call', 'option_style': 'barrier',
+                         'barrier_type': 'up-and-out', 'barrier_level': 120.0 + i})
+        else:
+            book.append({**base, 'K1': 100.0, 'K2': 95.0 + i, 'option_type': 'put', 'option_style': 'gap'})
+    book.append({**base, 'K': 100.0, 'option_type': 'put', 'option_style': 'european', 'method': 'binomial_tree'})
+    return book
+
+def test_price_portfolio_scatters_groups_back_in_trade_order():
+    service = PricingService()
+    book = make_book()
+    result = service.price_portfolio(book)
+
+    expected = []
+    for trade in book:
+        params = {k: v for k, v in trade.items() if k != 'method'}
+        expected.append(np.asarray(service.price_option(params, trade.get('method'))['price']).item())
+    assert np.allclose(result['price'], expected)
+
+    counts = {(g['option_style'], g['method']): g['n_trades'] for g in result['groups']}
+    assert counts == {('european', None): 3, ('american', 'binomial_tree'): 3, ('barrier', None): 3,
+                      ('gap', None): 3, ('european', 'binomial_tree'): 1}
+    assert sum(counts.values()) == len(book)
+    assert all(g['elapsed'] >= 0 for g in result['groups'])
+
+def test_price_portfolio_on_curves():
+    rates = YieldCurve([0.5, 1.0, 2.0], [0.02, 0.03, 0.035])
+    dividends = DividendCurve([1.0, 2.0], [0.01, 0.015])
+    book = [{'S': 100.0, 'K': 90.0 + 10 * i, 'T': 0.5 + 0.5 * i, 'r': rates, 'q': dividends, 'sigma': 0.2,
+             'option_type': 'call' if i % 2 else 'put'} for i in range(3)]
+    book.append({**book[0], 'r': YieldCurve([0.5, 1.0, 2.0], [0.01, 0.02, 0.025])})
+    book.append({**book[1], 'r': 0.03, 'q': 0.0})
+    book.append({'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': rates, 'sigma': 0.2, 'option_style': 'combination',
+                 'combination': 'straddle'})
+
+    cache = ResultCache()
+    service = PricingService(cache=cache)
+    result = service.price_portfolio(book)
+    expected = [np.asarray(PricingService().price_option(trade)['price']).item() for trade in book]
+
+    assert np.allclose(result['price'], expected) and len(result['groups']) == 4
+    assert np.array_equal(service.price_portfolio(book)['price'], result['price']) and cache.stats['hits'] == len(book)
+
+def test_long_schedules_are_grouped_by_value():
+    dates = np.linspace(0.001, 1.0, 2000)
+    shifted = dates.copy()
+    shifted[1000] += 1e-4
+    trade = {'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'put',
+             'option_style': 'bermudan'}
+    service = PricingService()
+    book = [{**trade, 'exercise_dates': dates}, {**trade, 'exercise_dates': shifted},
+            {**trade, 'exercise_dates': dates.copy()}]
+
+    assert repr(dates) == repr(shifted)
+    assert [indices.tolist() for _, _, indices in service.group_trades(book)] == [[0, 2], [1]]
@@ -0,0 +1,18 @@
+import pytest
+import numpy as np
+from pricing_library.utils.regression import get_regressor
+
+@pytest.mark.parametrize("regression_type", ["polynomial", "laguerre", "hermite", "chebyshev"])
+def test_polynomial_bases_recover_cubic(regression_type):
+    x = np.linspace(0.6, 1.4, 200)
+    y = 1.0 - 2.0 * x + 0.5 * x**2 + 3.0 * x**3
+    fitted = get_regressor(regression_type, degree=3).fit_predict(x, y, x)
+    assert np.abs(fitted - y).max() < 1e-9
+
+def test_piecewise_linear_matches_lstsq():
+    x = np.random.default_rng(0).uniform(0.5, 1.5, 500)
+    y = np.maximum(1.0 - x, 0.0) + 0.1 * x
+    regressor = get_regressor('piecewise_linear', degree=4)
+    design = regressor.design(x, (x.min(), x.max()))
+    ref = design @ np.linalg.lstsq(design, y, rcond=None)[0]
+    assert np.abs(regressor.fit_predict(x, y, x) - ref).max() < 1e-10
@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+from pricing_library.core.result_store import SQLiteResultStore
+from pricing_library.core.cache import ResultCache
+from pricing_library.core.pricing_service import PricingService
+from pricing_library.utils.curves import YieldCurve
+
+def make_book():
+    return [
+        {'S': 100.0, 'K': 90.0 + 5 * i, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'call' if i % 2 else 'put'}
+        for i in range(6)
+    ]
+
+def test_round_trip_across_restarts_and_versions(tmp_path):
+    path = str(tmp_path / 'results.db')
+    store = SQLiteResultStore(path, version='1')
+    items = [(('price', i), {'price': float(i), 'grid': np.arange(3.0) * i, 'method': 'bs'}) for i in range(4)]
+    store.put_many(items)
+    store.close()
+
+    store = SQLiteResultStore(path, version='1')
+    found = store.get_many([key for key, _ in items] + [('price', 99)])
+    assert len(store) == 4 and set(found) == {key for key, _ in items}
+    assert found[('price', 2)]['price'] == 2.0 and np.array_equal(found[('price', 2)]['grid'], [0.0, 2.0, 4.0])
+    store.close()
+
+    store = SQLiteResultStore(path, version='2')
+    assert store.get_many([key for key, _ in items]) == {}
+    store.close()
+
+def test_eviction_keeps_recently_accessed_entries(tmp_path):
+    store = SQLiteResultStore(str(tmp_path / 'results.db'), max_entries=3, version='1')
+    store.put_many([(('k', 0), {'price': 0.0})])
+    store.put_many([(('k', 1), {'price': 1.0})])
+    store.put_many([(('k', 2), {'price': 2.0})])
+    store.get_many([('k', 0)])
+    store.put_many([(('k', 3), {'price': 3.0})])
+
+    assert len(store) == 3
+    assert set(store.get_many([('k', i) for i in range(4)])) == {('k', 0), ('k', 2), ('k', 3)}
+
+def test_keys_are_canonical_rather_than_identity_based(tmp_path):
+    store = SQLiteResultStore(str(tmp_path / 'results.db'), version='1')
+    curve = lambda: YieldCurve([1.0, 2.0], [0.02, 0.03])
+    assert store.hash_key(('price', curve(), np.arange(3.0))) == store.hash_key(('price', curve(), np.arange(3.0)))
+    assert store.hash_key(('price', 1.0)) != store.hash_key(('price', 1))
+
+    class Opaque:
+        pass
+    with pytest.raises(TypeError):
+        store.hash_key(('price', Opaque()))
+    store.put_many([(('price', Opaque()), {'price': 1.0}), (('price', 'plain'), {'price': 2.0})])
+    assert len(store) == 1 and store.get_many([('price', Opaque())]) == {}
+
+def test_warm_up_preloads_a_fresh_cache(tmp_path):
+    path = str(tmp_path / 'results.db')
+    book = make_book()
+    first = PricingService(cache=ResultCache(backend=SQLiteResultStore(path, version='1')))
+    expected = first.price_portfolio(book)['price']
+
+    cache = ResultCache(backend=SQLiteResultStore(path, version='1'))
+    service = PricingService(cache=cache)
+    assert service.warm_up(book) == len(book)
+    assert np.array_equal(service.price_portfolio(book)['price'], expected)
+    assert cache.stats['hits'] == len(book) and cache.stats['backend_hits'] == 0
+
+def test_exercise_policies_are_persisted_and_never_shared(tmp_path):
+    path = str(tmp_path / 'results.db')
+    params = {'S': 100.0, 'K': 100.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'put', 'option_style': 'american',
+              'n_paths': 2000, 'n_steps': 20, 'seed': 1, 'return_policy': True}
+    service = PricingService(cache=ResultCache(backend=SQLiteResultStore(path, version='1')))
+    first = service.price_option(params, 'least_squares_mc')
+    second = service.price_option(params, 'least_squares_mc')
+
+    assert service.cache.stats['hits'] == 1 and second['policy'] is not first['policy']
+    second['policy'].boundary[:] = 0.0
+    assert not np.all(service.price_option(params, 'least_squares_mc')['policy'].boundary == 0.0)
+
+    restored = PricingService(cache=ResultCache(backend=SQLiteResultStore(path, version='1')))
+    third = restored.price_option(params, 'least_squares_mc')
+    assert restored.cache.stats['backend_hits'] == 1 and third['price'] == first['price']
+    assert third['policy'].to_dict() == first['policy'].to_dict()
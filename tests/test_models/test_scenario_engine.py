@@ -0,0 +1,41 @@
+import pytest
+import numpy as np
+from pricing_library.core.scenario_engine import ScenarioEngine, ScenarioGrid
+from pricing_library.models.black_scholes import BlackScholesModel
+
+def make_book():
+    return [
+        {'S': 100.0, 'K': 95.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'call', 'quantity': 10.0},
+        {'S': 50.0, 'K': 55.0, 'T': 0.5, 'r': 0.03, 'sigma': 0.3, 'option_type': 'put', 'quantity': -4.0},
+        {'S': 100.0, 'K': 105.0, 'T': 1.0, 'r': 0.03, 'sigma': 0.2, 'option_type': 'put'}
+    ]
+
+def test_pnl_cube_matches_closed_form_and_is_chunk_invariant():
+    book = make_book()
+    grid = ScenarioGrid(spot=[-0.1, 0.0, 0.1], vol=[-0.05, 0.0, 0.05], rate=[0.0, 0.01])
+    result = ScenarioEngine().run(book, grid)
+
+    model = BlackScholesModel()
+    for i, trade in enumerate(book):
+        base = model.calculate(trade['S'], trade['K'], trade['T'], trade['r'], trade['sigma'], trade['option_type'])
+        shocked = model.calculate(trade['S'] * (1 + grid.spot_shocks), trade['K'], trade['T'],
+                                  trade['r'] + grid.rate_shocks, trade['sigma'] + grid.vol_shocks, trade['option_type'])
+        expected = trade.get('quantity', 1.0) * (shocked['price'] - base['price'])
+        assert np.allclose(result['pnl'][i], expected)
+
+    assert result['pnl'].shape == (3, len(grid))
+    assert result['pnl'].reshape(3, *grid.shape)[:, 1, 1, 0] == pytest.approx(0.0)
+
+    chunked = ScenarioEngine(max_cells=5).run(book, grid)
+    assert chunked['groups'][0]['n_chunks'] > 1 and result['groups'][0]['n_chunks'] == 1
+    assert np.array_equal(chunked['pnl'], result['pnl'])
+
+def test_monte_carlo_groups_reuse_paths_across_scenarios():
+    book = [{**trade, 'monte_carlo_paths': 2000, 'monte_carlo_steps': 10} for trade in make_book()[:1]]
+    engine = ScenarioEngine()
+    grid = ScenarioGrid(spot=[-0.05, 0.0, 0.05])
+    result = engine.run(book, grid, method='monte_carlo')
+
+    assert result['pnl'][0, 1] == 0.0
+    assert np.all(np.diff(result['prices'][0]) > 0)
+    assert engine.service.path_cache.stats['hits'] > 0
@@ -0,0 +1,57 @@
+import asyncio
+import numpy as np
+from pricing_library.core.streaming import TickSimulator, QuotePipeline
+from pricing_library.models.black_scholes import BlackScholesModel
+
+def make_book(underlyings=('AAA', 'BBB', 'CCC', 'DDD'), per_underlying=5):
+    return [
+        {'underlying': name, 'S': 100.0, 'K': 90.0 + 5 * i, 'T': 1.0, 'r': 0.03, 'sigma': 0.2,
+         'option_type': 'call', 'option_style': 'european'}
+        for name in underlyings for i in range(per_underlying)
+    ]
+
+def test_pipeline_emits_quotes_for_latest_ticks():
+    trades = make_book()
+    pipeline = QuotePipeline(debounce=0.002)
+    pipeline.add_positions(trades)
+    simulator = TickSimulator({name: 100.0 for name in ('AAA', 'BBB', 'CCC', 'DDD')}, n_ticks=200, seed=7)
+
+    ticks = []
+    async def record():
+        async for tick in simulator:
+            ticks.append(tick)
+            yield tick
+
+    updates = asyncio.run(pipeline.run(record()))
+    assert len(ticks) == 200 and pipeline.stats['ticks'] == 200
+    assert 0 < len(updates) <= 200
+
+    last = {tick['underlying']: tick['spot'] for tick in ticks}
+    expected = np.array([
+        BlackScholesModel().calculate(last[t['underlying']], t['K'], t['T'], t['r'], t['sigma'], 'call')['price'][0]
+        for t in trades
+    ])
+    assert np.allclose(pipeline.graph.quotes, expected)
+
+    update = updates[-1]
+    assert set(update['underlyings']) == {trades[i]['underlying'] for i in update['positions']}
+    assert np.allclose(update['price'], expected[update['positions']])
+    assert update['delta'].shape == update['positions'].shape
+    assert update['latency']['tick_to_quote'] >= update['latency']['pricing'] > 0
+
+    percentiles = pipeline.latency_percentiles()
+    assert percentiles['tick_to_quote']['p50'] <= percentiles['tick_to_quote']['p99']
+
+def test_debounce_coalesces_ticks_per_underlying():
+    async def burst():
+        for spot in (101.0, 102.0, 103.0):
+            yield {'underlying': 'AAA', 'spot': spot}
+        yield {'underlying': 'BBB', 'spot': 99.0}
+
+    pipeline = QuotePipeline(debounce=1.0, greeks=False)
+    pipeline.add_positions(make_book(('AAA', 'BBB'), 2))
+    updates = asyncio.run(pipeline.run(burst()))
+
+    assert len(updates) == 1
+    assert updates[0]['underlyings'] == ['AAA', 'BBB'] and len(updates[0]['positions']) == 4
+    assert pipeline.graph.market('spot') == {'AAA': 103.0, 'BBB': 99.0}
@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+from pricing_library.models.surrogate import ChebyshevSurrogate
+from pricing_library.models.black_scholes import BlackScholesModel
+
+def make_surrogate(**kwargs):
+    return ChebyshevSurrogate(
+        BlackScholesModel(), box={'S': (70, 130), 'sigma': (0.1, 0.5), 'T': (0.25, 2.0)},
+        fixed={'K': 100, 'r': 0.03}, degree={'S': 20, 'sigma': 10, 'T': 10}, **kwargs
+    )
+
+def test_prices_and_greeks_match_black_scholes():
+    surrogate = make_surrogate()
+    assert surrogate.validate(200, seed=0)['max_error'] < 1e-3
+
+    S = np.array([80.0, 100.0, 120.0])
+    greeks = surrogate.calculate_greeks(S, 100, 1.0, 0.03, 0.25)
+    exact = BlackScholesModel().calculate_greeks(S, 100, 1.0, 0.03, 0.25)
+    assert np.allclose(greeks['price'], exact['price'], atol=1e-3)
+    assert np.allclose(greeks['delta'], exact['delta'], atol=1e-4)
+    assert np.allclose(greeks['gamma'], exact['gamma'], atol=1e-4)
+    assert np.allclose(greeks['vega'], 100 * exact['vega'], atol=1e-2)
+    assert np.all(np.isnan(greeks['rho']))
+
+def test_serialized_table_prices_without_model():
+    surrogate = make_surrogate()
+    restored = ChebyshevSurrogate.from_json(surrogate.to_json())
+    S = np.linspace(75, 125, 11)
+    assert np.allclose(restored.calculate(S, 100, 1.0, 0.03, 0.2)['price'], surrogate.calculate(S, 100, 1.0, 0.03, 0.2)['price'])
+    with pytest.raises(ValueError):
+        restored.calculate(100, 100, 1.0, 0.05, 0.2)
+
+def test_rebuilds_when_market_leaves_box():
+    surrogate = make_surrogate()
+    surrogate.calculate(100, 100, 1.0, 0.03, 0.2)
+    price = surrogate.calculate(160, 100, 1.0, 0.04, 0.2)['price']
+    assert surrogate.n_builds == 2
+    assert surrogate.box['S'][1] > 160 and surrogate.fixed['r'] == 0.04
+    assert price == pytest.approx(BlackScholesModel().calculate(160, 100, 1.0, 0.04, 0.2)['price'], abs=1e-3)
+
+    frozen = make_surrogate(auto_rebuild=False)
+    frozen.calculate(100, 100, 1.0, 0.03, 0.2)
+    with pytest.raises(ValueError):
+        frozen.calculate(160, 100, 1.0, 0.03, 0.2)